@@ -6,8 +6,110 @@ import path from 'path'
 
 const execAsync = promisify(exec)
 
+// Exit code of an extractor run turned away by admission control (EX_TEMPFAIL)
+const EXIT_BUSY = 75
+
+interface AdmissionBusy {
+  status: 'busy'
+  reason: string
+  retry_after_s: number
+  queue_depth: number
+  running: number
+}
+
+// Written by the extractor with --result-json. partial is true when the
+// --deadline ran out before the whole page was read; the records found by
+// then are still in the CSV.
+interface ExtractionResult {
+  partial: boolean
+  records: number
+  skipped_stages: string[]
+  unprocessed_regions: Array<{ unit: string; start?: number; end?: number; reason: string }>
+}
+
+// Hard kill for the extractor, and the budget it is asked to finish within.
+// The difference covers interpreter start-up and writing the output. A page
+// is still read in one full pass; it is only banded when that pass runs slow.
+const EXTRACTION_TIMEOUT_MS = 60000
+const EXTRACTION_DEADLINE_S = 50
+
+function readExtractionResult(resultPath: string): ExtractionResult | null {
+  try {
+    if (!fs.existsSync(resultPath)) return null
+    return JSON.parse(fs.readFileSync(resultPath, 'utf-8'))
+  } catch (resultError) {
+    console.error('Failed to read extraction result:', resultError)
+    return null
+  }
+}
+
+// A rejected run prints its AdmissionBusy JSON as the last line of stdout
+function parseAdmissionBusy(error: any): AdmissionBusy | null {
+  if (error?.code !== EXIT_BUSY || typeof error.stdout !== 'string') return null
+  try {
+    const lastLine = error.stdout.trim().split('\n').pop() || ''
+    const busy = JSON.parse(lastLine)
+    return busy.status === 'busy' ? busy : null
+  } catch {
+    return null
+  }
+}
+
+interface StageTiming {
+  stage: string
+  wall_s: number
+  cpu_s: number
+  child_cpu_s: number
+  peak_rss_mb: number | null
+  child_peak_rss_mb: number | null
+}
+
+interface ExtractionProfile {
+  label: string
+  running: string | null
+  stages: StageTiming[]
+  total: { wall_s: number; peak_rss_mb: number | null; child_peak_rss_mb: number | null }
+}
+
+// Log the per-stage timings the extractor writes with --profile. The file is
+// rewritten after every stage, so after a timeout `running` names the stage
+// that was still in progress.
+function logExtractionProfile(profilePath: string, outcome: string) {
+  try {
+    if (!fs.existsSync(profilePath)) return
+    const profile: ExtractionProfile = JSON.parse(fs.readFileSync(profilePath, 'utf-8'))
+    console.info('Image extraction timings:', JSON.stringify({
+      outcome,
+      image: profile.label,
+      running: profile.running,
+      total: profile.total,
+      stages: profile.stages.map(({ stage, wall_s, cpu_s, child_cpu_s, peak_rss_mb, child_peak_rss_mb }) => ({
+        stage, wall_s, cpu_s, child_cpu_s, peak_rss_mb, child_peak_rss_mb
+      }))
+    }))
+  } catch (profileError) {
+    console.error('Failed to read extraction profile:', profileError)
+  }
+}
+
+// Queue depth, running jobs and recent wait times of the OCR admission controller
+export async function GET() {
+  try {
+    const { stdout } = await execAsync('python3 -m alumni_extraction.admission', {
+      cwd: path.join(process.cwd(), 'scripts'),
+      timeout: 10000
+    })
+    return NextResponse.json(JSON.parse(stdout))
+  } catch (error) {
+    console.error('Failed to read extraction queue status:', error)
+    return NextResponse.json({ error: 'Failed to read extraction queue status' }, { status: 500 })
+  }
+}
+
 export async function POST(request: NextRequest) {
   let tempFilePath: string | null = null
+  let profilePath: string | null = null
+  let resultPath: string | null = null
   
   try {
     const formData = await request.formData()
@@ -34,13 +136,18 @@ export async function POST(request: NextRequest) {
     // Run the Python extraction script
     const scriptPath = path.join(process.cwd(), 'scripts', 'bengali-image-extractor.py')
     const outputPath = path.join(tempDir, `output-${Date.now()}.csv`)
+    profilePath = path.join(tempDir, `profile-${Date.now()}.json`)
+    resultPath = path.join(tempDir, `result-${Date.now()}.json`)
     
     try {
       // Execute the Python script
       const { stdout, stderr } = await execAsync(
-        `python3 "${scriptPath}" "${tempFilePath}" -o "${outputPath}" --debug`,
-        { timeout: 60000 } // 60 second timeout
+        `python3 "${scriptPath}" "${tempFilePath}" -o "${outputPath}" --debug --profile "${profilePath}" --admission ` +
+          `--deadline ${EXTRACTION_DEADLINE_S} --result-json "${resultPath}"`,
+        { timeout: EXTRACTION_TIMEOUT_MS }
       )
+      const result = readExtractionResult(resultPath)
+      logExtractionProfile(profilePath, result?.partial ? 'partial' : 'success')
 
       if (stderr && !stderr.includes('Warning')) {
         console.error('Python script stderr:', stderr)
@@ -73,51 +180,64 @@ export async function POST(request: NextRequest) {
       // Extract text from stdout for debugging
       const extractedText = stdout || 'No text extracted'
 
+      const partial = result?.partial ?? false
       return NextResponse.json({
         success: true,
         extractedText: extractedText,
         alumniRecords: alumniRecords,
         csvData: csvData,
-        message: `Successfully extracted ${alumniRecords.length} alumni records`
+        partial,
+        unprocessedRegions: result?.unprocessed_regions ?? [],
+        skippedStages: result?.skipped_stages ?? [],
+        message: partial
+          ? `Extracted ${alumniRecords.length} alumni records before the time limit; ` +
+            `${result!.unprocessed_regions.length} part(s) of the page were not read. Check the page manually or upload it again.`
+          : `Successfully extracted ${alumniRecords.length} alumni records`
       })
 
     } catch (pythonError) {
+      // Too many extractions already running or queued: ask the client to come back later
+      const busy = parseAdmissionBusy(pythonError)
+      if (busy) {
+        console.warn('Image extraction rejected by admission control:', JSON.stringify(busy))
+        return NextResponse.json({
+          success: false,
+          error: 'The extraction service is busy. Please try again shortly.',
+          retryAfterSeconds: busy.retry_after_s,
+          queueDepth: busy.queue_depth
+        }, { status: 429, headers: { 'Retry-After': String(busy.retry_after_s) } })
+      }
+
       console.error('Python script error:', pythonError)
-      
-      // Fallback: Try to extract text using basic OCR if available
-      try {
-        const { stdout } = await execAsync(`python3 -c "
-import cv2
-import pytesseract
-import sys
-
-try:
-    image = cv2.imread('${tempFilePath}')
-    if image is not None:
-        text = pytesseract.image_to_string(image, config='--oem 3 --psm 6 -l ben')
-        print(text.strip())
-    else:
-        print('Could not load image')
-except Exception as e:
-    print(f'Error: {e}')
-"`, { timeout: 30000 })
+      logExtractionProfile(profilePath, 'failed')
 
+      // Killed at the hard timeout: reading the page again in the fallback would only time out too
+      if ((pythonError as any)?.killed) {
+        return NextResponse.json({
+          success: false,
+          error: 'Extraction timed out. Please try a smaller or clearer image.'
+        }, { status: 504 })
+      }
+      
+      // The extractor prints the OCR text with --debug before parsing, so a run that read
+      // the page but found no records still has text to show. Running OCR a second time
+      // (which used to force `-l ben`, failing on hosts without Bengali data) is not needed.
+      const failedOutput: string = (pythonError as any)?.stdout || ''
+      const extractedText = failedOutput.match(/Extracted text:\n([\s\S]*?)\n\n={50}/)?.[1]?.trim()
+      if (extractedText) {
         return NextResponse.json({
           success: true,
-          extractedText: stdout || 'No text extracted',
+          extractedText,
           alumniRecords: [],
           csvData: '',
           message: 'Text extracted but parsing failed. Please check the extracted text manually.'
         })
-
-      } catch (fallbackError) {
-        console.error('Fallback extraction error:', fallbackError)
-        
-        return NextResponse.json({
-          success: false,
-          error: 'Failed to extract text from image. Please ensure the image is clear and contains Bengali text.'
-        }, { status: 500 })
       }
+
+      return NextResponse.json({
+        success: false,
+        error: 'Failed to extract text from image. Please ensure the image is clear and contains Bengali text.'
+      }, { status: 500 })
     }
 
   } catch (error) {
@@ -128,11 +248,13 @@ except Exception as e:
     )
   } finally {
     // Cleanup temporary files
-    if (tempFilePath && fs.existsSync(tempFilePath)) {
-      try {
-        fs.unlinkSync(tempFilePath)
-      } catch (cleanupError) {
-        console.error('Failed to cleanup temp file:', cleanupError)
+    for (const filePath of [tempFilePath, profilePath, resultPath]) {
+      if (filePath && fs.existsSync(filePath)) {
+        try {
+          fs.unlinkSync(filePath)
+        } catch (cleanupError) {
+          console.error('Failed to cleanup temp file:', cleanupError)
+        }
       }
     }
   }
@@ -3,8 +3,14 @@
 Fix Bengali extraction issues - correct middle names and surname transliterations
 """
 
+import sys
+from pathlib import Path
+
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+from alumni_extraction.names import split_name
+
 def create_corrected_alumni_csv():
     """Create corrected CSV with proper middle names and surname transliterations"""
     
@@ -76,14 +82,14 @@ def create_corrected_alumni_csv():
     csv_records = []
     
     for entry in alumni_data:
-        # Parse name into parts
-        name_parts = entry["name"].split()
-        first_name = name_parts[0] if len(name_parts) > 0 else ""
-        last_name = name_parts[-1] if len(name_parts) > 1 else ""
-        middle_name = " ".join(name_parts[1:-1]) if len(name_parts) > 2 else ""
+        # Parse name into parts, keeping compound surnames together
+        name_parts = split_name(entry["name"])
+        first_name = name_parts["first_name"]
+        middle_name = name_parts["middle_name"]
+        last_name = name_parts["last_name"]
         
         # Generate email with corrected surnames
-        email = f"{first_name.lower()}.{last_name.lower()}@bghs-alumni.com" if first_name and last_name else "alumni.member@bghs-alumni.com"
+        email = f"{first_name.lower()}.{last_name.lower().replace(' ', '')}@bghs-alumni.com" if first_name and last_name else "alumni.member@bghs-alumni.com"
         
         # Create record
         record = {
@@ -3,8 +3,15 @@
 Fix company field logic - should be empty or more appropriate default values
 """
 
+import sys
+from pathlib import Path
+
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+from alumni_extraction.names import split_name
+from alumni_extraction.registration import registration_numbers_in_order
+
 def create_corrected_alumni_csv_with_proper_company_field():
     """Create corrected CSV with proper company field logic"""
     
@@ -72,20 +79,8 @@ def create_corrected_alumni_csv_with_proper_company_field():
         {"old_reg_no": "56", "title": "", "name": "Tamal Kumar Chakraborty", "year": "1976", "deceased": False},
     ]
     
-    def convert_registration_number(old_reg_no):
-        """Convert old registration number to new format BGHSA-2025-XXXXX"""
-        try:
-            # Handle special case like "28 ka"
-            if " ka" in old_reg_no:
-                old_reg_no = old_reg_no.replace(" ka", "")
-            
-            # Convert to integer and format with leading zeros (5 digits)
-            reg_num = int(old_reg_no)
-            new_reg_no = f"BGHSA-2025-{reg_num:05d}"
-            return new_reg_no
-        except:
-            # Fallback for any parsing issues
-            return f"BGHSA-2025-{old_reg_no.zfill(5)}"
+    # Number entries in register order so "28 ka" gets its own id after 28
+    registration_numbers = registration_numbers_in_order(entry["old_reg_no"] for entry in alumni_data)
     
     def get_company_field(title, deceased, year_of_leaving):
         """Determine appropriate company field based on title and status"""
@@ -106,17 +101,17 @@ def create_corrected_alumni_csv_with_proper_company_field():
     csv_records = []
     
     for entry in alumni_data:
-        # Parse name into parts
-        name_parts = entry["name"].split()
-        first_name = name_parts[0] if len(name_parts) > 0 else ""
-        last_name = name_parts[-1] if len(name_parts) > 1 else ""
-        middle_name = " ".join(name_parts[1:-1]) if len(name_parts) > 2 else ""
+        # Parse name into parts, keeping compound surnames together
+        name_parts = split_name(entry["name"])
+        first_name = name_parts["first_name"]
+        middle_name = name_parts["middle_name"]
+        last_name = name_parts["last_name"]
         
         # Generate email with corrected surnames
-        email = f"{first_name.lower()}.{last_name.lower()}@bghs-alumni.com" if first_name and last_name else "alumni.member@bghs-alumni.com"
+        email = f"{first_name.lower()}.{last_name.lower().replace(' ', '')}@bghs-alumni.com" if first_name and last_name else "alumni.member@bghs-alumni.com"
         
         # Convert registration number
-        new_reg_no = convert_registration_number(entry["old_reg_no"])
+        new_reg_no = registration_numbers[entry["old_reg_no"]]
         
         # Determine company field
         company = get_company_field(entry["title"], entry["deceased"], entry["year"])
@@ -0,0 +1,69 @@
+"""
+Shared code for the BGHS alumni register extractors.
+
+The command-line tools live in submodules and can be run with
+``python -m alumni_extraction.<tool>`` from the scripts directory; the
+hyphenated scripts next to this package are thin wrappers around them:
+
+  extract            extract-bengali-alumni-generic.py
+  batch              batch-extract-alumni.py
+  image_extractor    bengali-image-extractor.py (used by the admin upload route)
+
+``python -m alumni_extraction.admission`` prints the OCR admission queue
+(see admission.py); ``python -m alumni_extraction.capabilities`` checks
+the Tesseract install (see capabilities.py), ``python -m
+alumni_extraction.dedupe`` lists likely duplicate entries (see dedupe.py)
+, ``python -m alumni_extraction.merge`` merges a new extraction into the
+range-CSV corpus (see merge.py), ``python -m
+alumni_extraction.upload_delta`` exports only the rows that changed since
+the last upload (see upload_delta.py), ``python -m
+alumni_extraction.uploader`` posts CSVs to the migration endpoint in
+concurrent chunks (see uploader.py), ``python -m
+alumni_extraction.copy_export`` writes PostgreSQL COPY files for a bulk
+load (see copy_export.py), ``python -m alumni_extraction.validate``
+checks CSVs against the migration rules (see validate.py) and ``python
+-m alumni_extraction.corpus`` loads CSVs of every layout into one
+canonical table (see corpus.py), which the other tools read through;
+``python -m alumni_extraction.transform`` applies the corpus rule file
+to it (see transform.py), and ``python -m alumni_extraction.emails``
+gives every row an address no other alumnus has (see emails.py).
+
+Heavy dependencies (cv2, pytesseract, pandas) are only imported inside
+the functions that need them, and the names below are resolved lazily,
+so ``import alumni_extraction`` and ``--help`` stay fast.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'AlumniRecord': '.records',
+    'CorpusTable': '.corpus',
+    'EmailIndex': '.emails',
+    'load_corpus': '.corpus',
+    'read_rows': '.corpus',
+    'RecordBatch': '.records',
+    'LineSegment': '.line_split',
+    'split_side_by_side_records': '.line_split',
+    'SurnameTrie': '.names',
+    'split_name': '.names',
+    'OldRegistrationNumber': '.registration',
+    'RegistrationAllocator': '.registration',
+    'SequenceStore': '.registration',
+    'format_registration_number': '.registration',
+    'registration_numbers_in_order': '.registration',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
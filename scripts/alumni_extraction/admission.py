@@ -0,0 +1,426 @@
+"""
+Admission control for OCR jobs.
+
+Every extraction runs in its own Python process (the admin route spawns
+one per upload), and Tesseract's OpenMP pool uses every core by default,
+so a few concurrent uploads thrash the machine and all of them miss the
+route's timeout. ``AdmissionController`` coordinates those processes
+through lock files in a shared directory:
+
+  slot-N.lock    a job holds one of ``slots`` CPU slots while it runs OCR
+  queue-N.lock   an interactive job waiting for a slot holds one of
+                 ``queue_limit`` queue tickets
+  interactive-N.lock
+                 held by every interactive job, waiting or running
+  stats.json     per-class admitted/rejected counts, recent waits and
+                 latencies, mean job time
+
+Jobs come in two classes. Interactive jobs (single uploads) take a free
+slot at once or queue for one; one that finds no free queue ticket is
+rejected at once, and one that waits longer than ``max_wait`` seconds is
+rejected too. Batch jobs (re-extraction of the register) take a slot
+per page, only while no interactive job is queued, and are never
+rejected; so a batch run yields to an upload at the next page boundary,
+and pages started while an upload is waiting or running use
+``batch_threads`` instead of ``threads``. The locks are
+flock()ed, so the kernel releases them when a process exits or is
+killed. A holder writes its pid into the lock file and clears it on
+release; queue depth, running jobs and the batch checks are read from
+those pids (a dead pid counts as free) rather than by probing the locks,
+so looking at the queue never makes a slot seem taken to a job trying to
+acquire it. An admitted job caps Tesseract and OpenCV at ``threads`` threads
+(OMP_THREAD_LIMIT), so ``slots * threads`` should not exceed the cores.
+
+A rejected CLI run prints one JSON line and exits with EXIT_BUSY (75,
+EX_TEMPFAIL):
+
+  {"status": "busy", "reason": "queue full", "retry_after_s": 12, "queue_depth": 4, "running": 2}
+
+The admin route turns that into a 429 with a Retry-After header.
+``python -m alumni_extraction.admission`` prints the current queue depth,
+running jobs and wait statistics as JSON.
+"""
+
+import math
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .profiling import Profiler, stage
+
+EXIT_BUSY = 75
+DEFAULT_MAX_WAIT = 20.0
+DEFAULT_JOB_SECONDS = 10.0
+POLL_INTERVAL = 0.05
+HISTORY = 200
+PRIORITIES = ('interactive', 'batch')
+THREAD_VARIABLES = ('OMP_THREAD_LIMIT', 'OMP_NUM_THREADS')
+PID_WIDTH = 12
+
+
+def default_state_dir() -> str:
+    """BGHS_OCR_STATE_DIR, or a directory under the system temp dir"""
+    if os.environ.get('BGHS_OCR_STATE_DIR'):
+        return os.environ['BGHS_OCR_STATE_DIR']
+    import tempfile  # not at module level: it costs more than the rest of the CLI imports
+    return os.path.join(tempfile.gettempdir(), 'bghs-ocr-admission')
+
+
+class AdmissionRejected(Exception):
+    """No CPU slot could be had; ``retry_after_s`` is a hint for the caller"""
+
+    def __init__(self, reason: str, retry_after_s: int, queue_depth: int, running: int):
+        super().__init__(f"{reason}, retry in {retry_after_s}s")
+        self.reason = reason
+        self.retry_after_s = retry_after_s
+        self.queue_depth = queue_depth
+        self.running = running
+
+    def to_dict(self) -> Dict:
+        return {
+            'status': 'busy',
+            'reason': self.reason,
+            'retry_after_s': self.retry_after_s,
+            'queue_depth': self.queue_depth,
+            'running': self.running,
+        }
+
+
+def _try_lock(path: str) -> Optional[int]:
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    # One fixed-width write, so a reader never sees half a pid
+    os.pwrite(fd, f"{os.getpid():<{PID_WIDTH}}".encode(), 0)
+    return fd
+
+
+def _unlock(fd: int):
+    os.ftruncate(fd, 0)
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+def _holder_alive(path: str) -> bool:
+    """Whether the pid recorded in a lock file belongs to a running process"""
+    try:
+        with open(path, 'rb') as f:
+            pid = int(f.read(PID_WIDTH) or 0)
+    except (OSError, ValueError):
+        return False
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def _summary(values: List[float]) -> Dict:
+    ordered = sorted(values)
+    return {'p50': _percentile(ordered, 0.5), 'p95': _percentile(ordered, 0.95), 'max': max(ordered, default=0.0)}
+
+
+def apply_thread_cap(threads: int) -> Dict[str, Optional[str]]:
+    """Cap OpenMP (Tesseract) and OpenCV threads; returns the previous environment values"""
+    previous = {name: os.environ.get(name) for name in THREAD_VARIABLES}
+    for name in THREAD_VARIABLES:
+        os.environ[name] = str(threads)
+    if 'cv2' in sys.modules:
+        sys.modules['cv2'].setNumThreads(threads)
+    return previous
+
+
+def restore_thread_cap(previous: Dict[str, Optional[str]]):
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+class Slot:
+    """A held CPU slot; ``release()`` frees it and records the job's wait and run time"""
+
+    def __init__(self, controller: 'AdmissionController', fds: List[int], priority: str,
+                 threads: int, waited_s: float):
+        self.controller = controller
+        self.priority = priority
+        self.threads = threads
+        self.waited_s = waited_s
+        self._fds = fds
+        self._started = time.monotonic()
+        self._previous_env = apply_thread_cap(threads)
+
+    def release(self):
+        if not self._fds:
+            return
+        restore_thread_cap(self._previous_env)
+        for fd in self._fds:
+            _unlock(fd)
+        self._fds = []
+        self.controller.record_job(self.priority, self.waited_s, time.monotonic() - self._started)
+
+
+class AdmissionController:
+    """CPU slots and a bounded wait queue shared by all extraction processes"""
+
+    def __init__(self, state_dir: Optional[str] = None, slots: Optional[int] = None,
+                 threads: Optional[int] = None, queue_limit: Optional[int] = None,
+                 max_wait: float = DEFAULT_MAX_WAIT, batch_threads: Optional[int] = None):
+        if fcntl is None:
+            raise RuntimeError("Admission control needs fcntl (not available on this platform)")
+        cores = os.cpu_count() or 1
+        self.state_dir = state_dir or default_state_dir()
+        self.slots = slots or max(1, cores // 2)
+        self.threads = threads or max(1, cores // self.slots)
+        self.batch_threads = batch_threads or max(1, self.threads // 2)
+        self.queue_limit = queue_limit if queue_limit is not None else 2 * self.slots
+        self.max_wait = max_wait
+        os.makedirs(self.state_dir, exist_ok=True)
+
+    def _paths(self, kind: str) -> List[str]:
+        count = {
+            'slot': self.slots,
+            'queue': self.queue_limit,
+            # One per interactive job, waiting or running
+            'interactive': self.slots + self.queue_limit,
+        }[kind]
+        return [os.path.join(self.state_dir, f"{kind}-{i}.lock") for i in range(count)]
+
+    def _take(self, kind: str) -> Optional[int]:
+        for path in self._paths(kind):
+            fd = _try_lock(path)
+            if fd is not None:
+                return fd
+        return None
+
+    def _held(self, kind: str) -> int:
+        # Read the recorded holders: probing with flock would make the files look taken to acquirers
+        return sum(1 for path in self._paths(kind) if _holder_alive(path))
+
+    def acquire(self, max_wait: Optional[float] = None, priority: str = 'interactive') -> Slot:
+        """
+        Take a CPU slot for an interactive or a batch job.
+
+        Interactive jobs take a free slot at once or wait in the bounded
+        queue; AdmissionRejected is raised when the queue is full or the
+        wait exceeds ``max_wait`` (default: the controller's limit).
+        Batch jobs are never rejected, but only take a slot while no
+        interactive job is queued, and run with ``batch_threads`` while
+        one is waiting or running.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+        if priority == 'batch':
+            return self._acquire_batch()
+        if max_wait is None:
+            max_wait = self.max_wait
+        start = time.monotonic()
+        marker = self._take('interactive')
+        if marker is None:
+            self._reject('queue full')
+        try:
+            fd = self._take('slot')
+            if fd is None:
+                ticket = self._take('queue')
+                if ticket is None:
+                    self._reject('queue full')
+                try:
+                    while fd is None:
+                        if time.monotonic() - start >= max_wait:
+                            self._reject('wait timeout')
+                        time.sleep(POLL_INTERVAL)
+                        fd = self._take('slot')
+                finally:
+                    _unlock(ticket)
+        except AdmissionRejected:
+            _unlock(marker)
+            raise
+        waited = time.monotonic() - start
+        self._update_stats(lambda stats: self._admitted(stats, 'interactive'))
+        return Slot(self, [fd, marker], 'interactive', self.threads, waited)
+
+    def _acquire_batch(self) -> Slot:
+        start = time.monotonic()
+        fd = None
+        while fd is None:
+            # Queued interactive jobs go first
+            if not self._held('queue'):
+                fd = self._take('slot')
+            if fd is None:
+                time.sleep(POLL_INTERVAL)
+        threads = self.batch_threads if self._held('interactive') else self.threads
+        self._update_stats(lambda stats: self._admitted(stats, 'batch'))
+        return Slot(self, [fd], 'batch', threads, time.monotonic() - start)
+
+    @staticmethod
+    def _class_stats(stats: Dict, priority: str) -> Dict:
+        return stats.setdefault(priority, {'admitted': 0, 'rejected': 0, 'waits_s': [], 'latencies_s': []})
+
+    @classmethod
+    def _admitted(cls, stats: Dict, priority: str):
+        cls._class_stats(stats, priority)['admitted'] += 1
+
+    @classmethod
+    def _rejected(cls, stats: Dict):
+        cls._class_stats(stats, 'interactive')['rejected'] += 1
+
+    def _reject(self, reason: str):
+        stats = self._update_stats(self._rejected)
+        queue_depth = self._held('queue')
+        raise AdmissionRejected(reason, self.retry_after(stats, queue_depth), queue_depth, self._held('slot'))
+
+    def record_job(self, priority: str, waited: float, seconds: float):
+        def update(stats):
+            class_stats = self._class_stats(stats, priority)
+            class_stats['waits_s'] = (class_stats['waits_s'] + [round(waited, 3)])[-HISTORY:]
+            class_stats['latencies_s'] = (class_stats['latencies_s'] + [round(waited + seconds, 3)])[-HISTORY:]
+            # Exponential moving average of how long a job holds its slot
+            previous = class_stats.get('job_s')
+            class_stats['job_s'] = round(seconds if previous is None else 0.8 * previous + 0.2 * seconds, 3)
+        self._update_stats(update)
+
+    def retry_after(self, stats: Dict, queue_depth: int) -> int:
+        """Seconds until the interactive jobs ahead of a new one should have drained"""
+        job_s = stats.get('interactive', {}).get('job_s') or DEFAULT_JOB_SECONDS
+        return max(1, math.ceil(job_s * (queue_depth + 1) / self.slots))
+
+    def _update_stats(self, update: Callable[[Dict], None]) -> Dict:
+        import json
+        path = os.path.join(self.state_dir, 'stats.json')
+        fd = os.open(os.path.join(self.state_dir, 'stats.lock'), os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    stats = json.load(f)
+            except (OSError, ValueError):
+                stats = {}
+            update(stats)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(stats, f)
+            os.replace(tmp_path, path)
+        finally:
+            _unlock(fd)
+        return stats
+
+    def status(self) -> Dict:
+        """Current load, and recent waits and latencies per priority class"""
+        stats = self._update_stats(lambda stats: None)
+        queue_depth = self._held('queue')
+        classes = {}
+        for priority in PRIORITIES:
+            class_stats = self._class_stats(stats, priority)
+            classes[priority] = {
+                'admitted': class_stats['admitted'],
+                'rejected': class_stats['rejected'],
+                'wait_s': _summary(class_stats['waits_s']),
+                'latency_s': _summary(class_stats['latencies_s']),
+                'job_s': class_stats.get('job_s'),
+            }
+        return {
+            'slots': self.slots,
+            'threads_per_job': self.threads,
+            'batch_threads': self.batch_threads,
+            'queue_limit': self.queue_limit,
+            'running': self._held('slot'),
+            'queue_depth': queue_depth,
+            'interactive_jobs': self._held('interactive'),
+            'retry_after_s': self.retry_after(stats, queue_depth),
+            'classes': classes,
+        }
+
+
+def _env_number(name: str, kind=int):
+    value = os.environ.get(name)
+    return kind(value) if value else None
+
+
+def add_admission_arguments(parser):
+    """Add --admission and its limits to a CLI parser"""
+    group = parser.add_argument_group('admission control (also enabled by BGHS_OCR_ADMISSION=1)')
+    group.add_argument('--admission', action='store_true',
+                       help='Wait for a shared CPU slot before running OCR; exit 75 with a retry hint when saturated')
+    group.add_argument('--slots', type=int, default=_env_number('BGHS_OCR_SLOTS'),
+                       help='Concurrent OCR jobs allowed on this machine (default: half the cores)')
+    group.add_argument('--threads', type=int, default=_env_number('BGHS_OCR_THREADS'),
+                       help='Tesseract/OpenCV threads per job (default: cores / slots)')
+    group.add_argument('--queue-limit', type=int, default=_env_number('BGHS_OCR_QUEUE'),
+                       help='Jobs allowed to wait for a slot before new ones are rejected (default: 2 x slots)')
+    group.add_argument('--batch-threads', type=int, default=_env_number('BGHS_OCR_BATCH_THREADS'),
+                       help='Threads per batch page while interactive jobs are active (default: half of --threads)')
+    group.add_argument('--max-wait', type=float, default=_env_number('BGHS_OCR_MAX_WAIT', float) or DEFAULT_MAX_WAIT,
+                       help=f'Seconds to wait for a slot before giving up (default: {DEFAULT_MAX_WAIT:g})')
+
+
+def admission_from_args(args) -> Optional[AdmissionController]:
+    """The AdmissionController the CLI options ask for, or None"""
+    if not (args.admission or os.environ.get('BGHS_OCR_ADMISSION') == '1'):
+        return None
+    if fcntl is None:
+        print("⚠️ Admission control is not supported on this platform; running without it")
+        return None
+    return AdmissionController(slots=args.slots, threads=args.threads,
+                               queue_limit=args.queue_limit, max_wait=args.max_wait,
+                               batch_threads=args.batch_threads)
+
+
+def admit(controller: Optional[AdmissionController], profiler: Optional[Profiler] = None,
+          priority: str = 'interactive') -> Optional[Slot]:
+    """
+    Take a slot for a CLI run, or exit with EXIT_BUSY and the rejection as JSON.
+
+    Returns None when admission control is off.
+    """
+    if controller is None:
+        return None
+    try:
+        with stage(profiler, 'admission'):
+            slot = controller.acquire(priority=priority)
+    except AdmissionRejected as e:
+        import json
+        print(json.dumps(e.to_dict()))
+        sys.exit(EXIT_BUSY)
+    if slot.waited_s >= 1:
+        print(f"⏳ Waited {slot.waited_s:.1f}s for a CPU slot")
+    return slot
+
+
+def release(slot: Optional[Slot]):
+    if slot is not None:
+        slot.release()
+
+
+def main():
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(description='Show the OCR admission queue as JSON')
+    add_admission_arguments(parser)
+    args = parser.parse_args()
+    args.admission = True
+    controller = admission_from_args(args)
+    if controller is None:
+        sys.exit(1)
+    print(json.dumps(controller.status(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
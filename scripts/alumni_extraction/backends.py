@@ -0,0 +1,374 @@
+"""
+Pluggable OCR backends.
+
+The extractors talk to OCR through an ``OcrBackend``. Each backend loads
+an image, optionally preprocesses it, and returns plain text or word boxes:
+
+  tesseract  cv2 + pytesseract (the default)
+  replay     returns recorded text and word boxes for known images, so the
+             pipeline can be tested and benchmarked without Tesseract
+  record     runs Tesseract and saves what it returns as replay recordings
+
+A recording is a JSON file in the recordings directory:
+
+  {
+    "image": "57-86.png",
+    "sha256": "<hash of the image file>",
+    "source": "how the recording was made",
+    "synthetic": true,
+    "outputs": {
+      "ben": {"6": {"text": "...", "words": [["57.", 40, 112, 38, 24, 91.0], ...]}}
+    }
+  }
+
+Images are matched by content hash first, then by file name. Words are
+``[text, left, top, width, height, confidence]``. ``synthetic`` marks a
+recording rendered from known text rather than captured from Tesseract.
+
+Pick the backend with ``--replay DIR`` / ``--record DIR`` on the CLIs or
+with the BGHS_OCR_BACKEND and BGHS_OCR_RECORDINGS environment variables.
+hashlib and json are imported on use to keep CLI start-up within the
+import-time budget (benchmarks/bench_import_time.py).
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+BACKEND_ENV = 'BGHS_OCR_BACKEND'
+RECORDINGS_ENV = 'BGHS_OCR_RECORDINGS'
+DEFAULT_PSM = 6
+# A band shorter than this (in pixels) would cut through text lines
+MIN_BAND_HEIGHT = 200
+
+
+class OcrBackendError(Exception):
+    """Raised when a backend cannot produce output for an image"""
+
+
+class OcrTimeout(OcrBackendError):
+    """Raised when OCR did not finish within its timeout"""
+
+
+class WordBox(NamedTuple):
+    """One recognised word and its bounding box in image pixels"""
+    text: str
+    left: int
+    top: int
+    width: int
+    height: int
+    conf: float
+
+
+class OcrBackend:
+    """Interface shared by the OCR backends"""
+
+    name = 'base'
+
+    def load_image(self, image_path: str):
+        """Load an image; the returned object is only passed back to this backend"""
+        raise NotImplementedError
+
+    def languages(self) -> Optional[List[str]]:
+        """OCR languages this backend has, or None when it cannot tell"""
+        return None
+
+    def describe(self) -> str:
+        """One line for --debug output"""
+        return f"🔎 OCR backend: {self.name}"
+
+    def preprocess(self, image, denoise: bool = True):
+        """Grayscale/threshold/denoise before OCR; backends may skip this"""
+        return image
+
+    def split_bands(self, image, count: int) -> List[Tuple[Dict, object]]:
+        """
+        Split a page into horizontal bands that can be read separately.
+
+        Returns ``(region, image)`` pairs in reading order; ``region``
+        describes the band for reports. Backends that cannot crop return
+        the whole page as one band.
+        """
+        return [({'band': 1, 'bands': 1, 'unit': 'page'}, image)]
+
+    def image_to_string(self, image, lang: str = 'ben', psm: int = DEFAULT_PSM,
+                        timeout: Optional[float] = None) -> str:
+        """OCR text of an image; raises OcrTimeout when ``timeout`` seconds run out"""
+        raise NotImplementedError
+
+    def image_to_words(self, image, lang: str = 'ben', psm: int = DEFAULT_PSM) -> List[WordBox]:
+        raise NotImplementedError
+
+
+class TesseractBackend(OcrBackend):
+    """OCR with OpenCV for image handling and Tesseract for recognition"""
+
+    name = 'tesseract'
+
+    def __init__(self):
+        # Imported here so that only real OCR runs pay for them
+        import cv2
+        import pytesseract
+        from .capabilities import get_capabilities
+        # Admission control caps Tesseract through OMP_THREAD_LIMIT; hold OpenCV to the same
+        if os.environ.get('OMP_THREAD_LIMIT'):
+            cv2.setNumThreads(int(os.environ['OMP_THREAD_LIMIT']))
+        self._cv2 = cv2
+        self._pytesseract = pytesseract
+        self.capabilities = get_capabilities()
+        if not self.capabilities['tesseract']:
+            print("⚠️ Tesseract was not found; run with --doctor for details")
+        elif 'ben' not in self.capabilities['languages']:
+            print("⚠️ Tesseract has no Bengali language data; pages will be read in English only (see --doctor)")
+
+    def languages(self) -> Optional[List[str]]:
+        if not self.capabilities['tesseract']:
+            return []
+        # An unreadable --list-langs listing leaves the languages unknown
+        return self.capabilities['languages'] or None
+
+    def describe(self) -> str:
+        from .capabilities import format_summary
+        return format_summary(self.capabilities)
+
+    def load_image(self, image_path: str):
+        image = self._cv2.imread(image_path)
+        if image is None:
+            raise ValueError(f"Could not load image: {image_path}")
+        return image
+
+    def preprocess(self, image, denoise: bool = True):
+        cv2 = self._cv2
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return cv2.fastNlMeansDenoising(thresh) if denoise else thresh
+
+    def split_bands(self, image, count: int) -> List[Tuple[Dict, object]]:
+        height = image.shape[0]
+        if count <= 1 or height < count * MIN_BAND_HEIGHT:
+            return super().split_bands(image, count)
+        # Cut at the row with the least ink near each even split, so no text line is cut
+        gray = image if image.ndim == 2 else image.mean(axis=2)
+        ink = (gray < 128).sum(axis=1)
+        window = height // (count * 4)
+        cuts = [0]
+        for k in range(1, count):
+            low = max(cuts[-1] + 1, k * height // count - window)
+            high = min(height - 1, k * height // count + window)
+            cuts.append(low + int(ink[low:high].argmin()))
+        cuts.append(height)
+        return [({'band': i + 1, 'bands': count, 'unit': 'px', 'start': start, 'end': end}, image[start:end])
+                for i, (start, end) in enumerate(zip(cuts, cuts[1:]))]
+
+    def image_to_string(self, image, lang: str = 'ben', psm: int = DEFAULT_PSM,
+                        timeout: Optional[float] = None) -> str:
+        try:
+            return self._pytesseract.image_to_string(image, config=f'--oem 3 --psm {psm} -l {lang}',
+                                                     timeout=timeout or 0)
+        except RuntimeError as e:
+            # pytesseract kills Tesseract and raises a bare RuntimeError on timeout
+            if 'timeout' in str(e).lower():
+                raise OcrTimeout(f"OCR did not finish within {timeout:.1f}s") from e
+            raise
+
+    def image_to_words(self, image, lang: str = 'ben', psm: int = DEFAULT_PSM) -> List[WordBox]:
+        data = self._pytesseract.image_to_data(
+            image, config=f'--oem 3 --psm {psm} -l {lang}',
+            output_type=self._pytesseract.Output.DICT,
+        )
+        words = []
+        for i, text in enumerate(data['text']):
+            if not text.strip():
+                continue
+            words.append(WordBox(text, int(data['left'][i]), int(data['top'][i]),
+                                 int(data['width'][i]), int(data['height'][i]),
+                                 float(data['conf'][i])))
+        return words
+
+
+class ReplayImage(NamedTuple):
+    """What the replay backend hands out in place of pixels"""
+    path: str
+    recording: Dict
+    # Range of recorded text lines, for a band of the page
+    lines: Optional[Tuple[int, int]] = None
+
+
+def file_sha256(path: str) -> str:
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ReplayBackend(OcrBackend):
+    """
+    Deterministic backend that returns recorded output for known images.
+
+    Output is looked up by language and page segmentation mode; when the
+    exact mode was not recorded, the psm 6 recording (or else the first one
+    for that language) is returned. A language with no recording raises
+    ``OcrBackendError``, which the extractors treat like a missing
+    Tesseract language pack.
+    """
+
+    name = 'replay'
+
+    def __init__(self, recordings_dir: str):
+        import json
+        self.recordings_dir = recordings_dir
+        self.recordings = []
+        self._by_hash = {}
+        self._by_name = {}
+        paths = sorted(Path(recordings_dir).glob('*.json'))
+        if not paths:
+            raise OcrBackendError(f"No OCR recordings found in {recordings_dir}")
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                recording = json.load(f)
+            self.recordings.append(recording)
+            if recording.get('sha256'):
+                self._by_hash[recording['sha256']] = recording
+            if recording.get('image'):
+                self._by_name[recording['image']] = recording
+
+    def load_image(self, image_path: str) -> ReplayImage:
+        recording = None
+        if os.path.exists(image_path):
+            recording = self._by_hash.get(file_sha256(image_path))
+        if recording is None:
+            recording = self._by_name.get(Path(image_path).name)
+        if recording is None:
+            raise ValueError(f"No OCR recording for image: {image_path}")
+        return ReplayImage(image_path, recording)
+
+    def _output(self, image: ReplayImage, lang: str, psm: int) -> Dict:
+        by_psm = image.recording.get('outputs', {}).get(lang)
+        if not by_psm:
+            raise OcrBackendError(f"No '{lang}' recording for {image.path}")
+        return by_psm.get(str(psm)) or by_psm.get(str(DEFAULT_PSM)) or next(iter(by_psm.values()))
+
+    def split_bands(self, image: ReplayImage, count: int) -> List[Tuple[Dict, ReplayImage]]:
+        # Recordings are per page, so a band is a share of the recorded text lines
+        outputs = image.recording.get('outputs', {})
+        lang = 'ben' if 'ben' in outputs else next(iter(outputs), None)
+        text = self._output(image, lang, DEFAULT_PSM).get('text', '') if lang else ''
+        total = len(text.split('\n'))
+        count = max(1, min(count, total))
+        cuts = [k * total // count for k in range(count + 1)]
+        return [({'band': i + 1, 'bands': count, 'unit': 'line', 'start': start, 'end': end},
+                 image._replace(lines=(start, end)))
+                for i, (start, end) in enumerate(zip(cuts, cuts[1:]))]
+
+    def image_to_string(self, image: ReplayImage, lang: str = 'ben', psm: int = DEFAULT_PSM,
+                        timeout: Optional[float] = None) -> str:
+        text = self._output(image, lang, psm).get('text', '')
+        if image.lines:
+            text = '\n'.join(text.split('\n')[slice(*image.lines)])
+        return text
+
+    def image_to_words(self, image: ReplayImage, lang: str = 'ben', psm: int = DEFAULT_PSM) -> List[WordBox]:
+        if image.lines:
+            raise OcrBackendError("Word boxes are only recorded for whole pages")
+        return [WordBox(*word) for word in self._output(image, lang, psm).get('words', [])]
+
+
+class RecordingBackend(OcrBackend):
+    """
+    Run another backend and save its output as replay recordings.
+
+    Output is filed under the most recently loaded image, which matches
+    how the extractors use a backend (one image at a time).
+    """
+
+    name = 'record'
+
+    def __init__(self, recordings_dir: str, inner: Optional[OcrBackend] = None):
+        self.recordings_dir = recordings_dir
+        self.inner = inner or TesseractBackend()
+        os.makedirs(recordings_dir, exist_ok=True)
+        self._image_path = None
+
+    def load_image(self, image_path: str):
+        image = self.inner.load_image(image_path)
+        self._image_path = image_path
+        return image
+
+    def languages(self) -> Optional[List[str]]:
+        return self.inner.languages()
+
+    def describe(self) -> str:
+        return f"{self.inner.describe()}, recording to {self.recordings_dir}"
+
+    def preprocess(self, image, denoise: bool = True):
+        return self.inner.preprocess(image, denoise)
+
+    def _save(self, lang: str, psm: int, **output):
+        import json
+        image_path = self._image_path
+        if image_path is None:
+            return
+        path = Path(self.recordings_dir) / f"{Path(image_path).stem}.json"
+        if path.exists():
+            with open(path, encoding='utf-8') as f:
+                recording = json.load(f)
+        else:
+            recording = {
+                'image': Path(image_path).name,
+                'sha256': file_sha256(image_path),
+                'source': f"recorded with the {self.inner.name} backend",
+                'outputs': {},
+            }
+        recording['outputs'].setdefault(lang, {}).setdefault(str(psm), {}).update(output)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(recording, f, ensure_ascii=False, indent=1)
+
+    # split_bands is not delegated: recordings hold whole pages
+
+    def image_to_string(self, image, lang: str = 'ben', psm: int = DEFAULT_PSM,
+                        timeout: Optional[float] = None) -> str:
+        text = self.inner.image_to_string(image, lang, psm, timeout)
+        self._save(lang, psm, text=text)
+        return text
+
+    def image_to_words(self, image, lang: str = 'ben', psm: int = DEFAULT_PSM) -> List[WordBox]:
+        words = self.inner.image_to_words(image, lang, psm)
+        self._save(lang, psm, words=[list(w) for w in words])
+        return words
+
+
+def get_backend(name: Optional[str] = None, recordings_dir: Optional[str] = None) -> OcrBackend:
+    """
+    Create the OCR backend to use.
+
+    ``name`` defaults to $BGHS_OCR_BACKEND (or 'tesseract') and
+    ``recordings_dir`` to $BGHS_OCR_RECORDINGS.
+    """
+    name = name or os.environ.get(BACKEND_ENV) or 'tesseract'
+    recordings_dir = recordings_dir or os.environ.get(RECORDINGS_ENV)
+    if name == 'tesseract':
+        return TesseractBackend()
+    if name in ('replay', 'record'):
+        if not recordings_dir:
+            raise OcrBackendError(f"The {name} OCR backend needs a recordings directory ({RECORDINGS_ENV})")
+        return ReplayBackend(recordings_dir) if name == 'replay' else RecordingBackend(recordings_dir)
+    raise OcrBackendError(f"Unknown OCR backend: {name}")
+
+
+def add_backend_arguments(parser):
+    """Add --replay / --record to a CLI parser"""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--replay', metavar='DIR',
+                       help='Replay recorded OCR output from DIR instead of running Tesseract')
+    group.add_argument('--record', metavar='DIR',
+                       help='Run Tesseract and save its output to DIR for later --replay')
+
+
+def backend_from_args(args) -> OcrBackend:
+    if args.replay:
+        return get_backend('replay', args.replay)
+    if args.record:
+        return get_backend('record', args.record)
+    return get_backend()
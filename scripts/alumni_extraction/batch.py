@@ -0,0 +1,217 @@
+"""
+Batch Bengali Alumni Image Extractor
+Process multiple images at once and combine or create separate CSV files.
+
+Usage:
+  # Process all images in a directory
+  python batch-extract-alumni.py images/*.jpg --combine
+  
+  # Process images and create separate CSV for each
+  python batch-extract-alumni.py images/*.jpg
+  
+  # Process images and output to specific directory
+  python batch-extract-alumni.py images/*.jpg --output-dir outputs/
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from .admission import add_admission_arguments, admission_from_args, admit, release
+from .backends import OcrBackend, add_backend_arguments, backend_from_args
+from .csv_writer import TEMPLATE_COLUMNS, StreamingCsvWriter, write_template_rows
+from .extract import create_csv_from_records, print_csv_summary
+from .ocr import extract_text_from_image
+from .parsing import fill_record_fields, parse_alumni_from_text
+from .profiling import Profiler, add_profile_arguments, finish_profile, profiler_from_args, run_profiled, stage
+from .sequence import (
+    format_sequence_report,
+    parse_entry_range,
+    repair_entry_sequence,
+    sort_by_entry_number,
+)
+
+def process_single_image(image_path: str, output_dir: str = None, combine: bool = False,
+                         use_sequence: bool = True, use_bengali: bool = True,
+                         backend: OcrBackend = None, profiler: Profiler = None) -> dict:
+    """Process a single image and return its records, count and sequence report"""
+    print(f"\n{'='*60}")
+    print(f"Processing: {image_path}")
+    print(f"{'='*60}")
+    if profiler:
+        profiler.labels['image'] = Path(image_path).name
+    
+    # Extract text
+    text = extract_text_from_image(image_path, use_bengali=use_bengali, backend=backend, profiler=profiler)
+    
+    if not text.strip():
+        print(f"⚠️ No text extracted from {image_path}")
+        return None
+    
+    # Parse records
+    with stage(profiler, 'parse'):
+        records = parse_alumni_from_text(text)
+    
+    if not records:
+        print(f"⚠️ No alumni records found in {image_path}")
+        return None
+    
+    print(f"✅ Found {len(records)} records")
+    
+    # Repair entry numbers when the file name gives the page's entry range
+    report = None
+    entry_range = parse_entry_range(image_path) if use_sequence else None
+    if entry_range:
+        with stage(profiler, 'sequence'):
+            report = repair_entry_sequence(records, entry_range)
+        for report_line in format_sequence_report(report):
+            print(report_line)
+        records = sort_by_entry_number(records)
+    
+    if not combine:
+        # Create separate CSV for this image
+        base_name = Path(image_path).stem
+        output_path = os.path.join(output_dir or '', f"{base_name}_alumni.csv")
+        create_csv_from_records(records, output_path, profiler=profiler)
+    
+    return {
+        'source_image': image_path,
+        'records': records,
+        'count': len(records),
+        'sequence_report': report
+    }
+
+def add_source_note(records: list, image_path: str):
+    """Add the source image to each record's notes"""
+    source = f"Source: {Path(image_path).name}"
+    for record in records:
+        record.notes = f"{record.notes}; {source}" if record.notes else source
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Batch process multiple Bengali alumni images',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Process all images in directory and combine into one CSV
+  python batch-extract-alumni.py images/*.jpg --combine -o combined.csv
+  
+  # Process images separately (one CSV per image)
+  python batch-extract-alumni.py images/*.jpg --output-dir outputs/
+  
+  # Process specific images
+  python batch-extract-alumni.py img1.jpg img2.jpg img3.jpg --combine
+        """
+    )
+    
+    parser.add_argument('images', nargs='+', help='Image files to process (supports wildcards)')
+    parser.add_argument('--combine', action='store_true', help='Combine all records into one CSV file')
+    parser.add_argument('-o', '--output', help='Output CSV file (required when using --combine)')
+    parser.add_argument('--output-dir', help='Output directory for separate CSV files')
+    parser.add_argument('--no-bengali', action='store_true', help='Skip Bengali OCR, use English only')
+    parser.add_argument('--no-sequence', action='store_true',
+                        help='Do not repair entry numbers against the range in each file name (e.g. 57-86.png)')
+    add_backend_arguments(parser)
+    add_profile_arguments(parser)
+    add_admission_arguments(parser)
+    
+    args = parser.parse_args()
+    run_profiled(lambda: run(args), args.cprofile)
+
+def run(args):
+    # Expand wildcards if needed
+    image_files = []
+    for pattern in args.images:
+        if '*' in pattern or '?' in pattern:
+            from glob import glob
+            image_files.extend(glob(pattern))
+        else:
+            image_files.append(pattern)
+    
+    # Remove duplicates and validate
+    image_files = list(set(image_files))
+    valid_images = []
+    
+    for img_path in image_files:
+        if os.path.exists(img_path):
+            valid_images.append(img_path)
+        else:
+            print(f"⚠️ Warning: Image not found: {img_path}")
+    
+    if not valid_images:
+        print("❌ No valid image files found")
+        sys.exit(1)
+    
+    print(f"📋 Found {len(valid_images)} image(s) to process")
+    
+    if args.combine and not args.output:
+        print("\n❌ Error: --output required when using --combine")
+        sys.exit(1)
+    
+    # Process each image. Records are written out as soon as their image is
+    # done and only a summary is kept, so memory stays flat over a batch.
+    backend = backend_from_args(args)
+    profiler = profiler_from_args(args, 'batch')
+    combined = StreamingCsvWriter(args.output, TEMPLATE_COLUMNS) if args.combine else None
+    # Batch work takes a slot per image, so a queued upload gets the next free one
+    admission = admission_from_args(args)
+    results = []
+    for img_path in valid_images:
+        slot = admit(admission, profiler, priority='batch')
+        try:
+            result = process_single_image(img_path, args.output_dir, args.combine,
+                                          use_sequence=not args.no_sequence,
+                                          use_bengali=not args.no_bengali,
+                                          backend=backend, profiler=profiler)
+        finally:
+            release(slot)
+        if result:
+            if combined:
+                add_source_note(result['records'], img_path)
+                with stage(profiler, 'csv_write'):
+                    write_template_rows(combined, (fill_record_fields(r) for r in result['records']))
+            result['records'] = None
+            results.append(result)
+        if profiler and profiler.memory:
+            profiler.memory.image_done(Path(img_path).name)
+    if profiler:
+        profiler.labels.pop('image', None)
+    
+    if combined:
+        combined.close()
+    
+    if not results:
+        if combined:
+            os.remove(args.output)
+        print("\n❌ No records extracted from any images")
+        sys.exit(1)
+    
+    if combined:
+        print(f"\n{'='*60}")
+        print(f"Combined records from all images")
+        print(f"{'='*60}")
+        print_csv_summary(combined.summary, args.output)
+        
+        print(f"\n✅ Combined CSV created: {args.output}")
+        print(f"📊 Total records from {len(results)} image(s): {combined.summary.total}")
+    else:
+        print(f"\n✅ Processed {len(results)} image(s)")
+        print(f"📊 Total records extracted: {sum(r['count'] for r in results)}")
+        if args.output_dir:
+            print(f"📁 Output directory: {args.output_dir}")
+    
+    # Pages whose file name gave a range tell us how many entries to expect
+    incomplete = [r for r in results if r.get('sequence_report') and not r['sequence_report'].complete]
+    if incomplete:
+        print(f"\n❓ {len(incomplete)} image(s) have missing entries:")
+        for result in incomplete:
+            missing = result['sequence_report'].missing
+            print(f"   {Path(result['source_image']).name}: {', '.join(str(n) for n in missing)}")
+    
+    finish_profile(profiler, args)
+    
+    print("\n🎉 Batch processing complete!")
+
+if __name__ == "__main__":
+    main()
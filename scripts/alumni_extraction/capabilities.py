@@ -0,0 +1,258 @@
+"""
+What the local Tesseract install can do, probed once and cached.
+
+Hosts without ``ben.traineddata`` used to pay for a failing Bengali OCR
+pass (a Tesseract process that exits with an error) on every page before
+falling back to English. ``get_capabilities()`` runs ``tesseract
+--version`` and ``--list-langs`` once and caches the result on disk:
+
+  {
+    "fingerprint": "/usr/bin/tesseract:3148440:1700000000000000000|TESSDATA_PREFIX=|pytesseract=0.3.10",
+    "tesseract": "/usr/bin/tesseract",
+    "version": "5.3.0",
+    "tessdata_dir": "/usr/share/tesseract-ocr/5/tessdata",
+    "tessdata_mtime_ns": 1700000000000000000,
+    "languages": ["eng", "osd"],
+    "apis": {"lstm": true, "image_to_data": true, "timeout": true}
+  }
+
+The cache is reused while the fingerprint (the tesseract binary, the
+TESSDATA_PREFIX setting and the pytesseract version) and the
+modification time of the tessdata directory are unchanged, so installing
+a language pack or upgrading Tesseract triggers a new probe. The cache
+lives in $BGHS_OCR_CACHE_DIR, else $XDG_CACHE_HOME/bghs-alumni, else
+~/.cache/bghs-alumni.
+
+``--doctor`` on the single-image extractors (or ``python -m
+alumni_extraction.capabilities``) re-probes and prints what was found
+and which OCR passes the pipeline will run.
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CACHE_FILE = 'tesseract-capabilities.json'
+PROBE_TIMEOUT_S = 10
+# OCR passes in the order the extractors try them
+PASS_ORDER = ('ben', 'eng')
+LANGUAGE_NAMES = {'ben': 'Bengali', 'eng': 'English'}
+
+
+def cache_path() -> Path:
+    base = os.environ.get('BGHS_OCR_CACHE_DIR')
+    if not base:
+        base = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'bghs-alumni')
+    return Path(base) / CACHE_FILE
+
+
+def _pytesseract():
+    try:
+        import pytesseract
+    except ImportError:
+        return None
+    return pytesseract
+
+
+def tesseract_command() -> Optional[str]:
+    """Path of the tesseract binary pytesseract will run, if it can be found"""
+    import shutil
+    pytesseract = _pytesseract()
+    command = pytesseract.pytesseract.tesseract_cmd if pytesseract else 'tesseract'
+    return shutil.which(command)
+
+
+def missing_requirements() -> List[str]:
+    """What the Tesseract backend needs but this host lacks; empty when it can run"""
+    from importlib.util import find_spec
+    missing = [f"{package} (pip install {package})"
+               for module, package in (('cv2', 'opencv-python'), ('pytesseract', 'pytesseract'))
+               if find_spec(module) is None]
+    if not tesseract_command():
+        missing.append('the tesseract binary')
+    return missing
+
+
+def fingerprint(command: Optional[str]) -> str:
+    """Changes whenever the tesseract binary, TESSDATA_PREFIX or pytesseract changes"""
+    parts = []
+    if command:
+        stat = os.stat(command)
+        parts.append(f"{os.path.realpath(command)}:{stat.st_size}:{stat.st_mtime_ns}")
+    else:
+        parts.append('no-tesseract')
+    parts.append(f"TESSDATA_PREFIX={os.environ.get('TESSDATA_PREFIX', '')}")
+    pytesseract = _pytesseract()
+    parts.append(f"pytesseract={getattr(pytesseract, '__version__', None) if pytesseract else None}")
+    return '|'.join(parts)
+
+
+def _mtime_ns(path: Optional[str]) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns if path else None
+    except OSError:
+        return None
+
+
+def _run(command: str, *args: str) -> str:
+    import subprocess
+    completed = subprocess.run([command, *args], capture_output=True, text=True, timeout=PROBE_TIMEOUT_S)
+    # Older releases print --version to stderr
+    return completed.stdout + completed.stderr
+
+
+def probe(command: Optional[str] = None) -> Dict:
+    """Run tesseract to find its version and languages (no cache)"""
+    import subprocess
+    command = command or tesseract_command()
+    capabilities = {
+        'fingerprint': fingerprint(command),
+        'tesseract': command,
+        'version': None,
+        'tessdata_dir': None,
+        'tessdata_mtime_ns': None,
+        'languages': [],
+        'apis': {},
+    }
+    if command:
+        try:
+            version_output, listing = _run(command, '--version'), _run(command, '--list-langs')
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"⚠️ Could not run {command}: {e}")
+            version_output, listing = '', ''
+        version = re.search(r'tesseract\s+v?(\d[\w.\-]*)', version_output)
+        capabilities['version'] = version.group(1) if version else None
+        # List of available languages in "/usr/share/tesseract-ocr/5/tessdata/" (3):
+        header = re.search(r'List of available languages(?: in "(.+?)")?.*?:\s*$', listing, re.MULTILINE)
+        if header:
+            capabilities['tessdata_dir'] = header.group(1)
+            capabilities['tessdata_mtime_ns'] = _mtime_ns(header.group(1))
+            capabilities['languages'] = sorted(line.strip() for line in listing[header.end():].splitlines()
+                                               if line.strip())
+    capabilities['apis'] = _api_support(capabilities['version'])
+    return capabilities
+
+
+def _api_support(version: Optional[str]) -> Dict[str, bool]:
+    import inspect
+    pytesseract = _pytesseract()
+    major = int(re.match(r'\d+', version).group()) if version else 0
+    return {
+        'lstm': major >= 4,
+        'image_to_data': bool(pytesseract and hasattr(pytesseract, 'image_to_data')),
+        'timeout': bool(pytesseract and 'timeout' in inspect.signature(pytesseract.image_to_string).parameters),
+    }
+
+
+def _load_cache(path: Path) -> Optional[Dict]:
+    import json
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(path: Path, capabilities: Dict):
+    import json
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(capabilities, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ Could not cache Tesseract capabilities in {path}: {e}")
+
+
+def get_capabilities(refresh: bool = False) -> Dict:
+    """
+    Cached probe result; re-probes when the install changed or ``refresh``.
+
+    The returned dict has an extra ``cached`` key saying whether the probe
+    was skipped.
+    """
+    path = cache_path()
+    command = tesseract_command()
+    if not refresh:
+        cached = _load_cache(path)
+        if (cached and cached.get('fingerprint') == fingerprint(command)
+                and cached.get('tessdata_mtime_ns') == _mtime_ns(cached.get('tessdata_dir'))):
+            return dict(cached, cached=True)
+    capabilities = probe(command)
+    _save_cache(path, capabilities)
+    return dict(capabilities, cached=False)
+
+
+def plan_passes(languages: Optional[List[str]], use_bengali: bool = True) -> List[str]:
+    """OCR languages to try, in order; ``languages`` None means unknown (try them all)"""
+    wanted = [lang for lang in PASS_ORDER if use_bengali or lang != 'ben']
+    if languages is None:
+        return wanted
+    return [lang for lang in wanted if lang in languages]
+
+
+def format_summary(capabilities: Dict) -> str:
+    """One line for --debug output"""
+    if not capabilities.get('tesseract'):
+        return "🔎 Tesseract: not found"
+    source = 'cached' if capabilities.get('cached') else 'probed'
+    return (f"🔎 Tesseract {capabilities.get('version') or '?'} ({source}), "
+            f"languages: {', '.join(capabilities['languages']) or 'none'}")
+
+
+def doctor() -> int:
+    """Re-probe and print what the OCR pipeline can use; exit status 1 when OCR cannot run"""
+    capabilities = get_capabilities(refresh=True)
+    print("🩺 OCR environment")
+    print(f"   Python          {sys.version.split()[0]}")
+    try:
+        import cv2
+        print(f"   OpenCV          {cv2.__version__}")
+    except ImportError:
+        print("   OpenCV          not installed (pip install opencv-python)")
+    pytesseract = _pytesseract()
+    print(f"   pytesseract     {getattr(pytesseract, '__version__', '?') if pytesseract else 'not installed (pip install pytesseract)'}")
+    if not capabilities['tesseract']:
+        print("   Tesseract       not found on PATH")
+        print("\n❌ Install Tesseract (e.g. sudo apt-get install tesseract-ocr tesseract-ocr-ben)")
+        return 1
+    print(f"   Tesseract       {capabilities['version'] or '?'} at {capabilities['tesseract']}")
+    print(f"   tessdata        {capabilities['tessdata_dir'] or '?'}")
+    print(f"   languages       {', '.join(capabilities['languages']) or 'none'}")
+    for api, supported in capabilities['apis'].items():
+        print(f"   {api:<15} {'yes' if supported else 'no'}")
+    print(f"   cache           {cache_path()}")
+
+    passes = plan_passes(capabilities['languages'])
+    print(f"\n📋 OCR passes: {' → '.join(LANGUAGE_NAMES[lang] for lang in passes) or 'none'}")
+    if 'ben' not in passes:
+        print("⚠️ No Bengali language data (ben.traineddata): pages will be read in English only.")
+        print("   Install it with: sudo apt-get install tesseract-ocr-ben (Linux) or brew install tesseract-lang (macOS)")
+    if not passes:
+        print("❌ Neither Bengali nor English language data is installed")
+        return 1
+    return 0
+
+
+def add_doctor_argument(parser):
+    parser.add_argument('--doctor', action='store_true',
+                        help='Check the Tesseract install and its languages, then exit')
+
+
+def main():
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(description='Check what the local Tesseract install supports')
+    parser.add_argument('--json', action='store_true', help='Print the probe result as JSON')
+    args = parser.parse_args()
+    if args.json:
+        print(json.dumps(get_capabilities(refresh=True), indent=2))
+        return
+    sys.exit(doctor())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+"""
+Bulk-load files for a first-time import of the register into PostgreSQL.
+
+Going through the upload route costs several Supabase round trips per
+row. For a full load this tool writes, from the range CSVs (or any CSVs
+the upload accepts):
+
+  PREFIX.copy          the rows in PostgreSQL COPY text format
+  PREFIX.sql           staging-table DDL, the psql ``\\copy`` command, a
+                       ``setval`` that moves ``alumni_registration_seq``
+                       past the highest registration number in ``profiles``
+                       and the staged rows, and the INSERT that moves
+                       staged rows into ``profiles``
+  PREFIX-rejected.csv  rows the upload would reject, with the reason
+
+Rows are normalized by ``migration_rules.normalize_record``, the same rules
+the upload route applies. An email or registration number that appears
+twice is rejected on its second occurrence, as the unique constraints on
+``profiles`` would.
+
+The staging table ``alumni_import_staging`` has the profile columns of
+supabase-schema.sql, add-education-fields.sql, add-registration-id.sql,
+add-old-registration-id-column.sql and add-deceased-alumni-schema.sql,
+with the same types and CHECK constraints, plus the source file and row.
+``profiles.id`` references ``auth.users``, so staged rows are only moved
+into ``profiles`` for emails that already have an auth user; create those
+first (e.g. with the Supabase admin API).
+
+There is no PostgreSQL here to test against, so ``--verify`` loads the
+COPY file back into an in-memory SQLite database built from the same
+column list and constraints, and reports how long that took.
+
+Usage (from the scripts directory):
+
+  python -m alumni_extraction.copy_export [FILE ...] [-o alumni-import] [--verify]
+  psql "$DATABASE_URL" -f alumni-import.sql
+"""
+
+import csv
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .corpus import read_rows
+from .migration_rules import MAX_CLASS, MIN_CLASS, MIN_YEAR, InvalidRecord, normalize_record
+
+STAGING_TABLE = 'alumni_import_staging'
+REGISTRATION_SEQUENCE = 'alumni_registration_seq'   # generate_registration_id() in add-registration-id.sql
+IMPORT_SOURCE = 'legacy_import'      # see the import_source comment in add-registration-id.sql
+
+# (column, PostgreSQL type, constraint); {year} is the current year
+STAGING_COLUMNS: List[Tuple[str, str, str]] = [
+    ('email', 'TEXT', 'NOT NULL UNIQUE'),
+    ('phone', 'TEXT', ''),
+    ('first_name', 'TEXT', ''),
+    ('middle_name', 'TEXT', ''),
+    ('last_name', 'TEXT', ''),
+    ('full_name', 'TEXT', 'NOT NULL'),
+    ('last_class', 'SMALLINT', f'CHECK (last_class IS NULL OR last_class BETWEEN {MIN_CLASS} AND {MAX_CLASS})'),
+    ('year_of_leaving', 'SMALLINT', f'CHECK (year_of_leaving >= {MIN_YEAR} AND year_of_leaving <= {{year}})'),
+    ('start_class', 'SMALLINT', f'CHECK (start_class IS NULL OR start_class BETWEEN {MIN_CLASS} AND {MAX_CLASS})'),
+    ('start_year', 'SMALLINT', f'CHECK (start_year IS NULL OR (start_year >= {MIN_YEAR} AND start_year <= {{year}}))'),
+    ('batch_year', 'INTEGER', 'NOT NULL'),
+    ('profession', 'TEXT', ''),
+    ('company', 'TEXT', ''),
+    ('location', 'TEXT', ''),
+    ('bio', 'TEXT', ''),
+    ('linkedin_url', 'TEXT', ''),
+    ('website_url', 'TEXT', ''),
+    ('role', 'VARCHAR(50)', "NOT NULL DEFAULT 'alumni_member'"),
+    ('professional_title', 'TEXT', ''),
+    ('registration_id', 'VARCHAR(25)', 'UNIQUE'),
+    ('old_registration_id', 'TEXT', ''),
+    ('is_deceased', 'BOOLEAN', 'NOT NULL DEFAULT false'),
+    ('deceased_year', 'INTEGER', ''),
+    ('source_file', 'TEXT', 'NOT NULL'),
+    ('source_row', 'INTEGER', 'NOT NULL'),
+]
+COLUMN_NAMES = [name for name, _, _ in STAGING_COLUMNS]
+
+# Staged columns copied into profiles as they are
+PROFILE_COLUMNS = [name for name in COLUMN_NAMES
+                   if name not in ('professional_title', 'source_file', 'source_row')]
+
+REJECTED_COLUMNS = ['Source', 'Row', 'Email', 'Error']
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+_COPY_UNESCAPES = {'\\': '\\', 't': '\t', 'n': '\n', 'r': '\r'}
+
+
+class Rejected(NamedTuple):
+    source: str
+    row: int
+    email: str
+    error: str
+
+
+class ExportSummary(NamedTuple):
+    rows: int
+    rejected: int
+    seconds: float
+
+
+def copy_value(value) -> str:
+    """One field in COPY text format: \\N for NULL, t/f for booleans, escapes for text"""
+    if value is None:
+        return '\\N'
+    if value is True or value is False:
+        return 't' if value else 'f'
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def parse_copy_line(line: str) -> List[Optional[str]]:
+    """Fields of one COPY text line, unescaped (None for \\N)"""
+    fields = []
+    for raw in line.rstrip('\n').split('\t'):
+        if raw == '\\N':
+            fields.append(None)
+            continue
+        out, i = [], 0
+        while i < len(raw):
+            ch = raw[i]
+            if ch == '\\' and i + 1 < len(raw):
+                out.append(_COPY_UNESCAPES.get(raw[i + 1], raw[i + 1]))
+                i += 2
+            else:
+                out.append(ch)
+                i += 1
+        fields.append(''.join(out))
+    return fields
+
+
+def staging_ddl(dialect: str = 'postgresql') -> str:
+    """CREATE TABLE for the staging table; 'sqlite' fixes the current year as a literal"""
+    if dialect == 'sqlite':
+        from datetime import date
+        year = str(date.today().year)
+    else:
+        year = "EXTRACT(YEAR FROM NOW())"
+    lines = [f"    {name} {sql_type} {constraint.format(year=year)}".rstrip()
+             for name, sql_type, constraint in STAGING_COLUMNS]
+    return f"CREATE TABLE IF NOT EXISTS {STAGING_TABLE} (\n" + ',\n'.join(lines) + '\n);'
+
+
+def load_sql(copy_name: str) -> str:
+    """The psql script: staging DDL, \\copy of the data file, move into profiles"""
+    columns = ', '.join(COLUMN_NAMES)
+    profile_columns = ', '.join(PROFILE_COLUMNS)
+    staged = ', '.join(f"s.{name}" for name in PROFILE_COLUMNS)
+    return f"""-- Bulk load of the alumni register (generated by alumni_extraction.copy_export)
+-- Run with: psql "$DATABASE_URL" -f {Path(copy_name).stem}.sql  (from the directory holding {copy_name})
+
+BEGIN;
+
+{staging_ddl()}
+
+TRUNCATE {STAGING_TABLE};
+
+\\copy {STAGING_TABLE} ({columns}) FROM '{copy_name}'
+
+-- The imported registration ids are given explicitly, so nextval() has not
+-- seen them. Move the sequence past the highest one in profiles and in the
+-- staged rows first: the approval trigger's generate_registration_id() fires
+-- on the INSERT below for staged rows without an id, and must not hand out
+-- one that the same INSERT imports.
+SELECT setval('{REGISTRATION_SEQUENCE}', top.suffix)
+FROM (SELECT MAX(substring(registration_id FROM '\\d{{5}}$')::INTEGER) AS suffix
+      FROM (SELECT registration_id FROM profiles
+            UNION ALL
+            SELECT registration_id FROM {STAGING_TABLE}) ids
+      WHERE registration_id ~ '^BGHSA-\\d{{4}}-\\d{{5}}$') top
+WHERE top.suffix > (SELECT CASE WHEN is_called THEN last_value ELSE last_value - 1 END
+                    FROM {REGISTRATION_SEQUENCE});
+
+-- profiles.id references auth.users: only emails with an auth user are moved.
+-- Existing profiles (same email) are left as they are.
+INSERT INTO profiles (id, {profile_columns}, professional_title_id, is_approved, import_source, imported_at)
+SELECT u.id, {staged}, t.id, TRUE, '{IMPORT_SOURCE}', NOW()
+FROM {STAGING_TABLE} s
+JOIN auth.users u ON lower(u.email) = lower(s.email)
+LEFT JOIN professional_titles t ON t.title = s.professional_title AND t.is_active
+ON CONFLICT (email) DO NOTHING;
+
+-- Staged rows still without an auth user
+SELECT s.email, s.source_file, s.source_row
+FROM {STAGING_TABLE} s
+LEFT JOIN auth.users u ON lower(u.email) = lower(s.email)
+WHERE u.id IS NULL;
+
+COMMIT;
+"""
+
+
+def staged_rows(paths: Sequence, current_year: Optional[int] = None,
+                rejected: Optional[List[Rejected]] = None) -> Iterator[Dict[str, object]]:
+    """Normalized staging rows of the CSVs; rejected rows are appended to ``rejected``"""
+    emails, registrations = set(), set()
+    for path in paths:
+        source = Path(path).name
+        for number, row in read_rows(path):
+            try:
+                record = normalize_record(row, current_year)
+                email = record['email'].lower()
+                if email in emails:
+                    raise InvalidRecord('Email already in the export')
+                if record['registration_id'] and record['registration_id'] in registrations:
+                    raise InvalidRecord('Registration number already in the export')
+            except InvalidRecord as e:
+                if rejected is not None:
+                    rejected.append(Rejected(source, number, row['Email'], str(e)))
+                continue
+            emails.add(email)
+            if record['registration_id']:
+                registrations.add(record['registration_id'])
+            record['source_file'] = source
+            record['source_row'] = number
+            yield record
+
+
+def write_copy(rows: Iterable[Dict[str, object]], path) -> int:
+    """Write rows in COPY text format (COLUMN_NAMES order); returns the row count"""
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        for row in rows:
+            f.write('\t'.join(copy_value(row[name]) for name in COLUMN_NAMES))
+            f.write('\n')
+            count += 1
+    return count
+
+
+def verify_sqlite(copy_path) -> Tuple[int, float]:
+    """Load a COPY file into an in-memory SQLite staging table; (rows, seconds)"""
+    import sqlite3
+    import time
+    start = time.perf_counter()
+    conn = sqlite3.connect(':memory:')
+    try:
+        # SQLite has no BOOLEAN/SMALLINT but keeps the constraints
+        conn.execute(staging_ddl('sqlite'))
+        booleans = [i for i, (_, sql_type, _) in enumerate(STAGING_COLUMNS) if sql_type == 'BOOLEAN']
+
+        def rows():
+            with open(copy_path, encoding='utf-8', newline='\n') as f:
+                for line in f:
+                    fields = parse_copy_line(line)
+                    for i in booleans:
+                        fields[i] = None if fields[i] is None else fields[i] == 't'
+                    yield fields
+
+        placeholders = ', '.join('?' * len(COLUMN_NAMES))
+        with conn:
+            conn.executemany(f"INSERT INTO {STAGING_TABLE} ({', '.join(COLUMN_NAMES)}) VALUES ({placeholders})",
+                             rows())
+        count = conn.execute(f"SELECT COUNT(*) FROM {STAGING_TABLE}").fetchone()[0]
+    finally:
+        conn.close()
+    return count, time.perf_counter() - start
+
+
+def export(paths: Sequence, prefix: str, current_year: Optional[int] = None) -> Tuple[ExportSummary, List[Rejected]]:
+    """Write PREFIX.copy, PREFIX.sql and PREFIX-rejected.csv"""
+    import time
+    start = time.perf_counter()
+    copy_path = Path(f"{prefix}.copy")
+    rejected: List[Rejected] = []
+    count = write_copy(staged_rows(paths, current_year, rejected), copy_path)
+    Path(f"{prefix}.sql").write_text(load_sql(copy_path.name), encoding='utf-8')
+    with open(f"{prefix}-rejected.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(REJECTED_COLUMNS)
+        writer.writerows(rejected)
+    return ExportSummary(count, len(rejected), time.perf_counter() - start), rejected
+
+
+def main():
+    import argparse
+    import sqlite3
+    import sys
+    from .evaluation import range_csv_paths
+    from .merge import REPO_ROOT
+
+    parser = argparse.ArgumentParser(description='Write PostgreSQL COPY files for a bulk load of the register')
+    parser.add_argument('inputs', nargs='*', help='CSV files (default: the range CSVs in the repository root)')
+    parser.add_argument('-o', '--output', default='alumni-import',
+                        help='Output prefix for .copy, .sql and -rejected.csv (default: alumni-import)')
+    parser.add_argument('--verify', action='store_true',
+                        help='Load the COPY file into an in-memory SQLite staging table')
+    args = parser.parse_args()
+
+    paths = args.inputs or range_csv_paths(REPO_ROOT)
+    summary, rejected = export(paths, args.output)
+    print(f"📊 {summary.rows + summary.rejected} rows from {len(paths)} file(s) in {summary.seconds * 1000:.0f} ms: "
+          f"{summary.rows} staged, {summary.rejected} rejected")
+    for item in rejected[:10]:
+        print(f"⚠️ {item.source} row {item.row} ({item.email or 'no email'}): {item.error}")
+    if len(rejected) > 10:
+        print(f"   ... {len(rejected) - 10} more in {args.output}-rejected.csv")
+    print(f"💾 {args.output}.copy, {args.output}.sql and {args.output}-rejected.csv written")
+
+    if args.verify:
+        try:
+            count, seconds = verify_sqlite(f"{args.output}.copy")
+        except sqlite3.DatabaseError as e:
+            print(f"❌ The COPY file does not load into the staging table: {e}")
+            sys.exit(1)
+        if count != summary.rows:
+            print(f"❌ Loaded {count} of {summary.rows} rows")
+            sys.exit(1)
+        print(f"✅ Loaded {count} rows into a SQLite staging table in {seconds * 1000:.0f} ms "
+              f"({count / seconds:,.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+"""
+One loader for every alumni CSV layout in the repository.
+
+The committed CSVs come in several schemas:
+
+  registration  Old Registration Number, Registration Number (or New
+                Registration Number) and the extended columns: the range
+                CSVs, the *_extracted.csv and *_with_registration files
+  extended      Title Prefix, Is Deceased and Deceased Year added to the
+                template: bengali-image-extractor.py output
+  template      alumni-migration-template.csv (18 columns, sometimes with
+                Professional Title): the generic extractor,
+                bengali-alumni-extracted.csv
+  bengali_list  Index, Full Name, Year, Status in Bengali script:
+                bengali_alumni_list.csv
+
+``read_rows`` detects a file's schema from its header and yields rows in
+one canonical schema (CANONICAL_COLUMNS): headers in any spelling the
+upload route accepts are mapped to the range-CSV names, values are
+trimmed, Is Deceased is spelled ``true``/``false`` whatever the file used
+(TRUE, True, 1), and a byte-order mark is ignored. Bengali-list rows get
+their register number in canonical form (``28 ka``), the year in ASCII
+digits and the name split into parts.
+
+``load_corpus`` reads many files (in worker processes once the input is
+large enough to pay for them) into one column table with provenance
+columns: Source File, Source Row (1-based data row) and Source Schema.
+Files in another schema raise ``SchemaError``.
+"""
+
+import csv
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .csv_writer import REGISTRATION_COLUMNS
+from .migration_rules import EXTRA_MAPPINGS, FIELD_MAPPINGS
+
+CANONICAL_COLUMNS = REGISTRATION_COLUMNS[:-1] + ['Professional Title', 'Notes']
+PROVENANCE_COLUMNS = ['Source File', 'Source Row', 'Source Schema']
+
+# Route field name -> canonical column ('first_name' -> 'First Name')
+_COLUMN_BY_FIELD = {(FIELD_MAPPINGS.get(c) or EXTRA_MAPPINGS.get(c) or c.lower()): c for c in CANONICAL_COLUMNS}
+_COLUMN_ALIASES = {'New Registration Number': 'Registration Number'}
+
+BOOLEAN_COLUMNS = ('Is Deceased',)
+_TRUE = frozenset({'true', '1', 'yes', 'y', 't'})
+_FALSE = frozenset({'false', '0', 'no', 'n', 'f'})
+
+# Inputs smaller than this are read in-process; worker start-up costs more
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+_BENGALI_DIGITS = str.maketrans('০১২৩৪৫৬৭৮৯', '0123456789')
+BENGALI_DECEASED = 'প্রয়াত'
+
+
+class SchemaError(ValueError):
+    """A CSV whose header matches none of the known schemas"""
+
+
+class Schema(NamedTuple):
+    name: str
+    markers: frozenset        # canonical columns that identify it
+
+
+SCHEMAS = (
+    Schema('registration', frozenset({'Old Registration Number', 'First Name'})),
+    Schema('extended', frozenset({'Title Prefix', 'First Name', 'Last Name'})),
+    Schema('template', frozenset({'Email', 'First Name', 'Last Name'})),
+    Schema('bengali_list', frozenset({'Index', 'Full Name'})),
+)
+
+
+def canonical_column(header: str) -> str:
+    """The canonical name of a header, or the header itself when it has none"""
+    header = header.strip().lstrip('﻿')
+    if header in _COLUMN_ALIASES:
+        return _COLUMN_ALIASES[header]
+    field = FIELD_MAPPINGS.get(header) or EXTRA_MAPPINGS.get(header) or header.lower()
+    return _COLUMN_BY_FIELD.get(field, header)
+
+
+def detect_schema(header: Sequence[str]) -> str:
+    columns = {canonical_column(name) for name in header}
+    for schema in SCHEMAS:
+        if schema.markers <= columns:
+            return schema.name
+    raise SchemaError(f"Unknown alumni CSV layout: {', '.join(header)}")
+
+
+def normalize_boolean(value: str) -> str:
+    lowered = value.strip().lower()
+    return 'true' if lowered in _TRUE else 'false' if lowered in _FALSE else value.strip()
+
+
+def _column_mapper(header: Sequence[str]) -> Callable[[List[str]], Dict[str, str]]:
+    positions = {}
+    for i, name in enumerate(header):
+        positions.setdefault(canonical_column(name), i)
+    pairs = [(column, positions.get(column)) for column in CANONICAL_COLUMNS]
+    width = len(header)
+
+    def convert(values: List[str]) -> Dict[str, str]:
+        if len(values) < width:
+            values = values + [''] * (width - len(values))
+        row = {column: (values[i].strip() if i is not None else '') for column, i in pairs}
+        for column in BOOLEAN_COLUMNS:
+            if row[column]:
+                row[column] = normalize_boolean(row[column])
+        return row
+
+    return convert
+
+
+def _bengali_list_mapper(header: Sequence[str]) -> Callable[[List[str]], Dict[str, str]]:
+    from .names import split_name
+    from .registration import OldRegistrationNumber
+    positions = {canonical_column(name): i for i, name in enumerate(header)}
+
+    def cell(values, name):
+        i = positions.get(name)
+        return values[i].strip() if i is not None and i < len(values) else ''
+
+    def convert(values: List[str]) -> Dict[str, str]:
+        row = dict.fromkeys(CANONICAL_COLUMNS, '')
+        index = cell(values, 'Index')
+        try:
+            row['Old Registration Number'] = OldRegistrationNumber.parse(index).key
+        except ValueError:
+            row['Old Registration Number'] = index
+        parts = split_name(cell(values, 'Full Name'))
+        row['First Name'], row['Middle Name'], row['Last Name'] = (
+            parts['first_name'], parts['middle_name'], parts['last_name'])
+        row['Year of Leaving'] = cell(values, 'Year').translate(_BENGALI_DIGITS)
+        row['Is Deceased'] = 'true' if BENGALI_DECEASED in cell(values, 'Status') else 'false'
+        return row
+
+    return convert
+
+
+def read_rows(path) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """(row number, canonical row) for each data row of a CSV, 1-based, as a stream"""
+    path = Path(path)
+    # utf-8-sig: some exports start with a byte-order mark
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        schema = detect_schema(header)
+        convert = _bengali_list_mapper(header) if schema == 'bengali_list' else _column_mapper(header)
+        for number, values in enumerate(reader, 1):
+            if any(value.strip() for value in values):
+                yield number, convert(values)
+
+
+def file_schema(path) -> str:
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return detect_schema(next(csv.reader(f), []))
+
+
+class CorpusTable:
+    """
+    Rows of several CSVs as columns: CANONICAL_COLUMNS (or the subset
+    asked for) plus PROVENANCE_COLUMNS, each a list of the same length.
+    """
+
+    def __init__(self, columns: Dict[str, list]):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns['Source File'])
+
+    def __getitem__(self, column: str) -> list:
+        return self.columns[column]
+
+    def rows(self) -> Iterator[Dict[str, object]]:
+        names = list(self.columns)
+        for values in zip(*(self.columns[name] for name in names)):
+            yield dict(zip(names, values))
+
+    def schemas(self) -> Dict[str, int]:
+        """Rows per source schema"""
+        from collections import Counter
+        return dict(Counter(self.columns['Source Schema']))
+
+    def to_dataframe(self):
+        """The table as a pandas DataFrame; pandas is imported on demand"""
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is required for to_dataframe (pip install pandas)")
+        return pd.DataFrame(self.columns)
+
+
+def _load_file(path: str, columns: Sequence[str]) -> Dict[str, list]:
+    """One file as columns, provenance included"""
+    wanted = {column: [] for column in columns}
+    numbers = []
+    for number, row in read_rows(path):
+        numbers.append(number)
+        for column, values in wanted.items():
+            values.append(row[column])
+    wanted['Source File'] = [Path(path).name] * len(numbers)
+    wanted['Source Row'] = numbers
+    wanted['Source Schema'] = [file_schema(path)] * len(numbers)
+    return wanted
+
+
+def load_corpus(paths: Sequence, columns: Optional[Sequence[str]] = None,
+                workers: Optional[int] = None) -> CorpusTable:
+    """
+    Read CSVs in any known schema into one CorpusTable, in path order.
+
+    ``workers`` None picks worker processes when the files add up to
+    PARALLEL_MIN_BYTES or more; 1 reads them in this process.
+    """
+    import os
+    columns = list(columns or CANONICAL_COLUMNS)
+    unknown = [column for column in columns if column not in CANONICAL_COLUMNS]
+    if unknown:
+        raise ValueError(f"Not canonical columns: {', '.join(unknown)}")
+    paths = [str(p) for p in paths]
+    for path in paths:
+        file_schema(path)           # fail before any work is spread out
+    if workers is None:
+        large = sum(os.path.getsize(p) for p in paths) >= PARALLEL_MIN_BYTES
+        workers = min(os.cpu_count() or 1, len(paths)) if large else 1
+
+    if workers > 1 and len(paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_load_file, paths, [columns] * len(paths)))
+    else:
+        parts = [_load_file(path, columns) for path in paths]
+
+    table = {column: [] for column in columns + PROVENANCE_COLUMNS}
+    for part in parts:
+        for column, values in table.items():
+            values.extend(part[column])
+    return CorpusTable(table)
+
+
+def corpus_csv_paths(directory) -> List[Path]:
+    """Alumni CSVs of a directory whose schema is known, in name order"""
+    paths = []
+    for path in sorted(Path(directory).glob('*.csv')):
+        try:
+            file_schema(path)
+        except (SchemaError, UnicodeDecodeError):
+            continue
+        paths.append(path)
+    return paths
+
+
+def main():
+    import argparse
+    import time
+    from .evaluation import range_csv_paths
+    from .merge import REPO_ROOT
+
+    parser = argparse.ArgumentParser(description='Load alumni CSVs of any layout into one canonical table')
+    parser.add_argument('inputs', nargs='*', help='CSV files (default: every alumni CSV in the repository root)')
+    parser.add_argument('-o', '--output', help='Write the unified table (with provenance columns) to this CSV')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: automatic)')
+    parser.add_argument('--range-only', action='store_true', help='Only the range CSVs (default input)')
+    args = parser.parse_args()
+
+    paths = args.inputs or (range_csv_paths(REPO_ROOT) if args.range_only else corpus_csv_paths(REPO_ROOT))
+    start = time.perf_counter()
+    table = load_corpus(paths, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"📚 {len(table)} rows from {len(paths)} file(s) in {elapsed * 1000:.0f} ms")
+    for schema, count in sorted(table.schemas().items()):
+        print(f"   {schema:<13} {count:>6} rows")
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            names = list(table.columns)
+            writer.writerow(names)
+            writer.writerows(zip(*(table.columns[name] for name in names)))
+        print(f"💾 Unified table written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
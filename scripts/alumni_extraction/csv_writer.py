@@ -0,0 +1,144 @@
+"""
+Streaming CSV output for the extractors.
+
+Rows are written with the stdlib ``csv`` module as records are produced,
+and the summary printed at the end is kept as running counters, so memory
+does not grow with the batch size and pandas is not needed to write a
+file. ``records_to_dataframe`` is still available for interactive use and
+imports pandas only when called.
+"""
+
+import csv
+from typing import Dict, Iterable, List, Sequence
+
+from .records import AlumniRecord
+
+# Standard template columns (matching alumni-migration-template.csv)
+TEMPLATE_COLUMNS = [
+    'Email', 'Phone', 'First Name', 'Last Name', 'Middle Name',
+    'Last Class', 'Year of Leaving', 'Start Class', 'Start Year', 'Batch Year',
+    'Profession', 'Company', 'Location', 'Bio', 'LinkedIn URL',
+    'Website URL', 'Role', 'Notes'
+]
+
+# Template plus title and deceased columns (bengali-image-extractor.py)
+EXTENDED_COLUMNS = [
+    'Email', 'Phone', 'Title Prefix', 'First Name', 'Middle Name', 'Last Name',
+    'Last Class', 'Year of Leaving', 'Start Class', 'Start Year', 'Batch Year',
+    'Profession', 'Company', 'Location', 'Bio', 'LinkedIn URL', 'Website URL',
+    'Role', 'Is Deceased', 'Deceased Year', 'Notes'
+]
+
+# Extended columns plus old and new registration numbers (the range CSVs)
+REGISTRATION_COLUMNS = ['Old Registration Number', 'Registration Number'] + EXTENDED_COLUMNS
+
+
+class CsvSummary:
+    """Running counts for the end-of-run summary"""
+
+    __slots__ = ('total', 'with_year', 'deceased', 'doctors', 'professors')
+
+    def __init__(self):
+        self.total = 0
+        self.with_year = 0
+        self.deceased = 0
+        self.doctors = 0
+        self.professors = 0
+
+    @property
+    def missing_year(self) -> int:
+        return self.total - self.with_year
+
+    @property
+    def living(self) -> int:
+        return self.total - self.deceased
+
+    def add(self, year: str = '', deceased: bool = False, title: str = ''):
+        self.total += 1
+        if year:
+            self.with_year += 1
+        if deceased:
+            self.deceased += 1
+        if title == 'Dr.':
+            self.doctors += 1
+        elif title == 'Prof.':
+            self.professors += 1
+
+
+class StreamingCsvWriter:
+    """
+    Write rows to a CSV file one at a time.
+
+    Use as a context manager; each ``write`` goes straight to the file and
+    updates ``summary``.
+    """
+
+    def __init__(self, path: str, columns: Sequence[str], encoding: str = 'utf-8'):
+        self.path = path
+        self.columns = list(columns)
+        self.summary = CsvSummary()
+        self._file = open(path, 'w', newline='', encoding=encoding)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write(self, row: Sequence, year: str = '', deceased: bool = False, title: str = ''):
+        """Write one row (values in column order) and count it"""
+        self._writer.writerow(row)
+        self.summary.add(year, deceased, title)
+
+    def write_dict(self, row: Dict, year: str = '', deceased: bool = False, title: str = ''):
+        """Write one row given as a column -> value mapping; missing columns are empty"""
+        self.write([row.get(col, '') for col in self.columns], year, deceased, title)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def template_row(record: AlumniRecord) -> List[str]:
+    """Values for TEMPLATE_COLUMNS from a record whose name and email are filled in"""
+    year = record.year
+    return [
+        record.email,
+        '',
+        record.first_name,
+        record.last_name,
+        record.middle_name,
+        '12' if year else '',                       # Last Class - default to 12 if year is present
+        year,
+        '',
+        '',
+        year,                                       # Batch Year = Year of Leaving
+        'Doctor' if record.title == 'Dr.' else '',  # Profession
+        '', '', '', '', '',
+        'alumni_member',
+        record.notes,
+    ]
+
+
+def write_template_rows(writer: StreamingCsvWriter, records: Iterable[AlumniRecord]):
+    """Write records to an open TEMPLATE_COLUMNS writer"""
+    for record in records:
+        writer.write(template_row(record), record.year, record.deceased, record.title)
+
+
+def write_template_csv(records: Iterable[AlumniRecord], output_path: str) -> CsvSummary:
+    """Stream records to a CSV in the standard template format"""
+    with StreamingCsvWriter(output_path, TEMPLATE_COLUMNS) as writer:
+        write_template_rows(writer, records)
+    return writer.summary
+
+
+def records_to_dataframe(records: Iterable[AlumniRecord]):
+    """Build a pandas DataFrame of template rows; pandas is imported on demand"""
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError("pandas is required for records_to_dataframe (pip install pandas)") from e
+    return pd.DataFrame([template_row(r) for r in records], columns=TEMPLATE_COLUMNS)
@@ -0,0 +1,119 @@
+"""
+Time budget for a single extraction.
+
+The admin route kills the extractor at its timeout, which used to lose
+everything read so far. With ``--deadline SECONDS`` the pipeline checks
+a ``Deadline`` between stages, OCR bands and parsed lines instead:
+
+- optional stages (denoising, the English OCR fallback, gap fill) are
+  skipped once less than half of the budget is left;
+- the page is read in one pass, as without a deadline, but that pass
+  may use only FULL_PAGE_SHARE of the time left; if it does not finish,
+  the page is read again in horizontal bands (see
+  OcrBackend.split_bands) and each Tesseract call gets the time that is
+  left as its timeout, so only slow pages are banded;
+- gap fill runs under a child budget (``Deadline.child``), so its re-read
+  stops when the time is up instead of overrunning it;
+- a few seconds are kept back so the records found so far can always be
+  written, and whatever was not read is listed as unprocessed.
+
+``--result-json`` reports the outcome (with or without a deadline):
+
+  {"partial": true, "records": 11, "deadline_s": 50.0, "elapsed_s": 48.7,
+   "skipped_stages": ["denoise"],
+   "unprocessed_regions": [{"band": 4, "bands": 4, "unit": "px", "start": 2618,
+                            "end": 3508, "reason": "timeout"}]}
+
+``unit`` is "px" for image rows, "line" for lines of recorded OCR text,
+"page" when the whole page is one region and "text line" for OCR text
+that was not parsed.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+OUTPUT_RESERVE_S = 2.0
+OPTIONAL_STAGE_SHARE = 0.5
+# Share of the time left that a single full-page OCR pass may take before the page is banded
+FULL_PAGE_SHARE = 0.6
+
+
+class Deadline:
+    """Seconds allowed for one extraction, and what had to be left out to meet them"""
+
+    def __init__(self, seconds: float, reserve_s: float = OUTPUT_RESERVE_S):
+        self.seconds = seconds
+        # Kept back for parsing and writing the CSV
+        self.reserve_s = min(reserve_s, seconds / 4)
+        self.skipped_stages: List[str] = []
+        self.unprocessed_regions: List[Dict] = []
+        self._start = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._start
+
+    def remaining(self) -> float:
+        """Seconds left for OCR work, after the output reserve"""
+        return self.seconds - self.reserve_s - self.elapsed()
+
+    def expired(self) -> bool:
+        """Whether the whole budget, reserve included, is used up"""
+        return self.elapsed() >= self.seconds
+
+    def allows(self, stage_name: str) -> bool:
+        """Whether an optional stage still fits; a stage that does not is recorded as skipped"""
+        if self.remaining() >= OPTIONAL_STAGE_SHARE * self.seconds:
+            return True
+        self.skipped_stages.append(stage_name)
+        print(f"⏭️ Skipping {stage_name}: {max(self.remaining(), 0):.1f}s of the {self.seconds:g}s deadline left")
+        return False
+
+    def child(self) -> 'Deadline':
+        """A budget for an optional re-read: the OCR time left here, with no second reserve"""
+        return Deadline(max(self.remaining(), 0.0), reserve_s=0.0)
+
+    def mark_unprocessed(self, region: Dict, reason: str):
+        self.unprocessed_regions.append(dict(region, reason=reason))
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.unprocessed_regions)
+
+    def to_dict(self) -> Dict:
+        return {
+            'partial': self.partial,
+            'deadline_s': self.seconds,
+            'elapsed_s': round(self.elapsed(), 3),
+            'skipped_stages': self.skipped_stages,
+            'unprocessed_regions': self.unprocessed_regions,
+        }
+
+
+def optional_stage(deadline: Optional[Deadline], stage_name: str) -> bool:
+    """True when there is no deadline or the optional stage still fits in it"""
+    return deadline is None or deadline.allows(stage_name)
+
+
+def add_deadline_arguments(parser):
+    """Add --deadline / --result-json to a CLI parser"""
+    parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                        help='Finish within this many seconds, writing the records read so far if time runs out')
+    parser.add_argument('--result-json', metavar='JSON',
+                        help='Write the outcome (record count, partial flag, unprocessed regions) to JSON')
+
+
+def deadline_from_args(args) -> Optional[Deadline]:
+    return Deadline(args.deadline) if args.deadline else None
+
+
+def write_result(args, deadline: Optional[Deadline], records: int):
+    """Report a partial result on the console and write --result-json, at the end of a CLI run"""
+    result = deadline.to_dict() if deadline else {'partial': False, 'skipped_stages': [], 'unprocessed_regions': []}
+    result['records'] = records
+    if result['partial']:
+        print(f"⚠️ Partial result: {len(result['unprocessed_regions'])} region(s) not read "
+              f"within the {deadline.seconds:g}s deadline")
+    if args.result_json:
+        import json
+        with open(args.result_json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
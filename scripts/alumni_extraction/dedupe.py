@@ -0,0 +1,345 @@
+"""
+Duplicate detection across the alumni register.
+
+The same person can appear twice in the register (Barin Kumar
+Chattopadhyay, 1954, is entry 2 and entry 29), and pages transcribed at
+different times spell names differently (Mukhopadhyay/Mukherjee,
+Pradip/Pradeep, Mallick/Mallik). Comparing every pair of entries grows
+quadratically with the register, so entries are first grouped into
+blocks by year of leaving and a phonetic surname key; only entries in
+the same block are compared:
+
+  block   (year, phonetic key of the last name, see phonetic.py)
+  score   weighted Jaro-Winkler similarity of the normalized first,
+          middle and last names (see ``name_similarity``)
+
+Pairs scoring at least the threshold are joined into clusters. Entries
+without a year are compared with every entry that has the same surname
+key, whatever its year.
+
+Usage (from the scripts directory; without inputs the range CSVs in the
+repository root are read):
+
+  python -m alumni_extraction.dedupe [CSV files or dirs ...] [--threshold 0.9]
+      [-o clusters.csv] [--json clusters.json]
+"""
+
+import csv
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .corpus import read_rows
+from .evaluation import range_csv_paths, row_entry_key
+from .names import TITLE_TOKENS
+from .phonetic import encode_batch, transliterate_bengali
+
+DEFAULT_THRESHOLD = 0.9
+
+# Weights of the name parts in the pair score; surnames in a block already
+# sound alike, so the given name carries most of the weight
+NAME_WEIGHTS = (('first', 0.6), ('middle', 0.15), ('last', 0.25))
+# First (and, where both have one, middle) names must be at least this
+# similar, however well the rest matches
+NAME_PART_MIN = 0.9
+
+# Spelling variants that sound the same in transliterated Bengali names
+SPELLING_RULES = (
+    (re.compile(r'ee|ie'), 'i'),
+    (re.compile(r'oo'), 'u'),
+    (re.compile(r'ck|q'), 'k'),
+    (re.compile(r'ph'), 'f'),
+    (re.compile(r'w'), 'v'),
+    (re.compile(r'([a-z])\1+'), r'\1'),
+)
+
+CLUSTER_COLUMNS = ['Cluster', 'Score', 'Source', 'Row', 'Entry', 'Name', 'Year']
+
+
+class RegisterEntry(NamedTuple):
+    """One row of a register CSV, reduced to what duplicate detection needs"""
+    source: str
+    row: int           # data row number in the file, 1-based
+    entry: str         # register number, '' if the file does not say
+    first: str
+    middle: str
+    last: str
+    year: str
+
+    @property
+    def name(self) -> str:
+        return ' '.join(part for part in (self.first, self.middle, self.last) if part)
+
+
+class DuplicateCluster(NamedTuple):
+    """Entries that are likely the same person, with the scores that joined them"""
+    entries: List[RegisterEntry]
+    score: float                         # lowest pair score that joined the cluster
+    pairs: List[Tuple[int, int, float]]  # (index, index, score) into entries
+
+
+def normalize_name(name: str) -> str:
+    """
+    Lower-case letters with spelling variants folded (Pradeep -> pradip, Mallick -> malik).
+
+    Bengali script is transliterated first (তপন -> tapan), so it is
+    compared like the Latin spellings rather than dropped.
+    """
+    if not name.isascii():
+        name = transliterate_bengali(name)
+    name = re.sub(r'[^a-z]', '', name.lower())
+    for pattern, replacement in SPELLING_RULES:
+        name = pattern.sub(replacement, name)
+    return name
+
+
+def jaro_winkler(a: str, b: str, prefix_scale: float = 0.1) -> float:
+    """Jaro-Winkler similarity of two strings, 0.0 to 1.0"""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    window = max(max(len(a), len(b)) // 2 - 1, 0)
+    matched_b = [False] * len(b)
+    a_matches = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len(b), i + window + 1)):
+            if not matched_b[j] and b[j] == char:
+                matched_b[j] = True
+                a_matches.append(char)
+                break
+    if not a_matches:
+        return 0.0
+    b_matches = [char for char, matched in zip(b, matched_b) if matched]
+    transpositions = sum(x != y for x, y in zip(a_matches, b_matches)) / 2
+    m = len(a_matches)
+    jaro = (m / len(a) + m / len(b) + (m - transpositions) / m) / 3
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+def _part_similarity(a: str, b: str, optional: bool = False) -> float:
+    if not a and not b:
+        # Two pages that both leave out a middle name agree; two missing
+        # first names or surnames say nothing about being one person
+        return 1.0 if optional else 0.0
+    if not a or not b:
+        # A middle name left out on one page is common, not a mismatch
+        return 0.5
+    return jaro_winkler(a, b)
+
+
+def normalized_parts(entry: RegisterEntry) -> Tuple[str, ...]:
+    """The entry's name parts in NAME_WEIGHTS order, normalized for comparison"""
+    return tuple(normalize_name(getattr(entry, part)) for part, _ in NAME_WEIGHTS)
+
+
+def _parts_similarity(x: Tuple[str, ...], y: Tuple[str, ...]) -> float:
+    scores = [_part_similarity(a, b, optional=part == 'middle') for (part, _), a, b in zip(NAME_WEIGHTS, x, y)]
+    # Different first names, or two different middle names, are never one person
+    # (Tapan/Tarun Chatterjee, Kazi Anisur/Kazi Mostafidur Rahman)
+    if scores[0] < NAME_PART_MIN or (x[1] and y[1] and scores[1] < NAME_PART_MIN):
+        return 0.0
+    return sum(weight * score for (_, weight), score in zip(NAME_WEIGHTS, scores))
+
+
+def name_similarity(x: RegisterEntry, y: RegisterEntry) -> float:
+    """Weighted similarity of the normalized name parts of two entries, 0.0 to 1.0"""
+    return _parts_similarity(normalized_parts(x), normalized_parts(y))
+
+
+def load_entries(path) -> List[RegisterEntry]:
+    """Entries of one register CSV (any layout alumni_extraction.corpus reads)"""
+    entries = []
+    for number, row in read_rows(path):
+        first = ' '.join(t for t in row['First Name'].split() if t.lower() not in TITLE_TOKENS)
+        last = row['Last Name']
+        if not first and not last:
+            continue
+        entries.append(RegisterEntry(
+            source=Path(path).name,
+            row=number,
+            entry=row_entry_key(row) or '',
+            first=first,
+            middle=row['Middle Name'],
+            last=last,
+            year=row['Year of Leaving'],
+        ))
+    return entries
+
+
+def csv_paths(inputs: Sequence[str]) -> List[Path]:
+    """CSV files named on the command line; a directory means its range CSVs"""
+    paths = []
+    for item in inputs:
+        path = Path(item)
+        paths.extend(range_csv_paths(path) if path.is_dir() else [path])
+    return paths
+
+
+def build_blocks(entries: Sequence[RegisterEntry]) -> Dict[Tuple[str, int], List[int]]:
+    """Entry indexes grouped by (year, phonetic surname key)"""
+    blocks = defaultdict(list)
+    keys = encode_batch([entry.last for entry in entries]).tolist()
+    for i, (entry, key) in enumerate(zip(entries, keys)):
+        blocks[(entry.year, key)].append(i)
+    return blocks
+
+
+def candidate_pairs(blocks: Dict[Tuple[str, int], List[int]]) -> Iterable[Tuple[int, int]]:
+    """Index pairs worth scoring: same block, or no year and the same surname key"""
+    by_surname = defaultdict(list)
+    for (year, key), members in blocks.items():
+        by_surname[key].append((year, members))
+    for (year, key), members in blocks.items():
+        for n, i in enumerate(members):
+            for j in members[n + 1:]:
+                yield i, j
+        if year:
+            continue
+        for other_year, others in by_surname[key]:
+            if other_year:
+                for i in members:
+                    for j in others:
+                        yield i, j
+
+
+class _DisjointSet:
+    """Union-find over entries that keeps each group to one year of leaving"""
+    __slots__ = ('parent', 'year')
+
+    def __init__(self, years: Sequence[str]):
+        self.parent = list(range(len(years)))
+        self.year = list(years)   # the group's known year, '' if none yet
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        """Join the groups of i and j, unless they hold two different years"""
+        a, b = self.find(i), self.find(j)
+        if a == b:
+            return True
+        if self.year[a] and self.year[b] and self.year[a] != self.year[b]:
+            return False
+        self.parent[a] = b
+        self.year[b] = self.year[b] or self.year[a]
+        return True
+
+
+def find_duplicates(entries: Sequence[RegisterEntry], threshold: float = DEFAULT_THRESHOLD,
+                    stats: Optional[Dict] = None) -> List[DuplicateCluster]:
+    """
+    Clusters of likely duplicates, highest score first.
+
+    ``stats``, if given, receives the number of blocks and of compared pairs.
+    """
+    blocks = build_blocks(entries)
+    parts = [normalized_parts(entry) for entry in entries]
+    matches = []
+    compared = 0
+    for i, j in candidate_pairs(blocks):
+        compared += 1
+        score = _parts_similarity(parts[i], parts[j])
+        if score >= threshold:
+            matches.append((i, j, score))
+    if stats is not None:
+        stats.update(entries=len(entries), blocks=len(blocks), compared=compared,
+                     matches=len(matches))
+
+    # Best matches first, so an entry with no year joins the year group it
+    # scores highest with; a pair that would put two years in one group
+    # (Partha Das with both the 1981 and the 2006 Partha Pratim Das) is dropped
+    matches.sort(key=lambda match: -match[2])
+    groups = _DisjointSet([entry.year for entry in entries])
+    joined = [match for match in matches if groups.union(match[0], match[1])]
+    members = defaultdict(list)
+    for i, j, score in joined:
+        members[groups.find(i)].append((i, j, score))
+
+    clusters = []
+    for pairs in members.values():
+        indexes = sorted({i for pair in pairs for i in pair[:2]})
+        position = {index: n for n, index in enumerate(indexes)}
+        clusters.append(DuplicateCluster(
+            entries=[entries[i] for i in indexes],
+            score=round(min(score for _, _, score in pairs), 4),
+            pairs=[(position[i], position[j], round(score, 4)) for i, j, score in pairs],
+        ))
+    clusters.sort(key=lambda cluster: (-cluster.score, cluster.entries[0].source, cluster.entries[0].row))
+    return clusters
+
+
+def write_clusters_csv(clusters: Sequence[DuplicateCluster], path: str):
+    """One row per clustered entry (CLUSTER_COLUMNS)"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CLUSTER_COLUMNS)
+        for number, cluster in enumerate(clusters, 1):
+            for entry in cluster.entries:
+                writer.writerow([number, cluster.score, entry.source, entry.row, entry.entry, entry.name, entry.year])
+
+
+def clusters_to_dict(clusters: Sequence[DuplicateCluster]) -> List[Dict]:
+    return [{
+        'score': cluster.score,
+        'entries': [dict(entry._asdict(), name=entry.name) for entry in cluster.entries],
+        'pairs': [{'a': i, 'b': j, 'score': score} for i, j, score in cluster.pairs],
+    } for cluster in clusters]
+
+
+def main():
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description='Find likely duplicate entries across register CSVs')
+    parser.add_argument('inputs', nargs='*',
+                        help='Register CSV files or directories of range CSVs (default: the repository root)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Minimum name similarity for a duplicate (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('-o', '--output', help='Write the clusters as CSV')
+    parser.add_argument('--json', metavar='PATH', help='Write the clusters with their pair scores as JSON')
+    args = parser.parse_args()
+
+    paths = csv_paths(args.inputs or [str(Path(__file__).resolve().parents[2])])
+    if not paths:
+        print("❌ No register CSV files found")
+        return
+    entries = [entry for path in paths for entry in load_entries(path)]
+
+    start = time.perf_counter()
+    stats = {}
+    clusters = find_duplicates(entries, args.threshold, stats)
+    elapsed = time.perf_counter() - start
+    all_pairs = len(entries) * (len(entries) - 1) // 2
+    print(f"🔍 {stats['entries']} entries from {len(paths)} file(s) in {stats['blocks']} blocks: "
+          f"compared {stats['compared']} of {all_pairs} pairs in {elapsed * 1000:.1f} ms")
+
+    for number, cluster in enumerate(clusters, 1):
+        print(f"\n👥 Cluster {number} (score {cluster.score:.2f})")
+        for entry in cluster.entries:
+            where = f"entry {entry.entry}" if entry.entry else f"row {entry.row}"
+            print(f"   {entry.source}, {where}: {entry.name} ({entry.year or 'no year'})")
+    print(f"\n📊 {len(clusters)} cluster(s) of likely duplicates, "
+          f"{sum(len(cluster.entries) for cluster in clusters)} entries")
+
+    if args.output:
+        write_clusters_csv(clusters, args.output)
+        print(f"💾 Clusters written to {args.output}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(clusters_to_dict(clusters), f, indent=2, ensure_ascii=False)
+        print(f"💾 Cluster details written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
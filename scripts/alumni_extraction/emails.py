@@ -0,0 +1,439 @@
+"""
+Collision-free placeholder emails for migrated alumni.
+
+``parsing.generate_email`` gives ``first.last[.year]@bghs-alumni.com``
+and the fixer scripts ``first.last@bghs-alumni.com``, with
+``alumni.member@bghs-alumni.com`` for a name they cannot split. Repeated
+names collide: the register has two Barin Kumar Chattopadhyays (entries
+2 and 29) and several Ashok Roys, and profiles.email is unique, so the
+upload rejects the second one.
+
+``EmailIndex`` records every address already issued: those in the
+committed CSVs and in exports of the live profiles table (``seed``), and
+those it hands out (``allocate_many``). An address belongs to an owner:
+the old register entry (``#29``), else the registration number, else
+the file and row. Entry numbers are not unique across files (the
+extracted and Bengali CSVs number the register differently from the
+range CSVs), so each address also records the name and year it was
+issued to, and an owner only keeps or reuses an address that went to
+the same person (``same_person``). A row keeps its address unless
+another owner or person has it; then it gets the address its owner was
+given before, or the first free ``.2``, ``.3`` ... variant
+(``barin.chattopadhyay.2@bghs-alumni.com``), so re-running over the same
+files changes nothing. Only placeholder addresses (PLACEHOLDER_DOMAINS)
+are replaced; a real address shared by two owners is reported and left
+alone. ``shared_addresses`` checks the outcome: no placeholder address
+may end up with two people.
+
+The index lives in SQLite, like the registration SequenceStore, so
+parallel workers can share it. Each ``allocate_many`` takes the write
+lock (BEGIN IMMEDIATE), pulls the rows other workers added since its
+last call into an in-memory hash index, and allocates from that: one
+dict lookup per record, plus a per-address suffix counter so the fiftieth
+``alumni.member`` costs the same as the second.
+
+Usage (from the scripts directory):
+
+  python -m alumni_extraction.emails [FILE ...] [--export profiles.csv]
+      [--report collisions.csv] [--commit | --in-place] [--index PATH]
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .evaluation import row_entry_key
+from .registration import parse_registration_number
+
+DEFAULT_EMAIL_INDEX = Path(__file__).resolve().parent.parent / '.email-index.sqlite3'
+
+PLACEHOLDER_DOMAINS = ('bghs-alumni.com', 'alumnibghs.org')
+DEFAULT_DOMAIN = 'bghs-alumni.com'
+FALLBACK_LOCAL_PART = 'alumni.member'
+
+KEPT, REUSED, ISSUED, RESOLVED, CONFLICT = 'kept', 'reused', 'issued', 'resolved', 'conflict'
+STATUSES = (KEPT, REUSED, ISSUED, RESOLVED, CONFLICT)
+
+IDENTITY_COLUMNS = ('first_name', 'last_name', 'year')
+
+REPORT_COLUMNS = ['Source File', 'Source Row', 'Owner', 'Status', 'Old Email', 'New Email', 'Held By']
+
+# (first name, last name, year of leaving) an address was issued to
+Identity = Tuple[str, str, str]
+
+
+class EmailRequest(NamedTuple):
+    owner: str
+    email: str              # the row's current address, '' if none
+    first_name: str = ''
+    last_name: str = ''
+    year: str = ''
+    source: str = ''
+
+    @property
+    def identity(self) -> Identity:
+        return identity(self.first_name, self.last_name, self.year)
+
+
+class Allocation(NamedTuple):
+    email: str
+    status: str
+    held_by: Optional[str] = None   # owner of the address the row had, on a collision
+
+
+def owner_key(row: Dict[str, str], source: str = '', number: int = 0) -> str:
+    """'#29' from the register entry, else 'BGHSA-2025-00030', else 'file.csv:12'"""
+    entry = row_entry_key(row)
+    if entry is not None:
+        return f"#{entry}"
+    registration = (row.get('Registration Number') or '').strip()
+    if parse_registration_number(registration):
+        return registration
+    return f"{source}:{number}"
+
+
+def identity(first_name: str, last_name: str, year: str = '') -> Identity:
+    """The name and year a row gives, without titles ('Dr.', 'Late') or surrounding spaces"""
+    from .names import TITLE_TOKENS
+    first = ' '.join(t for t in first_name.split() if t.lower() not in TITLE_TOKENS)
+    return first, last_name.strip(), year.strip()
+
+
+def same_person(x: Identity, y: Identity) -> bool:
+    """
+    Whether two holders of an address can be one person: the years agree
+    where both are known and the names match as dedupe scores them
+    (Bengali script transliterated, spelling variants folded). A holder
+    recorded without a name, e.g. from an export, matches anyone.
+    """
+    if not any(x[:2]) or not any(y[:2]):
+        return True
+    if x[2] and y[2] and x[2] != y[2]:
+        return False
+    from .dedupe import DEFAULT_THRESHOLD, RegisterEntry, name_similarity
+    return name_similarity(RegisterEntry('', 0, '', x[0], '', x[1], x[2]),
+                           RegisterEntry('', 0, '', y[0], '', y[1], y[2])) >= DEFAULT_THRESHOLD
+
+
+def shared_addresses(holders: Iterable[Tuple[str, Identity]]) -> Dict[str, List[Identity]]:
+    """
+    Placeholder addresses held by two different people, from (address,
+    identity) pairs such as the final address of every row. Real
+    addresses are left out; allocate_many reports those as conflicts.
+    """
+    by_address: Dict[str, List[Identity]] = {}
+    for email, who in holders:
+        if email and is_placeholder(email):
+            people = by_address.setdefault(email.lower(), [])
+            if not any(same_person(who, other) for other in people):
+                people.append(who)
+    return {email: people for email, people in by_address.items() if len(people) > 1}
+
+
+def is_placeholder(email: str) -> bool:
+    return email.rpartition('@')[2].lower() in PLACEHOLDER_DOMAINS
+
+
+def base_email(first_name: str, last_name: str, year: str = '') -> str:
+    """generate_email's address, or alumni.member[.year] when a name part is missing"""
+    from .parsing import generate_email
+    email = generate_email(first_name, last_name, year)
+    if email:
+        return email
+    local = FALLBACK_LOCAL_PART + (f".{year}" if year else '')
+    return f"{local}@{DEFAULT_DOMAIN}"
+
+
+def suffixed(email: str, suffix: int) -> str:
+    """'ashok.roy@bghs-alumni.com', 3 -> 'ashok.roy.3@bghs-alumni.com'"""
+    local, _, domain = email.rpartition('@')
+    return f"{local}.{suffix}@{domain}"
+
+
+class EmailIndex:
+    """
+    Issued addresses, persisted in SQLite and mirrored in memory.
+
+    ``_owner_of`` (lower-cased address -> owner), ``_identity_of``
+    (lower-cased address -> the person it went to), ``_emails_of`` (owner
+    -> its addresses in issue order, as written) and ``_next_suffix``
+    (lower-cased base address -> next suffix to try) are the hash index; ``_last_id`` is the last row of the table they
+    include. With ``dry_run`` every transaction is rolled back but the
+    in-memory index keeps its changes, so a session of calls shows what
+    it would have written.
+    """
+
+    def __init__(self, path=DEFAULT_EMAIL_INDEX, timeout: float = 30.0, dry_run: bool = False):
+        self.path = str(path)
+        self.dry_run = dry_run
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS issued_email (
+                id INTEGER PRIMARY KEY,
+                email TEXT NOT NULL UNIQUE COLLATE NOCASE,
+                base TEXT NOT NULL,
+                suffix INTEGER NOT NULL,
+                owner TEXT NOT NULL,
+                source TEXT NOT NULL,
+                issued_at TEXT NOT NULL,
+                first_name TEXT NOT NULL DEFAULT '',
+                last_name TEXT NOT NULL DEFAULT '',
+                year TEXT NOT NULL DEFAULT ''
+            )
+        """)
+        # Indexes written before addresses recorded who they went to
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(issued_email)')}
+        for column in IDENTITY_COLUMNS:
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE issued_email ADD COLUMN {column} TEXT NOT NULL DEFAULT ''")
+        self._forget()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        """Addresses in the index as of the last seed or allocation"""
+        return len(self._owner_of)
+
+    def _forget(self):
+        self._owner_of: Dict[str, str] = {}
+        self._identity_of: Dict[str, Identity] = {}
+        self._emails_of: Dict[str, List[str]] = {}
+        self._next_suffix: Dict[str, int] = {}
+        self._last_id = 0
+
+    def _sync(self):
+        """Add the rows written since the last sync (by any process) to the hash index"""
+        rows = self._conn.execute(
+            'SELECT id, email, base, suffix, owner, first_name, last_name, year '
+            'FROM issued_email WHERE id > ? ORDER BY id', (self._last_id,))
+        for row_id, email, base, suffix, owner, *who in rows:
+            self._remember(email, base, suffix, owner, tuple(who))
+            self._last_id = row_id
+
+    def _remember(self, email: str, base: str, suffix: int, owner: str, who: Identity):
+        self._owner_of[email.lower()] = owner
+        self._identity_of[email.lower()] = who
+        self._emails_of.setdefault(owner, []).append(email)
+        base = base.lower()
+        if suffix > 1 and self._next_suffix.get(base, 2) <= suffix:
+            self._next_suffix[base] = suffix + 1
+
+    def holder(self, email: str) -> Optional[str]:
+        """The owner of an address (case-insensitive), or None if it is free"""
+        return self._owner_of.get(email.strip().lower())
+
+    def _held_by(self, email: str, owner: str, who: Identity) -> bool:
+        """Whether an address was issued to this owner and to the same person"""
+        key = email.strip().lower()
+        return self._owner_of.get(key) == owner and same_person(self._identity_of[key], who)
+
+    def _given(self, owner: str, who: Identity) -> Optional[str]:
+        """The first address this owner was given for the same person, if any"""
+        for email in self._emails_of.get(owner, ()):
+            if same_person(self._identity_of[email.lower()], who):
+                return email
+        return None
+
+    def _free_variant(self, base: str) -> Tuple[str, int]:
+        """The first unissued .N variant of an address, from its suffix counter"""
+        suffix = self._next_suffix.get(base.lower(), 2)
+        while suffixed(base, suffix).lower() in self._owner_of:
+            suffix += 1
+        return suffixed(base, suffix), suffix
+
+    def _transaction(self, work):
+        conn = self._conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._sync()
+            pending: List[tuple] = []
+            result = work(pending)
+            if pending:
+                from datetime import datetime, timezone
+                now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+                conn.executemany(
+                    'INSERT INTO issued_email (email, base, suffix, owner, source, first_name, last_name, year, '
+                    'issued_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', (row + (now,) for row in pending))
+            conn.execute('ROLLBACK' if self.dry_run else 'COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            self._forget()
+            raise
+        return result
+
+    def seed(self, rows: Iterable[EmailRequest]) -> int:
+        """
+        Record the addresses rows already have, e.g. in the committed CSVs
+        or a profiles export. Addresses already held keep their owner;
+        returns how many rows had an address another owner or person holds.
+        """
+        def work(pending):
+            shared = 0
+            for row in rows:
+                email = row.email.strip()
+                if not email:
+                    continue
+                who = row.identity
+                if self.holder(email) is None:
+                    self._remember(email, email, 1, row.owner, who)
+                    pending.append((email, email, 1, row.owner, row.source) + who)
+                elif not self._held_by(email, row.owner, who):
+                    shared += 1
+            return shared
+
+        return self._transaction(work)
+
+    def allocate_many(self, requests: Iterable[EmailRequest]) -> List[Allocation]:
+        """An address for each request, in order, under one lock; see the module docstring"""
+        def work(pending):
+            allocations = []
+            for request in requests:
+                email = request.email.strip()
+                who = request.identity
+                holder = self.holder(email) if email else None
+                if email and (holder is None or self._held_by(email, request.owner, who)):
+                    if holder is None:
+                        self._remember(email, email, 1, request.owner, who)
+                        pending.append((email, email, 1, request.owner, request.source) + who)
+                    allocations.append(Allocation(email, KEPT))
+                    continue
+                if email and not is_placeholder(email):
+                    allocations.append(Allocation(email, CONFLICT, holder))
+                    continue
+                # An owner key shared with someone else (entry #N of a
+                # differently numbered file) is a collision, not a reuse
+                given = self._given(request.owner, who)
+                if given is not None:
+                    allocations.append(Allocation(given, REUSED, holder))
+                    continue
+                base = email or base_email(request.first_name, request.last_name, request.year)
+                if self.holder(base) is not None:
+                    address, suffix = self._free_variant(base)
+                else:
+                    address, suffix = base, 1
+                self._remember(address, base, suffix, request.owner, who)
+                pending.append((address, base, suffix, request.owner, request.source) + who)
+                allocations.append(Allocation(address, RESOLVED if email else ISSUED, holder))
+            return allocations
+
+        return self._transaction(work)
+
+    def allocate(self, owner: str, first_name: str, last_name: str, year: str = '', source: str = '') -> str:
+        """A fresh address for one record (e.g. a new extraction) that has none yet"""
+        return self.allocate_many([EmailRequest(owner, '', first_name, last_name, year, source)])[0].email
+
+
+def open_email_index(path: Optional[str] = None, dry_run: bool = False) -> EmailIndex:
+    return EmailIndex(path or os.environ.get('BGHS_EMAIL_INDEX') or DEFAULT_EMAIL_INDEX, dry_run=dry_run)
+
+
+def main():
+    import argparse
+    import csv
+    import time
+    from .corpus import corpus_csv_paths, read_rows
+    from .merge import REPO_ROOT
+    from .transform import Change, changes_by_source, rewrite_file
+
+    parser = argparse.ArgumentParser(description='Give every alumni row an email address no one else has')
+    parser.add_argument('inputs', nargs='*', help='CSV files to check (default: every alumni CSV in the repository)')
+    parser.add_argument('--export', nargs='+', default=[],
+                        help='CSV exports of the live profiles table; their addresses are taken first')
+    parser.add_argument('--report', help='Write every row whose address changed or is shared to this CSV')
+    parser.add_argument('--commit', action='store_true', help='Record the addresses in the index')
+    parser.add_argument('--in-place', action='store_true',
+                        help='Write the new addresses into the input files (implies --commit)')
+    parser.add_argument('--index', help=f'Index file (default: $BGHS_EMAIL_INDEX or {DEFAULT_EMAIL_INDEX.name})')
+    parser.add_argument('--show', type=int, default=10, help='Changes shown (default: 10)')
+    args = parser.parse_args()
+    commit = args.commit or args.in_place
+
+    corpus = corpus_csv_paths(REPO_ROOT)
+    inputs = [Path(p) for p in args.inputs] or corpus
+
+    def rows_of(paths):
+        for path in paths:
+            for number, row in read_rows(path):
+                yield Path(path).name, number, row
+
+    start = time.perf_counter()
+    with open_email_index(args.index, dry_run=not commit) as index:
+        # The live export first, so live addresses keep their owners, then the committed CSVs
+        seeds = (EmailRequest(owner_key(row, source, number), row['Email'], row['First Name'],
+                              row['Last Name'], row['Year of Leaving'], source)
+                 for source, number, row in rows_of(list(args.export) + corpus))
+        shared = index.seed(seeds)
+        print(f"📚 Index: {len(index)} addresses; "
+              f"{shared} row(s) in the corpus share an address with another owner")
+
+        located = list(rows_of(inputs))
+        requests = [EmailRequest(owner_key(row, source, number), row['Email'], row['First Name'],
+                                 row['Last Name'], row['Year of Leaving'], source)
+                    for source, number, row in located]
+        allocated = time.perf_counter()
+        allocations = index.allocate_many(requests)
+        allocated = time.perf_counter() - allocated
+
+    counts = dict.fromkeys(STATUSES, 0)
+    changes, reported = [], []
+    for (source, number, row), request, allocation in zip(located, requests, allocations):
+        counts[allocation.status] += 1
+        old = row['Email']
+        if allocation.status == KEPT:
+            continue
+        reported.append((source, number, request.owner, allocation.status, old, allocation.email,
+                         allocation.held_by or ''))
+        if allocation.email != old:
+            changes.append(Change(source, number, 'Email', 'emails', old, allocation.email))
+
+    elapsed = time.perf_counter() - start
+    rate = len(requests) / allocated if allocated else float('inf')
+    print(f"📊 {len(requests)} rows from {len(inputs)} file(s) in {elapsed * 1000:.0f} ms "
+          f"(allocation {allocated * 1000:.0f} ms, {rate:,.0f} rows/s): " +
+          ', '.join(f"{counts[status]} {status}" for status in STATUSES))
+    for source, number, owner, status, old, new, held_by in reported[:args.show]:
+        held = f", held by {held_by}" if held_by else ''
+        print(f"   {source}:{number} {owner} {status}: {old or '(none)'} -> {new}{held}")
+    if len(reported) > args.show:
+        print(f"   ... {len(reported) - args.show} more")
+    if counts[CONFLICT]:
+        print(f"⚠️ {counts[CONFLICT]} real address(es) are shared by different owners; fix them by hand")
+    shared = shared_addresses((allocation.email, request.identity)
+                              for request, allocation in zip(requests, allocations))
+    if shared:
+        print(f"❌ {len(shared)} placeholder address(es) would be held by different people:")
+        for email, people in list(shared.items())[:args.show]:
+            print(f"   {email}: " + '; '.join(' '.join(filter(None, who)) for who in people))
+    else:
+        print("✅ No placeholder address is held by two different people")
+
+    if args.report:
+        with open(args.report, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(REPORT_COLUMNS)
+            writer.writerows(reported)
+        print(f"💾 Report ({len(reported)} rows) written to {args.report}")
+    if shared and args.in_place:
+        print("❌ Not writing the files; see the addresses above")
+        raise SystemExit(1)
+    if args.in_place:
+        by_name = {path.name: path for path in inputs}
+        for source, file_changes in changes_by_source(changes):
+            written = rewrite_file(by_name[source], file_changes)
+            print(f"✅ {source}: {written} address(es) rewritten")
+    elif commit:
+        print(f"✅ Index updated; {len(changes)} row(s) need the new address (run with --in-place to write them)")
+    else:
+        print("🔍 Dry run: index and files unchanged. Run again with --commit or --in-place.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+"""
+Field-level accuracy of extracted records against hand-verified pages.
+
+Ground truth comes from the curated files already in the repository:
+
+  range CSVs       57-86.csv, 1-56.csv, ... in the repository root
+  manual literals  the ``alumni_data`` lists in scripts/ai-manual-extraction*.py
+
+Entries are keyed by their register number (``72``, ``72 ka``); where both
+sources cover an entry, the range CSV wins. A page is scored against the
+truth entries inside its entry range.
+
+Scored fields:
+
+  entry_number  extracted entry numbers that exist in the truth
+  name_tokens   lower-cased name tokens (title words dropped) of matched entries
+  year          year of leaving, where one is given
+  deceased      the deceased flag (positive class: deceased)
+  title         title prefix such as Dr., where one is given
+
+Precision is measured over what the extractor produced and recall over
+what the truth holds, so a missed entry costs recall in every field.
+"""
+
+import ast
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .corpus import read_rows
+from .names import TITLE_TOKENS
+from .records import AlumniRecord
+from .registration import OldRegistrationNumber
+
+SCORED_FIELDS = ('entry_number', 'name_tokens', 'year', 'deceased', 'title')
+
+RANGE_CSV_PATTERN = re.compile(r'^(\d+)-(\d+)$')
+
+# Register number in the Notes column: 'Entry #29' (older exports), 'Entry #: 28 ka' (parsing.py)
+ENTRY_NOTE_PATTERN = re.compile(r'Entry #:?\s*([^;]+)')
+
+
+class TruthEntry(NamedTuple):
+    """One hand-verified register entry"""
+    entry: str                   # canonical register number, e.g. '72 ka'
+    name_tokens: Tuple[str, ...]
+    year: str
+    deceased: bool
+    title: str
+    source: str
+
+
+def entry_key(raw) -> Optional[str]:
+    """Canonical register number ('72', '72 ka'), or None if it cannot be read"""
+    try:
+        return OldRegistrationNumber.parse(raw).key
+    except ValueError:
+        return None
+
+
+def row_entry_key(row: Dict) -> Optional[str]:
+    """Register number of a CSV row, from Old Registration Number or else the Notes"""
+    key = entry_key(row.get('Old Registration Number') or '')
+    if key is None:
+        note = ENTRY_NOTE_PATTERN.search(row.get('Notes') or '')
+        key = entry_key(note.group(1).strip()) if note else None
+    return key
+
+
+def name_tokens(name: str) -> Tuple[str, ...]:
+    tokens = re.sub(r'[^\w\s]', ' ', name.lower()).split()
+    return tuple(t for t in tokens if t not in TITLE_TOKENS)
+
+
+def load_csv_truth(path) -> List[TruthEntry]:
+    """Truth entries from a range CSV (REGISTRATION_COLUMNS layout)"""
+    entries = []
+    for _, row in read_rows(path):
+        key = entry_key(row['Old Registration Number'])
+        if key is None:
+            continue
+        name = ' '.join(row[c] for c in ('First Name', 'Middle Name', 'Last Name'))
+        entries.append(TruthEntry(
+            entry=key,
+            name_tokens=name_tokens(name),
+            year=row['Year of Leaving'],
+            deceased=row['Is Deceased'] == 'true',
+            title=row['Title Prefix'],
+            source=Path(path).name,
+        ))
+    return entries
+
+
+def load_literal_truth(path) -> List[TruthEntry]:
+    """Truth entries from the ``alumni_data = [...]`` literal of a manual extraction script"""
+    tree = ast.parse(Path(path).read_text(encoding='utf-8'))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'alumni_data' for t in node.targets):
+            data = ast.literal_eval(node.value)
+            break
+    else:
+        return []
+    entries = []
+    for item in data:
+        key = entry_key(item.get('old_id'))
+        if key is None:
+            continue
+        entries.append(TruthEntry(
+            entry=key,
+            name_tokens=name_tokens(item.get('name', '')),
+            year=str(item.get('year') or ''),
+            deceased=bool(item.get('deceased')),
+            title=item.get('title', ''),
+            source=Path(path).name,
+        ))
+    return entries
+
+
+def range_csv_paths(corpus_dir) -> List[Path]:
+    return sorted((p for p in Path(corpus_dir).glob('*.csv') if RANGE_CSV_PATTERN.match(p.stem)),
+                  key=lambda p: int(p.stem.split('-')[0]))
+
+
+def load_ground_truth(repo_root) -> Dict[str, TruthEntry]:
+    """All truth entries in the repository, keyed by register number"""
+    truth = {}
+    for path in sorted(Path(repo_root, 'scripts').glob('ai-manual-extraction*.py')):
+        for entry in load_literal_truth(path):
+            truth[entry.entry] = entry
+    # Range CSVs are the reviewed copies, so they override the literals
+    for path in range_csv_paths(repo_root):
+        for entry in load_csv_truth(path):
+            truth[entry.entry] = entry
+    return truth
+
+
+def truth_for_range(truth: Dict[str, TruthEntry], entry_range: Tuple[int, int]) -> Dict[str, TruthEntry]:
+    first, last = entry_range
+    return {key: entry for key, entry in truth.items()
+            if first <= OldRegistrationNumber.parse(key).number <= last}
+
+
+class FieldScore:
+    """True positives against predicted and expected counts for one field"""
+
+    __slots__ = ('tp', 'predicted', 'expected')
+
+    def __init__(self, tp: int = 0, predicted: int = 0, expected: int = 0):
+        self.tp = tp
+        self.predicted = predicted
+        self.expected = expected
+
+    @property
+    def precision(self) -> float:
+        return self.tp / self.predicted if self.predicted else 1.0
+
+    @property
+    def recall(self) -> float:
+        return self.tp / self.expected if self.expected else 1.0
+
+    @property
+    def f1(self) -> float:
+        p, r = self.precision, self.recall
+        return 2 * p * r / (p + r) if p + r else 0.0
+
+    def __iadd__(self, other: 'FieldScore') -> 'FieldScore':
+        self.tp += other.tp
+        self.predicted += other.predicted
+        self.expected += other.expected
+        return self
+
+    def to_dict(self) -> Dict:
+        return {'tp': self.tp, 'predicted': self.predicted, 'expected': self.expected,
+                'precision': round(self.precision, 4), 'recall': round(self.recall, 4),
+                'f1': round(self.f1, 4)}
+
+
+def score_records(records: Iterable[AlumniRecord], truth: Dict[str, TruthEntry]) -> Dict[str, FieldScore]:
+    """Score one page's records against the truth entries for its range"""
+    scores = {field: FieldScore() for field in SCORED_FIELDS}
+    for entry in truth.values():
+        scores['entry_number'].expected += 1
+        scores['name_tokens'].expected += len(entry.name_tokens)
+        scores['year'].expected += bool(entry.year)
+        scores['deceased'].expected += entry.deceased
+        scores['title'].expected += bool(entry.title)
+
+    matched = set()
+    for record in records:
+        tokens = name_tokens(record.name)
+        scores['entry_number'].predicted += 1
+        scores['name_tokens'].predicted += len(tokens)
+        scores['year'].predicted += bool(record.year)
+        scores['deceased'].predicted += bool(record.deceased)
+        scores['title'].predicted += bool(record.title)
+
+        key = entry_key(record.entry_number)
+        entry = truth.get(key)
+        # Only the first record read for an entry can match it
+        if entry is None or key in matched:
+            continue
+        matched.add(key)
+        scores['entry_number'].tp += 1
+        scores['name_tokens'].tp += sum((Counter(tokens) & Counter(entry.name_tokens)).values())
+        scores['year'].tp += bool(entry.year) and record.year == entry.year
+        scores['deceased'].tp += entry.deceased and bool(record.deceased)
+        scores['title'].tp += bool(entry.title) and record.title == entry.title
+    return scores
@@ -0,0 +1,227 @@
+"""
+Generic Bengali Alumni Image Extractor
+Extracts alumni data from Bengali text images and converts to CSV format
+following the standard alumni-migration-template.csv format.
+
+This tool is designed to be reusable for processing multiple images repeatedly.
+Usage: python extract-bengali-alumni-generic.py <image_path> [--output <csv_file>]
+       python -m alumni_extraction.extract <image_path> [--output <csv_file>]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from .admission import add_admission_arguments, admission_from_args, admit, release
+from .backends import OcrBackend, add_backend_arguments, backend_from_args
+from .capabilities import add_doctor_argument, doctor
+from .csv_writer import CsvSummary, write_template_csv
+from .deadline import Deadline, add_deadline_arguments, deadline_from_args, optional_stage, write_result
+from .ocr import extract_text_from_image
+from .parsing import fill_record_fields, parse_alumni_from_text
+from .profiling import Profiler, add_profile_arguments, finish_profile, profiler_from_args, run_profiled, stage
+from .records import AlumniRecord
+from .sequence import (
+    SequenceReport,
+    fill_sequence_gaps,
+    format_sequence_report,
+    parse_entry_range,
+    repair_entry_sequence,
+    sort_by_entry_number,
+)
+
+def repair_with_gap_fill(records: List[AlumniRecord], image_path: str, entry_range: Tuple[int, int],
+                         use_bengali: bool = True, backend: Optional[OcrBackend] = None,
+                         gap_fill: bool = True, profiler: Optional[Profiler] = None,
+                         deadline: Optional[Deadline] = None) -> Tuple[List[AlumniRecord], SequenceReport]:
+    """
+    Align records to the page's entry range and return them in entry order.
+
+    When entries are missing, the page is read once more with a different
+    layout mode and only records for the missing numbers are taken. Under
+    a deadline the re-read gets the time that is left and no more; if it
+    runs out, gap fill is reported as skipped and what was read is used.
+    """
+    with stage(profiler, 'sequence'):
+        report = repair_entry_sequence(records, entry_range)
+    if report.missing and gap_fill:
+        # Re-read the page with a different layout mode, keep only the gaps
+        print(f"🔄 Re-running OCR for {len(report.missing)} missing entr{'y' if len(report.missing) == 1 else 'ies'}...")
+        retry_deadline = deadline.child() if deadline else None
+        retry_text = extract_text_from_image(image_path, use_bengali=use_bengali, psm=4, backend=backend,
+                                             profiler=profiler, deadline=retry_deadline)
+        if retry_deadline is not None and retry_deadline.partial:
+            print("⏱️ Gap fill ran out of time; keeping the entries it read")
+            deadline.skipped_stages.append('gap_fill')
+        with stage(profiler, 'sequence'):
+            added = fill_sequence_gaps(records, parse_alumni_from_text(retry_text), entry_range, report.missing)
+            if added:
+                report = repair_entry_sequence(records, entry_range)
+    return sort_by_entry_number(records), report
+
+def create_csv_from_records(records: Iterable[AlumniRecord], output_path: str, template_path: Optional[str] = None,
+                            profiler: Optional[Profiler] = None):
+    """Create CSV file following the standard template format"""
+    
+    # Rows are written as records are filled in; nothing is buffered
+    with stage(profiler, 'csv_write'):
+        summary = write_template_csv((fill_record_fields(r) for r in records), output_path)
+    print_csv_summary(summary, output_path)
+
+def print_csv_summary(summary: CsvSummary, output_path: str):
+    print(f"\n✅ CSV file created: {output_path}")
+    print(f"📊 Total records: {summary.total}")
+    print(f"📅 With Year: {summary.with_year}")
+    print(f"❓ Missing Year: {summary.missing_year}")
+    print(f"🕯️ Deceased: {summary.deceased}")
+    print(f"👨‍⚕️ Doctors: {summary.doctors}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Extract alumni data from Bengali images and convert to CSV',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Process single image
+  python extract-bengali-alumni-generic.py image.jpg
+  
+  # Process image with custom output
+  python extract-bengali-alumni-generic.py image.jpg -o output.csv
+  
+  # Process without Bengali OCR (English only)
+  python extract-bengali-alumni-generic.py image.jpg --no-bengali
+  
+  # Debug mode
+  python extract-bengali-alumni-generic.py image.jpg --debug
+  
+  # Repair entry numbers against the expected range (read from "57-86.png" automatically)
+  python extract-bengali-alumni-generic.py page.png --range 57-86
+  
+  # Replay recorded OCR output (no Tesseract needed)
+  python extract-bengali-alumni-generic.py page.png --replay recordings/
+  
+  # Per-stage timings, plus a cProfile dump
+  python extract-bengali-alumni-generic.py image.jpg --profile timings.json --cprofile run.pstats
+        """
+    )
+    
+    parser.add_argument('image_path', nargs='?', help='Path to the Bengali image file')
+    parser.add_argument('-o', '--output', help='Output CSV file path (default: <image_name>_alumni.csv)')
+    parser.add_argument('--no-bengali', action='store_true', help='Skip Bengali OCR, use English only')
+    parser.add_argument('--debug', action='store_true', help='Show extracted text and stage timings for debugging')
+    parser.add_argument('--template', help='Path to template CSV file (for column reference)')
+    parser.add_argument('--range', dest='entry_range',
+                        help='Expected entry range, e.g. 57-86 (default: read from the image file name)')
+    parser.add_argument('--no-gap-fill', action='store_true',
+                        help='Do not re-run OCR when entries of the expected range are missing')
+    add_backend_arguments(parser)
+    add_profile_arguments(parser)
+    add_admission_arguments(parser)
+    add_deadline_arguments(parser)
+    add_doctor_argument(parser)
+    
+    args = parser.parse_args()
+    if args.doctor:
+        sys.exit(doctor())
+    if not args.image_path:
+        parser.error('the following arguments are required: image_path')
+    run_profiled(lambda: run(args), args.cprofile)
+
+def run(args):
+    
+    # Validate image file
+    if not os.path.exists(args.image_path):
+        print(f"❌ Error: Image file not found: {args.image_path}")
+        sys.exit(1)
+    
+    print(f"🖼️ Processing image: {args.image_path}")
+    backend = backend_from_args(args)
+    if args.debug:
+        print(backend.describe())
+    profiler = profiler_from_args(args, Path(args.image_path).name, timings=args.debug)
+    deadline = deadline_from_args(args)
+    
+    # Extract text (gap fill below runs OCR too, so the slot is held until it is done)
+    slot = admit(admission_from_args(args), profiler)
+    text = extract_text_from_image(args.image_path, use_bengali=not args.no_bengali, backend=backend,
+                                   profiler=profiler, deadline=deadline)
+    
+    if not text.strip() and not (deadline and deadline.partial):
+        print("❌ No text extracted from image")
+        sys.exit(1)
+    
+    if args.debug:
+        print(f"\n{'='*60}")
+        print("EXTRACTED TEXT:")
+        print(f"{'='*60}")
+        print(text)
+        print(f"{'='*60}\n")
+    
+    # Parse alumni records
+    print("📋 Parsing alumni records...")
+    with stage(profiler, 'parse'):
+        records = parse_alumni_from_text(text)
+    
+    if args.debug:
+        print(f"\n{'='*60}")
+        print("PARSED RECORDS:")
+        print(f"{'='*60}")
+        for i, record in enumerate(records[:5], 1):  # Show first 5
+            print(f"{i}. Entry: {record.entry_number or 'N/A'}")
+            print(f"   Name: {record.name or 'N/A'}")
+            print(f"   Year: {record.year or 'N/A'}")
+            print(f"   Title: {record.title or 'N/A'}")
+            print(f"   Deceased: {record.deceased}")
+            print()
+        if len(records) > 5:
+            print(f"... and {len(records) - 5} more records")
+        print(f"{'='*60}\n")
+    
+    if not records and not (deadline and deadline.partial):
+        print("⚠️ No alumni records found in extracted text")
+        print("\n💡 Tips:")
+        print("   - Try using --no-bengali flag for English OCR")
+        print("   - Check if the image is clear and readable")
+        print("   - Use --debug to see extracted text")
+        sys.exit(1)
+    
+    print(f"✅ Found {len(records)} alumni records")
+    
+    # Align entry numbers to the register range the page covers
+    entry_range = parse_entry_range(args.entry_range or args.image_path)
+    if args.entry_range and not entry_range:
+        print(f"⚠️ Ignoring invalid --range value: {args.entry_range}")
+    if entry_range and records:
+        gap_fill = not args.no_gap_fill and optional_stage(deadline, 'gap_fill')
+        records, report = repair_with_gap_fill(records, args.image_path, entry_range,
+                                               use_bengali=not args.no_bengali, backend=backend,
+                                               gap_fill=gap_fill, profiler=profiler, deadline=deadline)
+        for report_line in format_sequence_report(report):
+            print(report_line)
+    release(slot)
+    
+    # Determine output path
+    if args.output:
+        output_path = args.output
+    else:
+        base_name = Path(args.image_path).stem
+        output_path = f"{base_name}_alumni.csv"
+    
+    # Create CSV
+    create_csv_from_records(records, output_path, args.template, profiler=profiler)
+    write_result(args, deadline, len(records))
+    
+    print(f"\n🎉 Processing complete!")
+    print(f"📁 Output file: {output_path}")
+    print(f"\n💡 Next steps:")
+    print(f"   1. Review the CSV file: {output_path}")
+    print(f"   2. Edit/verify the extracted data if needed")
+    print(f"   3. Upload to /admin/alumni-migration")
+    
+    finish_profile(profiler, args, timings=args.debug)
+
+if __name__ == "__main__":
+    main()
+
@@ -0,0 +1,77 @@
+"""
+Split OCR lines that contain two register entries side by side.
+
+When Tesseract reads straight across the column gutter of a register page,
+one text line holds both the left and the right entry, e.g.
+
+    57. অরুণময় বন্দ্যোপাধ্যায় (১৯৬৯)   87. কৃষ্ণচন্দ্র দত্ত (১৯৭২)
+
+The splitter finds every ``entry_no.`` anchor in the line and cuts in front
+of an anchor only once the text before it has been closed by a
+parenthesised group (the ``(year)`` or a ``(প্রয়াত)`` marker) or is
+separated from it by a column gap, so names that merely contain digits are
+not torn apart.
+"""
+
+import re
+from typing import List, NamedTuple
+
+# Entry number at the start of the line or after whitespace, with an optional
+# suffix (28 ka, 72ক, 72A) and a terminating '.', '।' or ')'.
+ENTRY_ANCHOR_PATTERN = re.compile(
+    r'(?:^|(?<=\s))[\d০-৯]{1,5}(?:\s?(?:ka|ক|[A-Za-z]))?\s*[।.)]'
+)
+
+# Year of leaving in parentheses, English or Bengali digits.
+YEAR_IN_PARENS_PATTERN = re.compile(r'\(\s*[\d০-৯]{4}\s*\)')
+
+# Any parenthesised group; entries end with their year or a deceased marker.
+CLOSING_GROUP_PATTERN = re.compile(r'\([^()]*\)')
+
+# Whitespace run that only appears between the two columns
+COLUMN_GAP = '   '
+
+
+class LineSegment(NamedTuple):
+    """One register entry cut out of an OCR line"""
+    text: str
+    column: str  # 'left', 'right' or '' when the line held a single entry
+
+
+def split_side_by_side_records(line: str) -> List[LineSegment]:
+    """
+    Split a line into one segment per register entry.
+
+    Runs in time linear in the line length: anchors and years are each
+    found in one pass, then merged with two cursors.
+    """
+    anchors = [m.start() for m in ENTRY_ANCHOR_PATTERN.finditer(line)]
+    if len(anchors) < 2:
+        return [LineSegment(line, '')]
+
+    closer_ends = [m.end() for m in CLOSING_GROUP_PATTERN.finditer(line)]
+
+    cuts = []
+    start = 0
+    closer_idx = 0
+    for anchor in anchors[1:]:
+        # Skip groups that belong to segments already cut off
+        while closer_idx < len(closer_ends) and closer_ends[closer_idx] <= start:
+            closer_idx += 1
+        # Cut if the pending segment is closed before this anchor, or an
+        # entry without year or marker is followed by the column gap
+        closed = closer_idx < len(closer_ends) and closer_ends[closer_idx] <= anchor
+        if closed or line.endswith(COLUMN_GAP, start, anchor):
+            cuts.append(anchor)
+            start = anchor
+
+    if not cuts:
+        return [LineSegment(line, '')]
+
+    bounds = [0] + cuts + [len(line)]
+    segments = []
+    for i in range(len(bounds) - 1):
+        text = line[bounds[i]:bounds[i + 1]].strip()
+        if text:
+            segments.append(LineSegment(text, 'left' if i == 0 else 'right'))
+    return segments
@@ -0,0 +1,309 @@
+"""
+Merge a new extraction into the range-CSV corpus.
+
+The corpus is the committed range files (``1-56.csv`` ... ``1293-1308.csv``
+in the repository root), optionally followed by other exports such as the
+``bengali_alumni_*`` files. ``CorpusIndex`` keeps every corpus row in a
+SQLite file keyed by old registration number, and re-reads a corpus file
+only when its size or modification time changed. A merge therefore reads
+the new CSV as a stream and does one index lookup per record, instead of
+rescanning the corpus.
+
+Each new record is classified:
+
+  new        its register number is not in the corpus
+  identical  every compared field it has matches the corpus row
+  changed    same person, some compared fields differ (listed as a diff)
+  conflict   the corpus row under that number is a different person (first
+             name or surname sounds different), the number appears twice in
+             the new file with different content, or the record has no
+             register number at all
+
+Only the delta is written: ``-o`` gets the new rows and the corpus rows of
+changed entries with the new values applied, in the range-CSV layout.
+``--report`` lists every record's status and field diff.
+
+Usage (from the scripts directory):
+
+  python -m alumni_extraction.merge new.csv [more.csv ...] [-o delta.csv]
+      [--report merge-report.csv] [--corpus FILE_OR_DIR ...] [--index PATH]
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .corpus import read_rows
+from .csv_writer import REGISTRATION_COLUMNS, StreamingCsvWriter
+from .evaluation import range_csv_paths, row_entry_key
+from .phonetic import encode
+
+DEFAULT_CORPUS_INDEX = Path(__file__).resolve().parent.parent / '.corpus-index.sqlite3'
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Fields an extraction can disagree with the corpus about. Columns the
+# extractors fill with placeholders (Email, Registration Number, Company,
+# ...) are carried over from the corpus but never compared.
+COMPARED_FIELDS = ('Title Prefix', 'First Name', 'Middle Name', 'Last Name', 'Year of Leaving', 'Is Deceased')
+
+NEW, IDENTICAL, CHANGED, CONFLICT = 'new', 'identical', 'changed', 'conflict'
+STATUSES = (NEW, IDENTICAL, CHANGED, CONFLICT)
+
+REPORT_COLUMNS = ['Status', 'Entry', 'Source', 'Row', 'Corpus File', 'Corpus Row', 'Changes', 'Reason']
+
+
+class CorpusRow(NamedTuple):
+    """A corpus row found in the index"""
+    file: str
+    row: int
+    fields: Dict[str, str]
+
+
+class MergeResult(NamedTuple):
+    """Classification of one new record"""
+    status: str
+    entry: str                               # register number key, '' if unreadable
+    source: str
+    row: int
+    fields: Dict[str, str]                   # the new record
+    corpus: Optional[CorpusRow]
+    changes: List[Tuple[str, str, str]]      # (field, corpus value, new value)
+    reason: str = ''
+
+
+def normalize_value(field: str, value: Optional[str]) -> str:
+    """A field value as compared: trimmed, case-folded, deceased flags as true/false"""
+    value = (value or '').strip()
+    if field == 'Is Deceased':
+        return 'true' if value.lower() in ('true', '1', 'yes') else 'false' if value else ''
+    if field == 'Title Prefix':
+        value = value.rstrip('.')
+    return value.casefold()
+
+
+def same_person(corpus: Dict[str, str], record: Dict[str, str]) -> bool:
+    """Whether two rows under one register number name the same person (by sound)"""
+    for field in ('First Name', 'Last Name'):
+        new_value = (record.get(field) or '').strip()
+        if new_value and encode(new_value) != encode(corpus.get(field) or ''):
+            return False
+    return True
+
+
+def field_changes(corpus: Dict[str, str], record: Dict[str, str]) -> List[Tuple[str, str, str]]:
+    """Compared fields the new record gives and the corpus row has differently"""
+    changes = []
+    for field in COMPARED_FIELDS:
+        if field not in record:
+            continue
+        new_value = normalize_value(field, record[field])
+        if new_value and new_value != normalize_value(field, corpus.get(field)):
+            changes.append((field, corpus.get(field) or '', record[field].strip()))
+    return changes
+
+
+class CorpusIndex:
+    """
+    Corpus rows by register number, persisted in SQLite.
+
+    ``refresh`` re-reads only the corpus files whose size or modification
+    time changed since they were indexed. Where a number appears in
+    several files, ``lookup`` returns the row from the earliest file in
+    corpus order (range CSVs first).
+    """
+
+    def __init__(self, path=DEFAULT_CORPUS_INDEX, timeout: float = 30.0):
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS corpus_file (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                priority INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS corpus_entry (
+                entry_key TEXT NOT NULL,
+                path TEXT NOT NULL,
+                row INTEGER NOT NULL,
+                fields TEXT NOT NULL,
+                PRIMARY KEY (entry_key, path)
+            );
+        """)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def refresh(self, paths: Sequence[Path]) -> int:
+        """Bring the index up to date with the corpus files; returns how many were re-read"""
+        import json
+        conn = self._conn
+        wanted = {str(Path(p).resolve()): priority for priority, p in enumerate(paths)}
+        reread = 0
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            indexed = {path: (size, mtime_ns, priority) for path, size, mtime_ns, priority
+                       in conn.execute('SELECT path, size, mtime_ns, priority FROM corpus_file')}
+            for path in set(indexed) - set(wanted):
+                conn.execute('DELETE FROM corpus_entry WHERE path = ?', (path,))
+                conn.execute('DELETE FROM corpus_file WHERE path = ?', (path,))
+            for path, priority in wanted.items():
+                stat = os.stat(path)
+                if indexed.get(path) == (stat.st_size, stat.st_mtime_ns, priority):
+                    continue
+                conn.execute('DELETE FROM corpus_entry WHERE path = ?', (path,))
+                for number, row in read_rows(path):
+                    key = row_entry_key(row)
+                    if key is not None:
+                        # A number repeated inside one file keeps its first row
+                        conn.execute('INSERT OR IGNORE INTO corpus_entry (entry_key, path, row, fields) '
+                                     'VALUES (?, ?, ?, ?)', (key, path, number, json.dumps(row, ensure_ascii=False)))
+                conn.execute('INSERT OR REPLACE INTO corpus_file (path, size, mtime_ns, priority) VALUES (?, ?, ?, ?)',
+                             (path, stat.st_size, stat.st_mtime_ns, priority))
+                reread += 1
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return reread
+
+    def lookup(self, key: str) -> Optional[CorpusRow]:
+        import json
+        row = self._conn.execute(
+            'SELECT e.path, e.row, e.fields FROM corpus_entry e JOIN corpus_file f ON f.path = e.path '
+            'WHERE e.entry_key = ? ORDER BY f.priority LIMIT 1', (key,)
+        ).fetchone()
+        return CorpusRow(Path(row[0]).name, row[1], json.loads(row[2])) if row else None
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(DISTINCT entry_key) FROM corpus_entry').fetchone()[0]
+
+
+def classify(index: CorpusIndex, rows: Iterable[Tuple[str, int, Dict[str, str]]]) -> Iterator[MergeResult]:
+    """Classify a stream of (source, row number, row) new records against the corpus"""
+    seen: Dict[str, Dict[str, str]] = {}
+    for source, number, record in rows:
+        key = row_entry_key(record)
+        if key is None:
+            yield MergeResult(CONFLICT, '', source, number, record, None, [], 'no register number')
+            continue
+        earlier = seen.get(key)
+        if earlier is not None:
+            changes = field_changes(earlier, record)
+            if changes:
+                yield MergeResult(CONFLICT, key, source, number, record, None, changes,
+                                  'register number repeated in the new records')
+            else:
+                yield MergeResult(IDENTICAL, key, source, number, record, None, [], 'repeated in the new records')
+            continue
+        seen[key] = record
+
+        corpus = index.lookup(key)
+        if corpus is None:
+            yield MergeResult(NEW, key, source, number, record, None, [])
+        elif not same_person(corpus.fields, record):
+            yield MergeResult(CONFLICT, key, source, number, record, corpus, field_changes(corpus.fields, record),
+                              'a different person has this register number in the corpus')
+        else:
+            changes = field_changes(corpus.fields, record)
+            yield MergeResult(CHANGED if changes else IDENTICAL, key, source, number, record, corpus, changes)
+
+
+def delta_row(result: MergeResult) -> Dict[str, str]:
+    """The range-CSV row to write for a new or changed record"""
+    if result.status == CHANGED:
+        row = dict(result.corpus.fields)
+        for field, old_value, new_value in result.changes:
+            row[field] = new_value
+            # Batch Year mirrors Year of Leaving in the range CSVs (see template_row)
+            if field == 'Year of Leaving' and row.get('Batch Year') == old_value:
+                row['Batch Year'] = new_value
+        return row
+    row = dict(result.fields)
+    if not row.get('Old Registration Number'):
+        row['Old Registration Number'] = result.entry
+    return row
+
+
+def format_changes(changes: Sequence[Tuple[str, str, str]]) -> str:
+    return '; '.join(f"{field}: {old!r} -> {new!r}" for field, old, new in changes)
+
+
+def corpus_paths(inputs: Sequence[str]) -> List[Path]:
+    """Corpus files in priority order; a directory means its range CSVs"""
+    paths = []
+    for item in inputs:
+        path = Path(item)
+        paths.extend(range_csv_paths(path) if path.is_dir() else [path])
+    return paths
+
+
+def open_index(path: Optional[str] = None) -> CorpusIndex:
+    return CorpusIndex(path or os.environ.get('BGHS_CORPUS_INDEX') or DEFAULT_CORPUS_INDEX)
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Merge new extractions into the range-CSV corpus, writing only the delta')
+    parser.add_argument('inputs', nargs='+', help='Newly extracted CSV files')
+    parser.add_argument('-o', '--output', help='Write new and changed rows (range-CSV layout) to this CSV')
+    parser.add_argument('--report', help='Write every record with its status and field diff to this CSV')
+    parser.add_argument('--corpus', nargs='+', metavar='FILE_OR_DIR',
+                        help='Corpus files or directories of range CSVs, in priority order '
+                             '(default: the range CSVs in the repository root)')
+    parser.add_argument('--index', help=f'Corpus index file (default: $BGHS_CORPUS_INDEX or {DEFAULT_CORPUS_INDEX.name})')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    paths = corpus_paths(args.corpus or [str(REPO_ROOT)])
+    with open_index(args.index) as index:
+        reread = index.refresh(paths)
+        print(f"📚 Corpus index: {len(index)} entries from {len(paths)} file(s), {reread} re-read")
+
+        counts = dict.fromkeys(STATUSES, 0)
+        stream = ((Path(path).name, number, row) for path in args.inputs for number, row in read_rows(path))
+        delta = StreamingCsvWriter(args.output, REGISTRATION_COLUMNS) if args.output else None
+        report = StreamingCsvWriter(args.report, REPORT_COLUMNS) if args.report else None
+        try:
+            for result in classify(index, stream):
+                counts[result.status] += 1
+                if result.status in (CHANGED, CONFLICT):
+                    where = f"{result.source} row {result.row}"
+                    detail = format_changes(result.changes) or result.reason
+                    icon = '✏️' if result.status == CHANGED else '⚠️'
+                    print(f"{icon} {result.status} {result.entry or '?'} ({where}): {detail}")
+                if delta and result.status in (NEW, CHANGED):
+                    row = delta_row(result)
+                    delta.write_dict(row, row.get('Year of Leaving', ''),
+                                     normalize_value('Is Deceased', row.get('Is Deceased')) == 'true',
+                                     row.get('Title Prefix', ''))
+                if report:
+                    report.write([result.status, result.entry, result.source, result.row,
+                                  result.corpus.file if result.corpus else '',
+                                  result.corpus.row if result.corpus else '',
+                                  format_changes(result.changes), result.reason])
+        finally:
+            for writer in (delta, report):
+                if writer:
+                    writer.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"\n📊 {sum(counts.values())} records in {elapsed * 1000:.0f} ms: " +
+          ', '.join(f"{counts[status]} {status}" for status in STATUSES))
+    if delta:
+        print(f"💾 Delta ({counts[NEW] + counts[CHANGED]} rows) written to {args.output}")
+    if report:
+        print(f"💾 Report written to {args.report}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+The field rules of the alumni-migration upload, in Python.
+
+``normalize_record`` mirrors ``validateAndNormalizeRecord`` in
+app/api/admin/alumni-migration/upload/route.ts: the same header
+spellings are accepted, values are trimmed, numbers are read like
+JavaScript's ``parseInt``, Batch Year defaults to Year of Leaving and
+Role to ``alumni_member``. It also reads the columns of the range CSVs
+the route ignores (registration numbers, the deceased flag).
+
+Ranges follow the database constraints: classes 1-12
+(add-education-fields.sql) and years from 1900
+(update-year-validation-constraint.sql) to the current year. The route
+itself still rejects years before 1950; pass ``min_year=1950`` to
+reproduce that.
+"""
+
+import re
+from typing import Dict, Optional
+
+from .registration import NEW_REGISTRATION_PATTERN
+
+# Header spellings accepted by the route (fieldMappings); any other header
+# is lower-cased
+FIELD_MAPPINGS = {
+    'Email': 'email', 'email': 'email',
+    'First Name': 'first_name', 'FirstName': 'first_name', 'first_name': 'first_name',
+    'Last Name': 'last_name', 'LastName': 'last_name', 'last_name': 'last_name',
+    'Middle Name': 'middle_name', 'MiddleName': 'middle_name', 'middle_name': 'middle_name',
+    'Phone': 'phone', 'phone': 'phone',
+    'Last Class': 'last_class', 'LastClass': 'last_class', 'last_class': 'last_class',
+    'Year of Leaving': 'year_of_leaving', 'YearOfLeaving': 'year_of_leaving', 'year_of_leaving': 'year_of_leaving',
+    'Start Class': 'start_class', 'StartClass': 'start_class', 'start_class': 'start_class',
+    'Start Year': 'start_year', 'StartYear': 'start_year', 'start_year': 'start_year',
+    'Batch Year': 'batch_year', 'BatchYear': 'batch_year', 'batch_year': 'batch_year',
+    'Profession': 'profession', 'profession': 'profession',
+    'Company': 'company', 'company': 'company',
+    'Location': 'location', 'location': 'location',
+    'Bio': 'bio', 'bio': 'bio',
+    'LinkedIn URL': 'linkedin_url', 'LinkedInUrl': 'linkedin_url', 'linkedin_url': 'linkedin_url',
+    'Website URL': 'website_url', 'WebsiteUrl': 'website_url', 'website_url': 'website_url',
+    'Role': 'role', 'role': 'role',
+    'Professional Title': 'professional_title', 'ProfessionalTitle': 'professional_title',
+    'professional_title': 'professional_title',
+}
+
+# Range-CSV columns with a profile column the route does not fill
+EXTRA_MAPPINGS = {
+    'Registration Number': 'registration_id',
+    'Old Registration Number': 'old_registration_id',
+    'Is Deceased': 'is_deceased',
+    'Deceased Year': 'deceased_year',
+}
+
+TEXT_FIELDS = ('phone', 'middle_name', 'profession', 'company', 'location', 'bio',
+               'linkedin_url', 'website_url', 'professional_title', 'old_registration_id')
+REQUIRED_FIELDS = (('email', 'Email'), ('first_name', 'First name'), ('last_name', 'Last name'),
+                   ('last_class', 'Last class'), ('year_of_leaving', 'Year of leaving'))
+DEFAULT_ROLE = 'alumni_member'
+MIN_CLASS, MAX_CLASS = 1, 12
+MIN_YEAR = 1900
+
+# ASCII digits only: parseInt('১৯৫৪') is NaN, though int('১৯৫৪') is 1954
+_LEADING_INT = re.compile(r'\s*([+-]?[0-9]+)')
+
+
+class InvalidRecord(ValueError):
+    """A row the upload would reject; the message is the route's"""
+
+
+def parse_int(value) -> Optional[int]:
+    """JavaScript parseInt: the leading integer of a string, None where that is NaN"""
+    match = _LEADING_INT.match(str(value))
+    return int(match.group(1)) if match else None
+
+
+def canonical_fields(row: Dict[str, str]) -> Dict[str, str]:
+    """Row values under the route's field names (plus the range-CSV extras)"""
+    fields = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        name = FIELD_MAPPINGS.get(key) or EXTRA_MAPPINGS.get(key) or key.lower()
+        fields[name] = '' if value is None else str(value)
+    return fields
+
+
+def _number(fields: Dict[str, str], name: str, label: str) -> Optional[int]:
+    value = fields.get(name, '').strip()
+    if not value:
+        return None
+    number = parse_int(value)
+    if number is None:
+        raise InvalidRecord(f"{label} must be a number")
+    return number
+
+
+def normalize_record(row: Dict[str, str], current_year: Optional[int] = None,
+                     min_year: int = MIN_YEAR) -> Dict[str, object]:
+    """
+    A CSV row as the profile values the upload would insert.
+
+    Raises InvalidRecord with the route's message for a row it would
+    reject (or that the database constraints would).
+    """
+    if current_year is None:
+        from datetime import date
+        current_year = date.today().year
+    fields = canonical_fields(row)
+    for name, label in REQUIRED_FIELDS:
+        if not fields.get(name, '').strip():
+            raise InvalidRecord(f"{label} is required")
+
+    last_class = _number(fields, 'last_class', 'Last class')
+    year_of_leaving = _number(fields, 'year_of_leaving', 'Year of leaving')
+    start_class = _number(fields, 'start_class', 'Start class')
+    start_year = _number(fields, 'start_year', 'Start year')
+    batch_year = _number(fields, 'batch_year', 'Batch year')
+    if not MIN_CLASS <= last_class <= MAX_CLASS:
+        raise InvalidRecord(f"Last class must be between {MIN_CLASS} and {MAX_CLASS}")
+    if not min_year <= year_of_leaving <= current_year:
+        raise InvalidRecord(f"Year of leaving must be between {min_year} and current year")
+    if start_class is not None and not MIN_CLASS <= start_class <= MAX_CLASS:
+        raise InvalidRecord(f"Start class must be between {MIN_CLASS} and {MAX_CLASS}")
+    if start_year is not None and not min_year <= start_year <= current_year:
+        raise InvalidRecord(f"Start year must be between {min_year} and current year")
+
+    registration_id = fields.get('registration_id', '').strip() or None
+    if registration_id and not NEW_REGISTRATION_PATTERN.match(registration_id):
+        raise InvalidRecord(f"Registration number must look like BGHSA-YYYY-NNNNN: {registration_id}")
+
+    record = {name: (fields.get(name, '').strip() or None) for name in TEXT_FIELDS}
+    first_name, last_name = fields['first_name'].strip(), fields['last_name'].strip()
+    record.update(
+        email=fields['email'].strip(),
+        first_name=first_name,
+        last_name=last_name,
+        full_name=' '.join(part for part in (first_name, record['middle_name'], last_name) if part),
+        last_class=last_class,
+        year_of_leaving=year_of_leaving,
+        start_class=start_class,
+        start_year=start_year,
+        batch_year=year_of_leaving if batch_year is None else batch_year,
+        role=fields.get('role', '').strip() or DEFAULT_ROLE,
+        registration_id=registration_id,
+        is_deceased=fields.get('is_deceased', '').strip().lower() in ('true', '1', 'yes'),
+        deceased_year=_number(fields, 'deceased_year', 'Deceased year'),
+    )
+    return record
@@ -0,0 +1,135 @@
+"""
+Splitting full names into first, middle and last name.
+
+Many surnames in the register span two words ("Ghosh Dastidar", "Barman
+Roy", "De Sarkar"), so taking the last token as the surname files half of
+it under the middle name. Known compound surnames are kept in a trie keyed
+on reversed tokens; one right-to-left walk over a name finds the longest
+surname it ends with.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Compound surnames found in the curated range CSVs and fix-* scripts,
+# plus their common spelling variants.
+COMPOUND_SURNAMES = (
+    'Barman Roy',
+    'Basu Mallick',
+    'Basu Thakur',
+    'Das Gupta',
+    'De Sarkar',
+    'Deb Bhuti',
+    'Dutta Gupta',
+    'Dutta Roy',
+    'Ghosh Dastidar',
+    'Ghosh Ray',
+    'Ghosh Roy',
+    'Guha Majumdar',
+    'Guha Thakurta',
+    'Kar Chowdhury',
+    'Pal Chowdhury',
+    'Ray Chaudhuri',
+    'Ray Chowdhury',
+    'Roy Choudhury',
+    'Roy Chowdhury',
+    'Roy Palodhi',
+    'Sadhu Khan',
+    'Sen Gupta',
+    'Sen Sarma',
+    # Bengali script, as they appear in the bengali_alumni_* files
+    'ঘোষ দস্তিদার',
+    'দে সরকার',
+    'বর্মন রায়',
+    'রায় চৌধুরী',
+)
+
+TITLE_TOKENS = {'dr.', 'dr', 'prof.', 'prof', 'ডাঃ', 'ডক্টর'}
+
+
+class SurnameTrie:
+    """Trie over reversed surname tokens, matched case-insensitively"""
+
+    __slots__ = ('_root',)
+
+    _TERMINAL = ''  # tokens are never empty, so '' can mark the end of a surname
+
+    def __init__(self, surnames: Iterable[str] = ()):
+        self._root = {}
+        for surname in surnames:
+            self.add(surname)
+
+    def add(self, surname: str):
+        node = self._root
+        for token in reversed(surname.split()):
+            node = node.setdefault(token.lower(), {})
+        node[self._TERMINAL] = True
+
+    def __contains__(self, surname: str) -> bool:
+        node = self._root
+        for token in reversed(surname.split()):
+            node = node.get(token.lower())
+            if node is None:
+                return False
+        return self._TERMINAL in node
+
+    def longest_suffix(self, tokens: Sequence[str], min_prefix: int = 1) -> int:
+        """
+        Number of trailing tokens that form the longest known surname.
+
+        At least ``min_prefix`` leading tokens are left for the given name.
+        Returns 0 when the name does not end in a known compound surname.
+        """
+        node = self._root
+        best = 0
+        for depth, i in enumerate(range(len(tokens) - 1, min_prefix - 1, -1), 1):
+            node = node.get(tokens[i].lower())
+            if node is None:
+                break
+            if self._TERMINAL in node:
+                best = depth
+        return best
+
+
+DEFAULT_SURNAMES = SurnameTrie(COMPOUND_SURNAMES)
+
+
+def split_name_tokens(tokens: Sequence[str], surnames: Optional[SurnameTrie] = None) -> Tuple[str, str, str]:
+    """Split name tokens into (first, middle, last), keeping compound surnames whole"""
+    if not tokens:
+        return '', '', ''
+    if len(tokens) == 1:
+        return tokens[0], '', ''
+    trie = surnames if surnames is not None else DEFAULT_SURNAMES
+    surname_len = trie.longest_suffix(tokens) or 1
+    cut = len(tokens) - surname_len
+    return tokens[0], ' '.join(tokens[1:cut]), ' '.join(tokens[cut:])
+
+
+def split_name(full_name: str, surnames: Optional[SurnameTrie] = None) -> Dict[str, str]:
+    """Parse a full name into first_name, middle_name and last_name, dropping titles"""
+    tokens = [t for t in full_name.split() if t.lower() not in TITLE_TOKENS]
+    first, middle, last = split_name_tokens(tokens, surnames)
+    return {'first_name': first, 'middle_name': middle, 'last_name': last}
+
+
+def load_surnames(path: str) -> List[str]:
+    """Read extra compound surnames from a text file, one per line ('#' comments allowed)"""
+    surnames = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if len(line.split()) > 1:
+                surnames.append(line)
+    return surnames
+
+
+def curated_surnames(paths: Iterable) -> List[str]:
+    """Multi-word Last Name values already recorded in alumni CSVs, in first-seen order"""
+    from .corpus import read_rows
+    surnames = {}
+    for path in paths:
+        for _, row in read_rows(path):
+            last = ' '.join(row['Last Name'].split())
+            if ' ' in last:
+                surnames.setdefault(last.lower(), last)
+    return list(surnames.values())
@@ -0,0 +1,112 @@
+"""
+OCR entry points.
+
+OCR goes through an ``OcrBackend`` (see backends.py); the default
+Tesseract backend imports cv2 and pytesseract when it is created, so
+importing this module (or running a CLI with --help) stays cheap.
+
+With a ``Deadline`` (see deadline.py) the page is still read in one pass
+when that pass fits; a pass that runs past its share of the budget is
+abandoned and the page is read band by band, so the bands read before
+time runs out still give records.
+"""
+
+from typing import Optional
+
+from .backends import OcrBackend, OcrTimeout, get_backend
+from .capabilities import LANGUAGE_NAMES, plan_passes
+from .deadline import FULL_PAGE_SHARE, Deadline, optional_stage
+from .profiling import Profiler, stage
+
+DEADLINE_BANDS = 4
+
+
+def read_bands(backend: OcrBackend, image, lang: str, psm: int, deadline: Deadline,
+               profiler: Optional[Profiler] = None) -> str:
+    """
+    OCR a page band by band until the deadline.
+
+    Bands that could not be read in time are recorded on the deadline as
+    unprocessed regions. Errors other than timeouts (e.g. a missing
+    language pack) are raised from the first band, as for a whole page.
+    """
+    bands = backend.split_bands(image, DEADLINE_BANDS)
+    texts = []
+    for i, (region, band) in enumerate(bands):
+        timeout = deadline.remaining()
+        try:
+            if timeout <= 0:
+                raise OcrTimeout("no time left")
+            with stage(profiler, f'ocr_{lang}', psm=psm, band=region['band']):
+                texts.append(backend.image_to_string(band, lang=lang, psm=psm, timeout=timeout))
+        except OcrTimeout:
+            print(f"⏱️ Deadline reached after {i} of {len(bands)} band(s)")
+            for unread, _ in bands[i:]:
+                deadline.mark_unprocessed(unread, 'timeout' if unread is region and timeout > 0 else 'deadline')
+            break
+    return '\n'.join(texts)
+
+
+def image_to_text(backend: OcrBackend, image, lang: str, psm: int,
+                  deadline: Optional[Deadline] = None, profiler: Optional[Profiler] = None) -> str:
+    """The whole page in one OCR call; band by band once a deadline puts that call at risk"""
+    if deadline is None:
+        with stage(profiler, f'ocr_{lang}', psm=psm):
+            return backend.image_to_string(image, lang=lang, psm=psm)
+    timeout = deadline.remaining() * FULL_PAGE_SHARE
+    if timeout > 0:
+        try:
+            with stage(profiler, f'ocr_{lang}', psm=psm):
+                return backend.image_to_string(image, lang=lang, psm=psm, timeout=timeout)
+        except OcrTimeout:
+            print(f"⏱️ Full-page OCR did not finish in {timeout:.1f}s; reading the page in bands")
+    return read_bands(backend, image, lang, psm, deadline, profiler)
+
+
+def read_page(backend: OcrBackend, image, use_bengali: bool = True, psm: int = 6,
+              deadline: Optional[Deadline] = None, profiler: Optional[Profiler] = None) -> str:
+    """
+    OCR a loaded page, trying Bengali first and falling back to English.
+
+    Only languages the backend is known to have are tried (see
+    capabilities.py), so a host without Bengali data goes straight to
+    English instead of failing a Bengali pass on every page.
+    """
+    passes = plan_passes(backend.languages(), use_bengali)
+    if not passes:
+        print("❌ No OCR language data available for this page (run with --doctor)")
+        return ""
+    for i, lang in enumerate(passes):
+        last = i == len(passes) - 1
+        # Every pass after the first is a second full read; not worth it when time is short
+        if i and not optional_stage(deadline, f'ocr_{lang}'):
+            return ""
+        try:
+            text = image_to_text(backend, image, lang, psm, deadline, profiler)
+        except Exception as e:
+            if last:
+                raise
+            print(f"⚠️ {LANGUAGE_NAMES[lang]} OCR failed: {e}")
+            print(f"🔄 Falling back to {LANGUAGE_NAMES[passes[i + 1]]} OCR...")
+            continue
+        if text.strip() or last or (deadline and deadline.partial):
+            print(f"✅ {LANGUAGE_NAMES[lang]} OCR successful")
+            return text
+    return ""
+
+
+def extract_text_from_image(image_path: str, use_bengali: bool = True, psm: int = 6,
+                            backend: Optional[OcrBackend] = None,
+                            profiler: Optional[Profiler] = None,
+                            deadline: Optional[Deadline] = None) -> str:
+    """Extract text from image using OCR"""
+    backend = backend or get_backend()
+
+    try:
+        with stage(profiler, 'decode'):
+            image = backend.load_image(image_path)
+        return read_page(backend, image, use_bengali, psm, deadline, profiler)
+
+    except Exception as e:
+        print(f"❌ Error extracting text from image: {e}")
+        return ""
@@ -0,0 +1,175 @@
+"""
+Parsing OCR text from register pages into alumni records.
+
+Looks for entries like ``57. Name (১৯৬৯)`` or ``58. ডাঃ Name (1951) (প্রয়াত)``,
+splitting lines that hold a left and a right column entry, and fills in
+the derived fields (name parts, placeholder email, notes) used for the
+CSV row.
+"""
+
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+from .line_split import split_side_by_side_records
+from .names import split_name
+from .records import AlumniRecord
+
+# Bengali numeral to English mapping
+BENGALI_NUMERALS = {
+    '০': '0', '১': '1', '২': '2', '৩': '3', '৪': '4',
+    '৫': '5', '৬': '6', '৭': '7', '৮': '8', '৯': '9'
+}
+
+# Bengali to English transliteration for common names (partial mapping)
+BENGALI_TO_ENGLISH_COMMON = {
+    'ডাঃ': 'Dr.', 'ডক্টর': 'Dr.',
+    'প্রয়াত': 'Deceased', 'মৃত': 'Deceased',
+    'কুমার': 'Kumar', 'চন্দ্র': 'Chandra',
+    'প্রসাদ': 'Prasad',
+}
+
+# Tesseract spells য় as য + nukta while these literals use the precomposed
+# letter; NFC maps both to the same sequence, so lines are compared in NFC.
+DECEASED_PATTERN = re.compile('|'.join(unicodedata.normalize('NFC', m) for m in ('প্রয়াত', 'মৃত')))
+
+def convert_bengali_year(bengali_year: str) -> str:
+    """Convert Bengali numerals to English year"""
+    if not bengali_year:
+        return ''
+    result = ''
+    for char in bengali_year:
+        if char in BENGALI_NUMERALS:
+            result += BENGALI_NUMERALS[char]
+        else:
+            result += char
+    return result.strip()
+
+def parse_alumni_from_text(text: str) -> List[AlumniRecord]:
+    """
+    Parse extracted text to find alumni records.
+    Looks for patterns like: number. Name (Year) or number. Name (Year) (প্রয়াত)
+    """
+    alumni_records = []
+    lines = text.split('\n')
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        
+        # Skip header lines or non-data lines
+        if len(line) < 5:
+            continue
+        
+        # A line may hold a left and a right column entry side by side
+        for segment in split_side_by_side_records(line):
+            record = parse_alumni_line(segment.text)
+            if record:
+                record.column = segment.column
+                alumni_records.append(record)
+    
+    return alumni_records
+
+def parse_alumni_line(line: str) -> Optional[AlumniRecord]:
+    """Parse a single register entry, or return None if it holds no name"""
+    # Try to extract entry number, name, and year
+    # Pattern: number. Name (Year) or number. Name (Year) (প্রয়াত)
+    # Pattern: number. ডাঃ Name (Year)
+    
+    line = unicodedata.normalize('NFC', line)
+    record = AlumniRecord(raw_text=line)
+    
+    # Extract entry number (digits or Bengali numerals at start)
+    # with its suffix (28 ka, 72ক, 72A), as line_split.ENTRY_ANCHOR_PATTERN reads it;
+    # a ক that starts a Bengali word (৭২ কমল) is part of the name
+    entry_match = re.match(r'^[\d০-৯]+(?:\s?(?:ka\b|ক(?![\wঀ-৿])|[A-Za-z]\b))?[।.]?\s*', line)
+    if entry_match:
+        entry_num = entry_match.group().strip('।. ')
+        record.entry_number = convert_bengali_year(entry_num) if any(c in entry_num for c in '০১২৩৪৫৬৭৮৯') else entry_num
+    
+    # Check for deceased indicator (প্রয়াত)
+    if DECEASED_PATTERN.search(line):
+        record.deceased = True
+    
+    # Check for title (ডাঃ, ডক্টর)
+    if 'ডাঃ' in line or 'ডক্টর' in line:
+        record.title = 'Dr.'
+    
+    # Extract year - look for 4-digit year in parentheses or Bengali numerals
+    year_patterns = [
+        r'\((\d{4})\)',  # English year in parentheses: (1969)
+        r'\(([০-৯]{4})\)',  # Bengali year in parentheses
+        r'([১৯|২০][০-৯]{2})',  # Bengali year pattern
+    ]
+    
+    # Search after the entry number so that an entry like ১৯৫ is not read as a year
+    year_text = line[entry_match.end():] if entry_match else line
+    for pattern in year_patterns:
+        year_match = re.search(pattern, year_text)
+        if year_match:
+            year_str = year_match.group(1)
+            record.year = convert_bengali_year(year_str) if any(c in year_str for c in '০১২৩৪৫৬৭৮৯') else year_str
+            break
+    
+    # Extract name - everything between entry number and year
+    # Remove entry number, title, year, and deceased markers
+    name_line = line
+    if entry_match:
+        name_line = name_line[entry_match.end():]
+    
+    # Remove title
+    name_line = re.sub(r'ডাঃ\s*|ডক্টর\s*', '', name_line)
+    
+    # Remove year in parentheses
+    name_line = re.sub(r'\([^)]+\)', '', name_line)
+    
+    # Remove deceased markers
+    name_line = DECEASED_PATTERN.sub('', name_line)
+    
+    # Clean up name
+    name_line = name_line.strip('।. ()-')
+    record.name = name_line.strip()
+    
+    # Only keep if we have a name
+    if record.name and len(record.name) > 2:
+        return record
+    return None
+
+def parse_name(full_name: str, title: str = '') -> Dict[str, str]:
+    """Parse full name into First, Middle, Last name components"""
+    # Compound surnames such as "Ghosh Dastidar" stay together in Last Name
+    return split_name(full_name)
+
+def generate_email(first_name: str, last_name: str, year: str = '') -> str:
+    """Generate placeholder email address"""
+    if not first_name or not last_name:
+        return ''
+    
+    first_lower = re.sub(r'[^a-zA-Z]', '', first_name.lower())
+    last_lower = re.sub(r'[^a-zA-Z]', '', last_name.lower())
+    
+    if year:
+        return f"{first_lower}.{last_lower}.{year}@bghs-alumni.com"
+    else:
+        return f"{first_lower}.{last_lower}@bghs-alumni.com"
+
+def fill_record_fields(record: AlumniRecord) -> AlumniRecord:
+    """Fill name parts, email and notes on a parsed record"""
+    record.split_name()
+    record.email = generate_email(record.first_name, record.last_name, record.year)
+    
+    # Build notes
+    notes_parts = []
+    if record.title:
+        notes_parts.append(f"Title: {record.title}")
+    if record.deceased:
+        notes_parts.append("Deceased (প্রয়াত)")
+    if record.entry_number:
+        notes_parts.append(f"Entry #: {record.entry_number}")
+    if not record.year:
+        notes_parts.append("Year of Leaving: Not specified")
+    if record.notes:
+        notes_parts.append(record.notes)
+    record.notes = '; '.join(notes_parts)
+    return record
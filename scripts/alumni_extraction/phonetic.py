@@ -0,0 +1,338 @@
+"""
+Phonetic keys for Bengali names written in Latin or Bengali script.
+
+Soundex and Metaphone were built for English names and keep apart
+spellings that are one name in Bengali transliteration. This encoder
+puts these pairs under one key:
+
+  Chattopadhyay / Chatterjee     Bandyopadhyay / Banerjee
+  Roychowdhury / Raychaudhuri    Sarkar / Sircar
+  Majumdar / Mazumdar            Devbhuti / Debbhuti
+  Bhattacharya / Bhattacharjee   চট্টোপাধ্যায় / Chatterjee
+
+A name is encoded in two steps:
+
+1. Text rules, once per distinct name. Bengali script is transliterated
+   (with the inherent vowel), then case, punctuation and spaces are
+   dropped (so Roy Chowdhury = Roychowdhury). Whole tokens are rewritten
+   from ``TOKEN_EQUIVALENTS`` and endings from ``SUFFIX_RULES``.
+2. Letter rules, as lookup tables over a whole column at once. Each
+   letter maps to a sound class (``LETTER_CLASSES``). The digraphs kh,
+   gh, th, dh, bh and ph fold into their consonant, and ch/c, w/v/b,
+   j/z are folded too. Repeats collapse, and vowels are dropped after
+   the first letter.
+
+A key is at most ``MAX_CODES`` classes, packed five bits each into a
+uint64 (``encode_batch``), or spelled out as a string (``encode``):
+
+  >>> encode('Chattopadhyay'), encode('Chatterjee')
+  ('CTRJ', 'CTRJ')
+
+``encode_batch`` encodes a column (list or array of names) with numpy.
+Names repeat a lot in a register, so each distinct name is encoded once:
+case folding runs over the joined column, only names with several tokens
+or a rule ending take the per-name path, and the letter rules are array
+operations with one step per letter position.
+``benchmarks/bench_phonetic.py`` measures its throughput.
+"""
+
+import unicodedata
+from typing import Dict, Iterable, List, Sequence
+
+# Sound classes, in key order. 'A' stands for any vowel starting a name.
+CLASSES = 'ABCDGHJKLMNPRSTY'
+CODE_BITS = 5
+MAX_CODES = 12
+# Letters kept per name for the array step; more never give more codes
+WIDTH = 32
+
+LETTER_CLASSES = {
+    'b': 'B', 'v': 'B', 'w': 'B',
+    'c': 'K', 'k': 'K', 'q': 'K', 'x': 'K',
+    'd': 'D',
+    'f': 'P', 'p': 'P',
+    'g': 'G',
+    'h': 'H',
+    'j': 'J', 'z': 'J',
+    'l': 'L',
+    'm': 'M',
+    'n': 'N',
+    'r': 'R',
+    's': 'S',
+    't': 'T',
+    'y': 'Y',
+}
+VOWELS = 'aeiou'
+# h after these is part of the consonant (kh, chh, dh, sh, ...)
+SILENT_H_AFTER = 'bcdghjkpst'
+
+# Spellings no letter rule can relate
+TOKEN_EQUIVALENTS = {
+    'bandyopadhyay': 'banerjee',
+    'bandyopadhyaya': 'banerjee',
+    'bandopadhyay': 'banerjee',
+    'gangopadhyay': 'ganguly',
+    'gangopadhyaya': 'ganguly',
+}
+
+# Sanskritized endings and their anglicized forms, longest first
+# (Chattopadhyay -> Chatterjee, Bhattacharya -> Bhattacharjee)
+SUFFIX_RULES = (
+    ('opadhyaya', 'erjee'),
+    ('opadhyay', 'erjee'),
+    ('aryya', 'arjee'),
+    ('aryy', 'arjee'),
+    ('arya', 'arjee'),
+)
+
+# Bengali script, transliterated as in the curated CSVs
+BENGALI_CONSONANTS = {
+    'ক': 'k', 'খ': 'kh', 'গ': 'g', 'ঘ': 'gh', 'ঙ': 'n',  # ঙ্গ = ng
+    'চ': 'ch', 'ছ': 'chh', 'জ': 'j', 'ঝ': 'jh', 'ঞ': 'n',
+    'ট': 't', 'ঠ': 'th', 'ড': 'd', 'ঢ': 'dh', 'ণ': 'n',
+    'ত': 't', 'থ': 'th', 'দ': 'd', 'ধ': 'dh', 'ন': 'n',
+    'প': 'p', 'ফ': 'ph', 'ব': 'b', 'ভ': 'bh', 'ম': 'm',
+    'য': 'j', 'র': 'r', 'ল': 'l', 'শ': 'sh', 'ষ': 'sh',
+    'স': 's', 'হ': 'h', 'ড়': 'r', 'ঢ়': 'r', 'য়': 'y',
+}
+# Consonants written with a nukta (ড + ় is how NFC text stores ড়)
+BENGALI_NUKTA = {'ড': 'r', 'ঢ': 'r', 'য': 'y'}
+BENGALI_VOWELS = {
+    'অ': 'a', 'আ': 'a', 'ই': 'i', 'ঈ': 'i', 'উ': 'u', 'ঊ': 'u', 'ঋ': 'ri',
+    'এ': 'e', 'ঐ': 'oi', 'ও': 'o', 'ঔ': 'ou',
+}
+BENGALI_VOWEL_SIGNS = {
+    'া': 'a', 'ি': 'i', 'ী': 'i', 'ু': 'u', 'ূ': 'u', 'ৃ': 'ri',
+    'ে': 'e', 'ৈ': 'oi', 'ো': 'o', 'ৌ': 'ou',
+}
+BENGALI_MARKS = {'ং': 'ng', 'ঃ': 'h', 'ঁ': '', 'ৎ': 't'}
+VIRAMA = '্'
+NUKTA = '়'
+
+_VOWEL = 31  # array code of a vowel after the first letter (dropped)
+
+
+def transliterate_bengali(text: str) -> str:
+    """Latin letters for Bengali script, with the inherent 'a' between consonants"""
+    text = unicodedata.normalize('NFC', text)
+    out = []
+    i = 0
+    after_virama = False
+    while i < len(text):
+        char = text[i]
+        if char in BENGALI_CONSONANTS:
+            letters = BENGALI_CONSONANTS[char]
+            if i + 1 < len(text) and text[i + 1] == NUKTA:
+                letters = BENGALI_NUKTA.get(char, letters)
+                i += 1
+            elif char == 'য' and after_virama:
+                letters = 'y'  # ya-phala: ধ্য = dhy
+            out.append(letters)
+            following = text[i + 1] if i + 1 < len(text) else ''
+            # Inherent vowel, except before a vowel sign or virama and at the end of a word
+            if following in BENGALI_CONSONANTS:
+                out.append('a')
+            after_virama = False
+        elif char in BENGALI_VOWEL_SIGNS:
+            out.append(BENGALI_VOWEL_SIGNS[char])
+        elif char in BENGALI_VOWELS:
+            out.append(BENGALI_VOWELS[char])
+        elif char in BENGALI_MARKS:
+            out.append(BENGALI_MARKS[char])
+        elif char == VIRAMA:
+            after_virama = True
+        else:
+            out.append(char)
+        i += 1
+    return ''.join(out)
+
+
+# bytes.translate arguments: fold case (and other whitespace to spaces), delete
+# everything but letters and whitespace
+_LOWER = bytes.maketrans(bytes(range(ord('A'), ord('Z') + 1)) + b'\t\r\x0b\x0c',
+                         bytes(range(ord('a'), ord('z') + 1)) + b'    ')
+_NON_LETTERS = bytes(code for code in range(256) if not (chr(code).isalpha() and code < 128 or chr(code).isspace()))
+_TOKEN_EQUIVALENTS = {token.encode(): equivalent.encode() for token, equivalent in TOKEN_EQUIVALENTS.items()}
+_SUFFIX_RULES = tuple((ending.encode(), replacement.encode()) for ending, replacement in SUFFIX_RULES)
+_ENDINGS = tuple(ending for ending, _ in _SUFFIX_RULES)
+
+
+def _prepare_token(token: bytes) -> bytes:
+    token = _TOKEN_EQUIVALENTS.get(token, token)
+    if token.endswith(_ENDINGS):
+        for ending, replacement in _SUFFIX_RULES:
+            if token.endswith(ending):
+                return token[:-len(ending)] + replacement
+    return token
+
+
+def _to_ascii(name: str) -> str:
+    return transliterate_bengali(name).encode('ascii', 'ignore').decode()
+
+
+def prepare_bytes(name: str) -> bytes:
+    """Step 1 as ASCII bytes (what the array step reads)"""
+    if not name.isascii():
+        name = _to_ascii(name)
+    tokens = name.encode().translate(_LOWER, _NON_LETTERS).split()
+    if len(tokens) == 1:
+        return _prepare_token(tokens[0])[:WIDTH]
+    return b''.join(map(_prepare_token, tokens))[:WIDTH]
+
+
+def prepare(name: str) -> str:
+    """Step 1: the name as lower-case ASCII letters after the token and suffix rules"""
+    return prepare_bytes(name).decode()
+
+
+_SPECIAL_LINE = None
+
+
+def prepare_column(names: List[str]) -> List[bytes]:
+    """
+    ``prepare_bytes`` for many names.
+
+    Bengali script is transliterated first, then case folding and
+    character deletion run once over the joined column. One regex scan
+    finds the names with several tokens or a rule ending, and only those
+    go through ``prepare_bytes`` one by one.
+    """
+    import re
+    import numpy as np
+    global _SPECIAL_LINE
+    if _SPECIAL_LINE is None:
+        alternatives = b'|'.join(re.escape(word) for word in (*_TOKEN_EQUIVALENTS, *_ENDINGS))
+        _SPECIAL_LINE = re.compile(rb'^(?:[^\n]* [^\n]*|[^\n]*(?:' + alternatives + rb'))$', re.MULTILINE)
+
+    names = [name if name.isascii() else _to_ascii(name) for name in names]
+    blob = '\n'.join(names).encode()
+    if blob.count(b'\n') != len(names) - 1:
+        return [prepare_bytes(name) for name in names]
+    folded = blob.translate(_LOWER, _NON_LETTERS)
+    lines = folded.split(b'\n')
+    newlines = np.flatnonzero(np.frombuffer(folded, dtype=np.uint8) == ord('\n'))
+    for match in _SPECIAL_LINE.finditer(folded):
+        i = int(np.searchsorted(newlines, match.start()))
+        lines[i] = prepare_bytes(names[i])
+    return lines
+
+
+def _letter_code(letters: str, i: int) -> str:
+    """Sound class of letters[i]: a CLASSES letter, '' when silent, '*' for a vowel"""
+    char = letters[i]
+    prev = letters[i - 1] if i else ''
+    if char in VOWELS or (i and char == 'y') or (char == 'w' and prev and prev in VOWELS):
+        return 'A' if i == 0 else '*'
+    if char == 'h' and prev and prev in SILENT_H_AFTER:
+        return ''
+    if char == 's' and prev in ('k', 'x'):
+        return ''
+    if char == 'c' and letters[i + 1:i + 2] == 'h':
+        return 'C'
+    return LETTER_CLASSES.get(char, '')
+
+
+def encode(name: str) -> str:
+    """Phonetic key of one name, e.g. 'CTRJ' for Chatterjee"""
+    letters = prepare(name)
+    codes = []
+    for i in range(len(letters)):
+        code = _letter_code(letters, i)
+        if code and (not codes or codes[-1] != code):
+            codes.append(code)
+    return ''.join(code for code in codes if code != '*')[:MAX_CODES]
+
+
+def key_to_code(key: int) -> str:
+    """The string form (as from ``encode``) of a packed key"""
+    codes = []
+    for i in range(MAX_CODES):
+        value = (int(key) >> (CODE_BITS * (MAX_CODES - 1 - i))) & ((1 << CODE_BITS) - 1)
+        if value:
+            codes.append(CLASSES[value - 1])
+    return ''.join(codes)
+
+
+def _tables():
+    """Lookup tables indexed by byte value, built on first use"""
+    import numpy as np
+    classes = np.zeros(256, dtype=np.uint8)
+    for char, code in LETTER_CLASSES.items():
+        classes[ord(char)] = CLASSES.index(code) + 1
+    # y is a vowel except at the start of a name (fixed up in encode_letters)
+    for char in VOWELS + 'y':
+        classes[ord(char)] = _VOWEL
+    is_vowel = np.zeros(256, dtype=bool)
+    is_vowel[[ord(char) for char in VOWELS]] = True
+    silent_h_after = np.zeros(256, dtype=bool)
+    silent_h_after[[ord(char) for char in SILENT_H_AFTER]] = True
+    return classes, is_vowel, silent_h_after
+
+
+_TABLES = None
+
+
+def encode_letters(letters):
+    """
+    Step 2 for a (names x letters) uint8 array of prepared names (zero padded).
+
+    Returns one uint64 key per row.
+    """
+    import numpy as np
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = _tables()
+    classes, is_vowel, silent_h_after = _TABLES
+
+    prev = np.zeros_like(letters)
+    prev[:, 1:] = letters[:, :-1]
+    codes = classes[letters]
+    c_before_h = letters == ord('c')
+    c_before_h[:, :-1] &= letters[:, 1:] == ord('h')
+    c_before_h[:, -1:] = False
+    np.putmask(codes, c_before_h, CLASSES.index('C') + 1)
+    np.putmask(codes, (letters == ord('h')) & silent_h_after[prev], 0)
+    np.putmask(codes, (letters == ord('s')) & ((prev == ord('k')) | (prev == ord('x'))), 0)
+    np.putmask(codes, (letters == ord('w')) & is_vowel[prev], _VOWEL)
+    if codes.shape[1]:
+        first = codes[:, 0]
+        np.putmask(first, letters[:, 0] == ord('y'), CLASSES.index('Y') + 1)
+        np.putmask(first, first == _VOWEL, CLASSES.index('A') + 1)
+
+    # Column by column: a code repeating the last sounded letter collapses into
+    # it, vowels only separate repeats, and the first MAX_CODES codes are packed
+    # CODE_BITS each, first code highest
+    rows = len(codes)
+    keys = np.zeros(rows, dtype=np.uint64)
+    count = np.zeros(rows, dtype=np.uint64)
+    last = np.zeros(rows, dtype=np.uint8)
+    for column in np.ascontiguousarray(codes.T):
+        sounded = column != 0
+        take = sounded & (column != last) & (column != _VOWEL) & (count < MAX_CODES)
+        np.putmask(keys, take, (keys << np.uint64(CODE_BITS)) | column)
+        count += take
+        np.putmask(last, sounded, column)
+    return keys << ((np.uint64(MAX_CODES) - count) * np.uint64(CODE_BITS))
+
+
+def encode_batch(names: Iterable[str]):
+    """
+    Packed phonetic keys (uint64 numpy array) for a column of names.
+
+    Equal names are encoded once; ``key_to_code`` turns a key back into
+    the string ``encode`` gives.
+    """
+    import numpy as np
+    distinct: Dict[str, int] = {}
+    inverse = np.fromiter((distinct.setdefault(name, len(distinct)) for name in names), dtype=np.intp)
+    prepared = prepare_column(list(distinct)) or [b'']
+    width = min(max(map(len, prepared)), WIDTH) or 1
+    letters = np.array(prepared, dtype=f'S{width}').view(np.uint8).reshape(len(prepared), width)
+    return encode_letters(letters)[inverse]
+
+
+def encode_many(names: Sequence[str]) -> List[str]:
+    """String keys for a column of names (``encode_batch`` plus ``key_to_code``)"""
+    keys = encode_batch(names)
+    codes = {key: key_to_code(key) for key in set(keys.tolist())}
+    return [codes[key] for key in keys.tolist()]
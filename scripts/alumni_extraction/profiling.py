@@ -0,0 +1,285 @@
+"""
+Per-stage timing for the extraction pipeline.
+
+Wrap each stage in ``stage(profiler, name)``; with a ``Profiler`` it records
+wall time, CPU time (this process and, separately, finished child
+processes such as Tesseract) and peak RSS, and with ``None`` it costs
+nothing. A profiler created with a path rewrites its JSON file after every
+stage and marks the stage in progress, so when the admin route kills a
+run at its timeout the file still shows where the time went:
+
+  {
+    "label": "57-86.png",
+    "running": "ocr_ben",
+    "stages": [{"stage": "decode", "wall_s": 0.041, "cpu_s": 0.038,
+                "child_cpu_s": 0.0, "peak_rss_mb": 61.2, "child_peak_rss_mb": 0.0}, ...],
+    "total": {...}
+  }
+
+Peak RSS comes from ``resource.getrusage`` and is the process peak so far,
+so it only grows from one stage to the next; it is reported as null on
+platforms without the resource module.
+
+``--memory-report out.json`` attaches a ``MemoryTracker``, which traces
+Python allocations (including numpy arrays) with tracemalloc. It adds the
+traced size after each stage and the peak during it, records the traced
+size after each image of a batch, and lists the top allocation sites at
+the end plus the growth since the first image. Memory that keeps growing
+from image to image shows up in that growth list.
+"""
+
+import contextlib
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# ru_maxrss is in kilobytes on Linux and bytes on macOS
+_RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+def peak_rss_mb(who: str = 'self') -> Optional[float]:
+    """Peak resident set size in MiB of this process ('self') or its finished children"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == 'self' else resource.RUSAGE_CHILDREN)
+    return round(usage.ru_maxrss * _RSS_UNIT / 2**20, 1)
+
+
+def _mb(size: int) -> float:
+    return round(size / 2**20, 2)
+
+
+class MemoryTracker:
+    """tracemalloc-based allocation report per stage and per image"""
+
+    def __init__(self, top: int = 10, frames: int = 1):
+        import tracemalloc
+        self._tracemalloc = tracemalloc
+        self.top = top
+        self.images: List[Dict] = []
+        self.peak = 0
+        self._first_image = None
+        tracemalloc.start(frames)
+
+    def stage_start(self):
+        self._tracemalloc.reset_peak()
+
+    def stage_end(self) -> Dict:
+        current, peak = self._tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        return {'traced_mb': _mb(current), 'traced_peak_mb': _mb(peak)}
+
+    def image_done(self, image: str):
+        """Record what is still allocated once an image has been processed"""
+        current, peak = self._tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        self.images.append({'image': image, 'traced_mb': _mb(current)})
+        if self._first_image is None:
+            self._first_image = self._tracemalloc.take_snapshot()
+
+    @staticmethod
+    def _sites(stats) -> List[Dict]:
+        sites = []
+        for stat in stats:
+            frame = stat.traceback[0]
+            sites.append({
+                'site': f"{frame.filename}:{frame.lineno}",
+                'size_mb': _mb(stat.size),
+                'count': stat.count,
+                'size_diff_mb': _mb(getattr(stat, 'size_diff', 0)),
+            })
+        return sites
+
+    def report(self) -> Dict:
+        snapshot = self._tracemalloc.take_snapshot().filter_traces((
+            self._tracemalloc.Filter(False, self._tracemalloc.__file__),
+            self._tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ))
+        current, peak = self._tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        report = {
+            'traced_mb': _mb(current),
+            'peak_traced_mb': _mb(self.peak),
+            'images': self.images,
+            'top_allocations': self._sites(snapshot.statistics('lineno')[:self.top]),
+        }
+        if self._first_image is not None:
+            growth = [s for s in snapshot.compare_to(self._first_image, 'lineno') if s.size_diff > 0]
+            report['growth_since_first_image'] = self._sites(growth[:self.top])
+        return report
+
+    def stop(self):
+        self._tracemalloc.stop()
+
+    def format_lines(self, report: Dict) -> List[str]:
+        lines = [f"🧠 Traced memory: {report['traced_mb']:.1f} MiB now, {report['peak_traced_mb']:.1f} MiB peak"]
+        if len(report['images']) > 1:
+            sizes = [image['traced_mb'] for image in report['images']]
+            lines.append(f"   after each image: first {sizes[0]:.1f} MiB, last {sizes[-1]:.1f} MiB, "
+                         f"max {max(sizes):.1f} MiB")
+        lines.append("   top allocation sites:")
+        for site in report['top_allocations'][:5]:
+            lines.append(f"     {site['size_mb']:>8.2f} MiB  {site['count']:>7} blocks  {site['site']}")
+        return lines
+
+
+class Profiler:
+    """
+    Collects one entry per stage run, in order.
+
+    ``labels`` are copied into every entry recorded while they are set;
+    the batch extractor sets ``labels['image']`` for each image.
+    """
+
+    def __init__(self, path: Optional[str] = None, label: str = '',
+                 memory: Optional[MemoryTracker] = None):
+        self.path = path
+        self.label = label
+        self.memory = memory
+        self.labels: Dict = {}
+        self.stages: List[Dict] = []
+        self.running: Optional[str] = None
+        self._start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def stage(self, name: str, **labels):
+        self.running = name
+        self._flush()
+        if self.memory:
+            self.memory.stage_start()
+        times = os.times()
+        wall = time.perf_counter()
+        try:
+            yield
+        finally:
+            after = os.times()
+            entry = {
+                'stage': name,
+                'wall_s': round(time.perf_counter() - wall, 4),
+                'cpu_s': round((after.user - times.user) + (after.system - times.system), 4),
+                'child_cpu_s': round((after.children_user - times.children_user)
+                                     + (after.children_system - times.children_system), 4),
+                'peak_rss_mb': peak_rss_mb('self'),
+                'child_peak_rss_mb': peak_rss_mb('children'),
+            }
+            if self.memory:
+                entry.update(self.memory.stage_end())
+            entry.update(self.labels)
+            entry.update(labels)
+            self.stages.append(entry)
+            self.running = None
+            self._flush()
+
+    def totals(self) -> Dict:
+        """Summed time per stage name, in first-seen order"""
+        by_stage = {}
+        for entry in self.stages:
+            total = by_stage.setdefault(entry['stage'], {'runs': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'child_cpu_s': 0.0})
+            total['runs'] += 1
+            for key in ('wall_s', 'cpu_s', 'child_cpu_s'):
+                total[key] = round(total[key] + entry[key], 4)
+        return by_stage
+
+    def to_dict(self) -> Dict:
+        return {
+            'label': self.label,
+            'running': self.running,
+            'stages': self.stages,
+            'by_stage': self.totals(),
+            'total': {
+                'wall_s': round(time.perf_counter() - self._start, 4),
+                'peak_rss_mb': peak_rss_mb('self'),
+                'child_peak_rss_mb': peak_rss_mb('children'),
+            },
+        }
+
+    def _flush(self):
+        if not self.path:
+            return
+        import json
+        # Write then rename, so a reader never sees a half-written file
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def format_lines(self) -> List[str]:
+        """Human-readable breakdown for console output"""
+        lines = [f"⏱️ {'stage':<14} {'runs':>4} {'wall s':>8} {'cpu s':>8} {'child cpu s':>12}"]
+        for name, total in self.totals().items():
+            lines.append(f"   {name:<14} {total['runs']:>4} {total['wall_s']:>8.3f} "
+                         f"{total['cpu_s']:>8.3f} {total['child_cpu_s']:>12.3f}")
+        rss = peak_rss_mb('self')
+        if rss is not None:
+            lines.append(f"   peak RSS {rss:.1f} MiB (child processes {peak_rss_mb('children'):.1f} MiB)")
+        return lines
+
+
+def stage(profiler: Optional[Profiler], name: str, **labels):
+    """``profiler.stage(name)``, or a no-op context when profiling is off"""
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(name, **labels)
+
+
+def add_profile_arguments(parser):
+    """Add --profile / --cprofile / --memory-report to a CLI parser"""
+    parser.add_argument('--profile', metavar='JSON',
+                        help='Write per-stage wall time, CPU time and peak RSS to JSON (updated after each stage)')
+    parser.add_argument('--cprofile', metavar='PSTATS',
+                        help='Also dump cProfile statistics of the run (view with python -m pstats)')
+    parser.add_argument('--memory-report', metavar='JSON',
+                        help='Trace allocations with tracemalloc and write a per-stage/per-image report to JSON')
+
+
+def profiler_from_args(args, label: str, timings: bool = False) -> Optional[Profiler]:
+    """The Profiler the CLI options ask for, or None; ``timings`` forces one (e.g. for --debug)"""
+    if not (args.profile or args.memory_report or timings):
+        return None
+    memory = MemoryTracker() if args.memory_report else None
+    return Profiler(args.profile, label=label, memory=memory)
+
+
+def finish_profile(profiler: Optional[Profiler], args, timings: bool = False):
+    """Print the breakdown and write the memory report, at the end of a CLI run"""
+    if profiler is None:
+        return
+    if args.profile or timings:
+        print()
+        for line in profiler.format_lines():
+            print(line)
+        if args.profile:
+            print(f"💾 Stage timings written to {args.profile}")
+    if profiler.memory:
+        import json
+        report = profiler.memory.report()
+        report['stages'] = [
+            {key: entry.get(key) for key in ('stage', 'image', 'traced_mb', 'traced_peak_mb') if key in entry}
+            for entry in profiler.stages
+        ]
+        profiler.memory.stop()
+        with open(args.memory_report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print()
+        for line in profiler.memory.format_lines(report):
+            print(line)
+        print(f"💾 Memory report written to {args.memory_report}")
+
+
+def run_profiled(main: Callable[[], None], pstats_path: Optional[str]):
+    """Run ``main``, under cProfile when ``pstats_path`` is given"""
+    if not pstats_path:
+        return main()
+    import cProfile
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(main)
+    finally:
+        profile.dump_stats(pstats_path)
+        print(f"📈 cProfile statistics written to {pstats_path}")
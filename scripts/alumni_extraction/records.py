@@ -0,0 +1,143 @@
+"""
+Compact record types shared by the extractors.
+
+``AlumniRecord`` holds one register entry from parsing through to the CSV
+row. It uses ``__slots__`` so a full-register batch does not pay for a
+per-record ``__dict__``, and the name splitter and email generator fill in
+its fields in place instead of building a second dict per row.
+
+``RecordBatch`` stores many records column-wise (one list per field),
+which is what the CSV writers and any DataFrame conversion want anyway.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .names import SurnameTrie, split_name_tokens, TITLE_TOKENS
+
+
+class AlumniRecord:
+    """One alumni register entry"""
+
+    __slots__ = (
+        'entry_number',         # as printed in the register, e.g. '57', '28 ka'
+        'entry_number_read',    # OCR reading when the sequence repair changed it
+        'name',                 # full name as parsed, without title
+        'year',                 # year of leaving
+        'title',                # 'Dr.', 'Prof.' or ''
+        'deceased',
+        'column',               # 'left', 'right' or '' (see line_split)
+        'raw_text',
+        'first_name',
+        'middle_name',
+        'last_name',
+        'email',
+        'registration_number',  # BGHSA-YYYY-NNNNN
+        'notes',
+    )
+
+    FIELDS = __slots__
+
+    def __init__(self, entry_number: str = '', name: str = '', year: str = '', title: str = '',
+                 deceased: bool = False, column: str = '', raw_text: str = '',
+                 first_name: str = '', middle_name: str = '', last_name: str = '',
+                 email: str = '', registration_number: str = '', notes: str = '',
+                 entry_number_read: str = ''):
+        self.entry_number = entry_number
+        self.entry_number_read = entry_number_read
+        self.name = name
+        self.year = year
+        self.title = title
+        self.deceased = deceased
+        self.column = column
+        self.raw_text = raw_text
+        self.first_name = first_name
+        self.middle_name = middle_name
+        self.last_name = last_name
+        self.email = email
+        self.registration_number = registration_number
+        self.notes = notes
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'AlumniRecord':
+        return cls(**{key: value for key, value in data.items() if key in cls.FIELDS})
+
+    def to_dict(self) -> Dict:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    # Mapping-style access so code written against the old per-row dicts
+    # (record.get('year'), record['notes'] = ...) keeps working.
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __eq__(self, other):
+        if not isinstance(other, AlumniRecord):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.FIELDS)
+
+    def __repr__(self):
+        return (f"AlumniRecord(entry_number={self.entry_number!r}, name={self.name!r}, "
+                f"year={self.year!r}, title={self.title!r}, deceased={self.deceased!r})")
+
+    def split_name(self, surnames: Optional[SurnameTrie] = None):
+        """Fill first/middle/last name from the full name"""
+        tokens = [t for t in self.name.split() if t.lower() not in TITLE_TOKENS]
+        self.first_name, self.middle_name, self.last_name = split_name_tokens(tokens, surnames)
+
+
+class RecordBatch:
+    """Column-wise container for many records (one list per field)"""
+
+    __slots__ = ('_columns', '_length')
+
+    def __init__(self, fields: Iterable[str] = AlumniRecord.FIELDS):
+        self._columns = {field: [] for field in fields}
+        self._length = 0
+
+    @classmethod
+    def from_records(cls, records: Iterable[AlumniRecord]) -> 'RecordBatch':
+        batch = cls()
+        for record in records:
+            batch.append(record)
+        return batch
+
+    def append(self, record: AlumniRecord):
+        for field, values in self._columns.items():
+            values.append(getattr(record, field))
+        self._length += 1
+
+    def extend(self, records: Iterable[AlumniRecord]):
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, field: str) -> list:
+        return self._columns[field]
+
+    def record(self, index: int) -> AlumniRecord:
+        return AlumniRecord(**{field: values[index] for field, values in self._columns.items()})
+
+    def __iter__(self) -> Iterator[AlumniRecord]:
+        for i in range(self._length):
+            yield self.record(i)
+
+    def to_columns(self) -> Dict[str, list]:
+        """The underlying columns, e.g. for pandas.DataFrame(batch.to_columns())"""
+        return self._columns
@@ -0,0 +1,314 @@
+"""
+Registration ids for migrated alumni.
+
+The printed register numbers entries sequentially, with the occasional
+late entry squeezed in under a suffixed number: ``28 ka`` (২৮ক), ``72ক``,
+``72A``. Each entry gets its own ``BGHSA-YYYY-NNNNN`` id, so ``28`` and
+``28 ka`` must never collapse onto the same number.
+
+``OldRegistrationNumber`` parses the register number with its suffix and
+sorts the way the register does (28 < 28 ka < 28 kha < 29).
+``registration_numbers_in_order`` numbers a known set of entries in that
+order, and ``RegistrationAllocator`` hands out ids from a persistent,
+lock-protected sequence store so parallel batch workers never collide.
+``open_allocator`` seeds the store with the ids already issued in the
+committed range CSVs (``issued_registrations``), so a re-extracted entry
+keeps its id and new entries are numbered after the highest one.
+"""
+
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+REGISTRATION_PREFIX = 'BGHSA'
+DEFAULT_REGISTRATION_YEAR = 2025
+
+NEW_REGISTRATION_PATTERN = re.compile(r'^BGHSA-(\d{4})-(\d{5})$')
+
+OLD_REGISTRATION_PATTERN = re.compile(r'^\s*([\d০-৯]+)\s*[-.]?\s*([^\d\s.।)]*)\s*[.।)]?\s*$')
+
+BENGALI_DIGITS = str.maketrans('০১২৩৪৫৬৭৮৯', '0123456789')
+
+# Suffix spellings seen in the register and the curated CSVs, by rank
+SUFFIX_SPELLINGS = {
+    1: ('ka', 'ক', 'a'),
+    2: ('kha', 'খ', 'b'),
+    3: ('ga', 'গ', 'c'),
+    4: ('gha', 'ঘ', 'd'),
+}
+SUFFIX_RANKS = {spelling: rank for rank, spellings in SUFFIX_SPELLINGS.items() for spelling in spellings}
+
+DEFAULT_SEQUENCE_STORE = Path(__file__).resolve().parent.parent / '.registration-sequence.sqlite3'
+
+
+class OldRegistrationNumber(NamedTuple):
+    """A register entry number such as 28, 28 ka or 72ক, ordered as in the register"""
+    number: int
+    suffix_rank: int = 0
+
+    @classmethod
+    def parse(cls, raw) -> 'OldRegistrationNumber':
+        """Parse '28', '28 ka', '২৮ক', '72A' or an int; raises ValueError otherwise"""
+        if isinstance(raw, int):
+            return cls(raw, 0)
+        match = OLD_REGISTRATION_PATTERN.match(str(raw))
+        if not match:
+            raise ValueError(f"Invalid registration number: {raw!r}")
+        number = int(match.group(1).translate(BENGALI_DIGITS))
+        suffix = match.group(2).lower()
+        if not suffix:
+            return cls(number, 0)
+        if suffix not in SUFFIX_RANKS:
+            raise ValueError(f"Unknown registration number suffix in {raw!r}")
+        return cls(number, SUFFIX_RANKS[suffix])
+
+    @property
+    def suffix(self) -> str:
+        return SUFFIX_SPELLINGS[self.suffix_rank][0] if self.suffix_rank else ''
+
+    @property
+    def key(self) -> str:
+        """Canonical spelling, used as the store key: '28' or '28 ka'"""
+        return f"{self.number} {self.suffix}" if self.suffix_rank else str(self.number)
+
+    def __str__(self) -> str:
+        return self.key
+
+
+def format_registration_number(sequence: int, year: int = DEFAULT_REGISTRATION_YEAR) -> str:
+    """Format a sequence number as BGHSA-YYYY-NNNNN"""
+    return f"{REGISTRATION_PREFIX}-{year}-{sequence:05d}"
+
+
+def parse_registration_number(value: str) -> Optional[tuple]:
+    """Split BGHSA-YYYY-NNNNN into (year, sequence), or None if malformed"""
+    match = NEW_REGISTRATION_PATTERN.match((value or '').strip())
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def registration_numbers_in_order(old_numbers: Iterable, start: int = 1,
+                                  year: int = DEFAULT_REGISTRATION_YEAR) -> Dict[str, str]:
+    """
+    Number a known set of register entries consecutively in register order.
+
+    Returns a mapping from each old number as given to its new id. For a
+    register starting at 1 this gives 28 → ...00028, 28 ka → ...00029 and
+    29 → ...00030, matching the committed range CSVs.
+    """
+    parsed = {}
+    for raw in old_numbers:
+        parsed[raw] = OldRegistrationNumber.parse(raw)
+    ordered = sorted(set(parsed.values()))
+    index = {old: format_registration_number(start + i, year) for i, old in enumerate(ordered)}
+    return {raw: index[old] for raw, old in parsed.items()}
+
+
+class SequenceStore:
+    """
+    Persistent registration sequence shared by every extractor process.
+
+    Backed by SQLite, whose write lock (taken with BEGIN IMMEDIATE)
+    serialises concurrent allocators. Each old register number is
+    assigned once per year, so re-running an extraction returns the same
+    ids instead of burning new ones.
+    """
+
+    def __init__(self, path=DEFAULT_SEQUENCE_STORE, timeout: float = 30.0):
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS registration_sequence (
+                year INTEGER PRIMARY KEY,
+                next_value INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS registration_assignment (
+                year INTEGER NOT NULL,
+                old_key TEXT NOT NULL,
+                sequence INTEGER NOT NULL,
+                PRIMARY KEY (year, old_key),
+                UNIQUE (year, sequence)
+            );
+        """)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _next_value(self, year: int, start: int) -> int:
+        row = self._conn.execute(
+            'SELECT next_value FROM registration_sequence WHERE year = ?', (year,)
+        ).fetchone()
+        return row[0] if row else start
+
+    def assign(self, year: int, old_keys: List[str], start: int = 1) -> Dict[str, int]:
+        """Assign sequence numbers to old keys in the given order, in one transaction"""
+        conn = self._conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            next_value = self._next_value(year, start)
+            assigned = {}
+            for old_key in old_keys:
+                if old_key in assigned:
+                    continue
+                row = conn.execute(
+                    'SELECT sequence FROM registration_assignment WHERE year = ? AND old_key = ?',
+                    (year, old_key),
+                ).fetchone()
+                if row:
+                    assigned[old_key] = row[0]
+                    continue
+                conn.execute(
+                    'INSERT INTO registration_assignment (year, old_key, sequence) VALUES (?, ?, ?)',
+                    (year, old_key, next_value),
+                )
+                assigned[old_key] = next_value
+                next_value += 1
+            conn.execute(
+                'INSERT INTO registration_sequence (year, next_value) VALUES (?, ?) '
+                'ON CONFLICT(year) DO UPDATE SET next_value = excluded.next_value',
+                (year, next_value),
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return assigned
+
+    def seed(self, year: int, issued: Dict[str, int], highest: int = 0) -> int:
+        """
+        Record ids issued outside the store and move the sequence past them.
+
+        ``issued`` maps old keys to their sequence numbers; ``highest`` is
+        the highest sequence in use, including ids without an old number.
+        Keys and sequences already in the store are left alone. Returns
+        the number of assignments added.
+        """
+        conn = self._conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            added = 0
+            for old_key, sequence in issued.items():
+                added += conn.execute(
+                    'INSERT OR IGNORE INTO registration_assignment (year, old_key, sequence) VALUES (?, ?, ?)',
+                    (year, old_key, sequence),
+                ).rowcount
+            highest = max([highest, *issued.values()])
+            conn.execute(
+                'INSERT INTO registration_sequence (year, next_value) VALUES (?, ?) '
+                'ON CONFLICT(year) DO UPDATE SET next_value = MAX(next_value, excluded.next_value)',
+                (year, highest + 1),
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return added
+
+    def reserve(self, year: int, count: int, start: int = 1) -> range:
+        """Reserve a block of unassigned sequence numbers"""
+        conn = self._conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            first = self._next_value(year, start)
+            conn.execute(
+                'INSERT INTO registration_sequence (year, next_value) VALUES (?, ?) '
+                'ON CONFLICT(year) DO UPDATE SET next_value = excluded.next_value',
+                (year, first + count),
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return range(first, first + count)
+
+
+class RegistrationAllocator:
+    """
+    Hands out BGHSA-YYYY-NNNNN ids from a SequenceStore.
+
+    ``allocate_many`` assigns a whole page in register order under a single
+    lock; ``allocate_anonymous`` serves entries without an old number from
+    a locally reserved block, so the store is touched once per block.
+    """
+
+    def __init__(self, store: SequenceStore, year: int = DEFAULT_REGISTRATION_YEAR,
+                 start: int = 1, block_size: int = 64):
+        self.store = store
+        self.year = year
+        self.start = start
+        self.block_size = block_size
+        self._block = iter(())
+
+    def allocate_many(self, old_numbers: Iterable) -> Dict[str, str]:
+        """Map each old number as given to its id, allocating new ones in register order"""
+        parsed = {raw: OldRegistrationNumber.parse(raw) for raw in old_numbers}
+        ordered_keys = [old.key for old in sorted(set(parsed.values()))]
+        sequences = self.store.assign(self.year, ordered_keys, self.start)
+        return {
+            raw: format_registration_number(sequences[old.key], self.year)
+            for raw, old in parsed.items()
+        }
+
+    def allocate(self, old_number) -> str:
+        return self.allocate_many([old_number])[old_number]
+
+    def allocate_anonymous(self) -> str:
+        """Allocate an id for an entry that has no readable old number"""
+        sequence = next(self._block, None)
+        if sequence is None:
+            self._block = iter(self.store.reserve(self.year, self.block_size, self.start))
+            sequence = next(self._block)
+        return format_registration_number(sequence, self.year)
+
+
+def issued_registrations(paths: Iterable) -> Dict[int, tuple]:
+    """
+    The ids already issued in alumni CSVs (or a profiles export), per year.
+
+    Returns ``{year: (issued, highest)}`` where ``issued`` maps each old
+    register key to its sequence number and ``highest`` is the highest
+    sequence seen, including rows without a readable old number.
+    """
+    from .corpus import read_rows
+    issued: Dict[int, tuple] = {}
+    for path in paths:
+        for _, row in read_rows(path):
+            parsed = parse_registration_number(row['Registration Number'])
+            if not parsed:
+                continue
+            year, sequence = parsed
+            keys, highest = issued.get(year, ({}, 0))
+            issued[year] = (keys, max(highest, sequence))
+            try:
+                keys.setdefault(OldRegistrationNumber.parse(row['Old Registration Number']).key, sequence)
+            except ValueError:
+                pass
+    return issued
+
+
+def open_allocator(path: Optional[str] = None, year: int = DEFAULT_REGISTRATION_YEAR,
+                   start: int = 1, seed_paths: Optional[Iterable] = None) -> RegistrationAllocator:
+    """
+    Open the shared sequence store (or the one at ``path``) and wrap it in an allocator.
+
+    The store is first seeded from ``seed_paths``, by default the range
+    CSVs in the repository root, so new ids never repeat issued ones.
+    """
+    if seed_paths is None:
+        from .evaluation import range_csv_paths
+        from .merge import REPO_ROOT
+        seed_paths = range_csv_paths(REPO_ROOT)
+    store_path = path or os.environ.get('BGHS_REGISTRATION_STORE') or DEFAULT_SEQUENCE_STORE
+    store = SequenceStore(store_path)
+    for issued_year, (issued, highest) in issued_registrations(seed_paths).items():
+        store.seed(issued_year, issued, highest)
+    return RegistrationAllocator(store, year=year, start=start)
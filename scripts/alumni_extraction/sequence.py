@@ -0,0 +1,297 @@
+"""
+Sequence-aware repair of register entry numbers.
+
+Register pages and their CSVs are named after the entry range they cover
+(``57-86.png``, ``118-148.csv``, ``1293-1308.csv``) and entries on a page
+are sequential, apart from the occasional suffixed entry (``72ক``,
+``28 ka``, ``72A``) slotted in after its base number.
+
+Given the expected range, the parsed entry numbers are aligned to the
+sequence with an edit-distance style dynamic program. The alignment lets
+us fix OCR digit confusions (the Bengali ৪ is read as 8, ০ as o, ১ as ৯)
+and report which entries are missing or were read twice.
+"""
+
+import re
+from itertools import product
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+from .records import AlumniRecord
+
+RANGE_PATTERN = re.compile(r'(?<!\d)(\d{1,5})\s*-\s*(\d{1,5})(?!\d)')
+
+ENTRY_NUMBER_PATTERN = re.compile(
+    r'^\s*([\d০-৯oOlI|]{1,5})\s*(ka|ক|[A-Za-z])?\s*[।.)]?\s*$'
+)
+
+BENGALI_DIGITS = str.maketrans('০১২৩৪৫৬৭৮৯', '0123456789')
+
+# Characters OCR produces in place of register digits
+OCR_DIGIT_FIXES = str.maketrans({'o': '0', 'O': '0', 'l': '1', 'I': '1', '|': '1'})
+
+# Digits that are commonly confused with one another on these pages
+# (৪ is the Bengali four but looks like a Latin eight, ১ and ৯ differ by a stroke)
+AMBIGUOUS_DIGITS = {
+    '4': '48', '8': '84',
+    '1': '19', '9': '91',
+}
+
+# Alignment costs
+EXACT_MATCH = 0
+REPAIRED_MATCH = 1
+POSITIONAL_MATCH = 3
+SKIP_ENTRY = 2
+SKIP_RECORD = 2
+
+
+class EntryNumber(NamedTuple):
+    """A parsed entry number split into its base and optional suffix"""
+    base: Optional[int]
+    suffix: str
+    readings: Tuple[int, ...]  # plausible base numbers, best first
+
+
+class SequenceReport(NamedTuple):
+    """Outcome of aligning parsed records to the expected entry range"""
+    expected: Tuple[int, int]
+    matched: int
+    repaired: List[Tuple[str, str]]  # (as read, as corrected)
+    missing: List[int]
+    duplicates: List[str]
+    unmatched: List[str]
+
+    @property
+    def expected_count(self) -> int:
+        return self.expected[1] - self.expected[0] + 1
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+
+def parse_entry_range(value: str) -> Optional[Tuple[int, int]]:
+    """
+    Read an entry range like '57-86' from a flag value or file name.
+
+    Only the stem of a path is considered, so 'scans/57-86.png' and
+    '57-86_alumni.csv' both give (57, 86).
+    """
+    if not value:
+        return None
+    match = RANGE_PATTERN.search(Path(value).stem)
+    if not match:
+        return None
+    first, last = int(match.group(1)), int(match.group(2))
+    if first > last:
+        return None
+    return first, last
+
+
+def parse_entry_number(raw: str) -> EntryNumber:
+    """Parse an entry number as read by OCR, with its plausible readings"""
+    match = ENTRY_NUMBER_PATTERN.match(raw or '')
+    if not match:
+        return EntryNumber(None, '', ())
+
+    digits = match.group(1).translate(BENGALI_DIGITS).translate(OCR_DIGIT_FIXES)
+    suffix = match.group(2) or ''
+
+    options = [AMBIGUOUS_DIGITS.get(d, d) for d in digits]
+    readings = []
+    for combo in product(*options):
+        value = int(''.join(combo))
+        if value not in readings:
+            readings.append(value)
+    return EntryNumber(readings[0], suffix, tuple(readings))
+
+
+def _match_cost(entry: EntryNumber, expected: int) -> Optional[int]:
+    if entry.base is None:
+        return POSITIONAL_MATCH
+    if entry.base == expected:
+        return EXACT_MATCH
+    if expected in entry.readings:
+        return REPAIRED_MATCH
+    return None
+
+
+def align_entry_numbers(entries: List[EntryNumber], first: int, last: int) -> List[Optional[int]]:
+    """
+    Align parsed entries to the sequence first..last.
+
+    Returns the expected entry number assigned to each parsed entry, or
+    None where the entry could not be placed. Suffixed entries share the
+    number of the entry they follow and do not consume a sequence slot.
+    Runs in O(len(entries) * (last - first + 1)).
+    """
+    expected = list(range(first, last + 1))
+    m, n = len(entries), len(expected)
+    inf = float('inf')
+
+    # cost[i][j]: best cost of aligning entries[:i] with expected[:j]
+    cost = [[inf] * (n + 1) for _ in range(m + 1)]
+    move = [[None] * (n + 1) for _ in range(m + 1)]
+    cost[0][0] = 0
+    for j in range(1, n + 1):
+        cost[0][j] = cost[0][j - 1] + SKIP_ENTRY
+        move[0][j] = 'skip_entry'
+
+    for i in range(1, m + 1):
+        entry = entries[i - 1]
+        for j in range(n + 1):
+            best, step = cost[i - 1][j] + SKIP_RECORD, 'skip_record'
+
+            # Suffixed entry following its base number
+            if j > 0 and entry.suffix and expected[j - 1] in entry.readings:
+                if cost[i - 1][j] < best:
+                    best, step = cost[i - 1][j], 'suffix'
+
+            if j > 0:
+                if cost[i][j - 1] + SKIP_ENTRY < best:
+                    best, step = cost[i][j - 1] + SKIP_ENTRY, 'skip_entry'
+                if not entry.suffix:
+                    match_cost = _match_cost(entry, expected[j - 1])
+                    if match_cost is not None and cost[i - 1][j - 1] + match_cost < best:
+                        best, step = cost[i - 1][j - 1] + match_cost, 'match'
+
+            cost[i][j] = best
+            move[i][j] = step
+
+    assigned = [None] * m
+    i, j = m, n
+    while i > 0 or j > 0:
+        step = move[i][j]
+        if step == 'match':
+            assigned[i - 1] = expected[j - 1]
+            i, j = i - 1, j - 1
+        elif step == 'suffix':
+            assigned[i - 1] = expected[j - 1]
+            i -= 1
+        elif step == 'skip_record':
+            i -= 1
+        else:
+            j -= 1
+    return assigned
+
+
+def _alignment_orders(records: List[AlumniRecord]) -> List[List[int]]:
+    # Rows are read across both columns, so entries of the right column
+    # only become sequential once they are placed after the left column.
+    # A line holding a single entry (column '') may belong to either
+    # column, e.g. the last line of a page whose left column is shorter;
+    # both placements are tried.
+    left_first = sorted(range(len(records)), key=lambda k: records[k].column == 'right')
+    if not any(record.column == '' for record in records):
+        return [left_first]
+    right_last = sorted(range(len(records)), key=lambda k: records[k].column != 'left')
+    return [left_first, right_last]
+
+
+def _align(records: List[AlumniRecord], order: List[int], first: int, last: int):
+    entries = [parse_entry_number(records[k].entry_number) for k in order]
+    return entries, align_entry_numbers(entries, first, last)
+
+
+def repair_entry_sequence(records: List[AlumniRecord], entry_range: Tuple[int, int]) -> SequenceReport:
+    """
+    Align records to the expected range and correct their entry numbers.
+
+    Records are updated in place: ``entry_number`` is replaced by the aligned
+    value and the OCR reading is kept in ``entry_number_read`` when it changed.
+    Returns a report of repairs, missing entries, duplicates and records
+    that could not be placed.
+    """
+    first, last = entry_range
+    best = None
+    for order in _alignment_orders(records):
+        entries, assigned = _align(records, order, first, last)
+        placed = sum(number is not None for number in assigned)
+        if best is None or placed > best[0]:
+            best = (placed, order, entries, assigned)
+    _, order, entries, assigned = best
+
+    repaired = []
+    unmatched = []
+    duplicates = []
+    seen = set()
+    for k, entry, number in zip(order, entries, assigned):
+        record = records[k]
+        raw = record.entry_number
+        if number is None:
+            # An unplaced number that repeats a placed one is a duplicate read
+            if entry.base is not None and any(r in seen for r in entry.readings):
+                duplicates.append(raw)
+            else:
+                unmatched.append(raw or record.raw_text)
+            continue
+
+        corrected = str(number)
+        if entry.suffix:
+            corrected = f"{number} {entry.suffix}" if entry.suffix == 'ka' else f"{number}{entry.suffix}"
+        else:
+            seen.add(number)
+        if corrected != raw:
+            record.entry_number_read = raw
+            record.entry_number = corrected
+            repaired.append((raw, corrected))
+
+    missing = [number for number in range(first, last + 1) if number not in seen]
+    return SequenceReport(
+        expected=(first, last),
+        matched=len(seen),
+        repaired=repaired,
+        missing=missing,
+        duplicates=duplicates,
+        unmatched=unmatched,
+    )
+
+
+def fill_sequence_gaps(records: List[AlumniRecord], extra_records: List[AlumniRecord],
+                       entry_range: Tuple[int, int], missing: List[int]) -> int:
+    """
+    Add records from a second OCR pass that fill missing entry numbers.
+
+    Only records whose repaired number is in ``missing`` are taken, so a
+    re-read never overrides an entry the first pass already produced.
+    Returns the number of records added.
+    """
+    if not missing or not extra_records:
+        return 0
+    repair_entry_sequence(extra_records, entry_range)
+    wanted = set(missing)
+    added = 0
+    for record in extra_records:
+        number = parse_entry_number(record.entry_number)
+        if number.base in wanted and not number.suffix:
+            records.append(record)
+            wanted.discard(number.base)
+            added += 1
+    return added
+
+
+def sort_by_entry_number(records: List[AlumniRecord]) -> List[AlumniRecord]:
+    """Order records by entry number, suffixed entries after their base"""
+    def key(record):
+        number = parse_entry_number(record.entry_number)
+        if number.base is None:
+            return (1, 0, '')
+        return (0, number.base, number.suffix)
+    return sorted(records, key=key)
+
+
+def format_sequence_report(report: SequenceReport) -> List[str]:
+    """Human-readable summary lines for console output"""
+    first, last = report.expected
+    lines = [f"🔢 Entries {first}-{last}: {report.matched}/{report.expected_count} matched"]
+    if report.repaired:
+        fixes = ', '.join(f"{old or '?'}→{new}" for old, new in report.repaired[:10])
+        more = f" (+{len(report.repaired) - 10} more)" if len(report.repaired) > 10 else ''
+        lines.append(f"🔧 Repaired entry numbers: {fixes}{more}")
+    if report.missing:
+        lines.append(f"❓ Missing entries: {', '.join(str(n) for n in report.missing)}")
+    if report.duplicates:
+        lines.append(f"♊ Duplicate entries: {', '.join(report.duplicates)}")
+    if report.unmatched:
+        lines.append(f"⚠️ Could not place {len(report.unmatched)} record(s)")
+    return lines
@@ -0,0 +1,471 @@
+"""
+Rewrite fields across the whole corpus from a rule file.
+
+Each fix to the committed CSVs used to be a one-off script that
+hard-coded the register again (fix-company-field-logic.py,
+fix-registration-format.py, fix-bengali-extraction.py). Instead, the
+rules live in a JSON file (scripts/corpus-rules.json by default) and are
+applied to the table ``corpus.load_corpus`` reads, one rule at a time
+over whole columns. A rule sets one column:
+
+  {"name": "company", "column": "Company",
+   "current": "|Retired",                       # only rows whose value matches
+   "cases": [{"when": {"Is Deceased": "true"}, "value": "Deceased"},
+             {"when": {"Title Prefix": "Dr\\\\."}, "value": "Medical Practice"}],
+   "default": ""}
+
+``current`` and the ``when`` values are regular expressions matched
+against the whole (trimmed) value; a rule without ``current`` applies to
+every row. ``when`` may also test the provenance columns Source File and
+Source Schema, to keep a rule to some of the files. Each case gives ``value`` (a constant) or ``template``
+(``{Registration Number|compact}@alumnibghs.org``; filters are lower,
+slug and compact, and a row with an empty placeholder is left alone);
+the first case whose conditions hold wins, and ``default`` covers the
+rows no case matched. A rule with ``when``/``value``/``template`` at the
+top level is a rule with one case. ``map`` rewrites values found in a
+lookup table (keys are case-insensitive) and leaves the others as they
+are. Rules run in file order, so a rule sees the values earlier rules
+wrote.
+
+Conditions are evaluated once per distinct value of a column (most
+columns have a handful) and spread back to the rows with numpy, so the
+cost per row is an index lookup; a template is filled once per distinct
+combination of its placeholder values.
+
+Without ``--in-place`` nothing is written: the tool prints what would
+change (``--diff`` writes every change to a CSV) and any Email or
+Registration Number the rules would give to more rows than hold it now
+(``new_duplicates``; both are unique in ``profiles``). ``--in-place``
+rewrites the changed cells of the source files, keeping each file's own
+layout, and refuses to when the rules create such duplicates.
+
+Usage (from the scripts directory):
+
+  python -m alumni_extraction.transform [FILE ...] [--rules corpus-rules.json]
+      [--all] [--diff changes.csv] [--in-place] [-o unified.csv]
+"""
+
+import csv
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Pattern, Sequence
+
+from .corpus import CANONICAL_COLUMNS, CorpusTable, canonical_column, load_corpus
+
+DEFAULT_RULES = Path(__file__).resolve().parent.parent / 'corpus-rules.json'
+
+DIFF_COLUMNS = ['Source File', 'Source Row', 'Column', 'Rule', 'Old', 'New']
+
+_PLACEHOLDER = re.compile(r'\{([^{}|]+)(?:\|(\w+))?\}')
+FILTERS = {
+    'lower': str.lower,
+    'slug': lambda value: re.sub(r'[^a-z]', '', value.lower()),     # as parsing.generate_email
+    'compact': lambda value: re.sub(r'[^0-9A-Za-z]', '', value),
+}
+
+# Provenance columns a ``when`` condition may test besides the canonical ones
+CONDITION_COLUMNS = ['Source File', 'Source Schema']
+# Values the profiles table keeps unique, compared case-insensitively
+UNIQUE_COLUMNS = ('Email', 'Registration Number')
+
+_RULE_KEYS = {'name', 'note', 'column', 'current', 'cases', 'default', 'map', 'when', 'value', 'template'}
+_CASE_KEYS = {'when', 'value', 'template'}
+
+
+class RuleError(ValueError):
+    """A rule file that cannot be applied"""
+
+
+class Case(NamedTuple):
+    when: Dict[str, Pattern]
+    value: Optional[str]
+    template: Optional[str]
+
+
+class Rule(NamedTuple):
+    name: str
+    column: str
+    current: Optional[Pattern]
+    cases: List[Case]
+    default: Optional[str]
+    mapping: Optional[Dict[str, str]]       # lower-cased keys
+
+
+class Change(NamedTuple):
+    source: str
+    row: int
+    column: str
+    rule: str
+    old: str
+    new: str
+
+
+class TransformResult(NamedTuple):
+    columns: Dict[str, list]        # the table after every rule
+    changes: List[Change]
+    counts: Dict[str, int]          # cells changed per rule
+    seconds: float
+
+    @property
+    def rows_per_s(self) -> float:
+        rows = len(self.columns['Source File'])
+        return rows / self.seconds if self.seconds else float('inf')
+
+
+def _check_column(column, where: str, extra: Sequence[str] = ()) -> str:
+    if column not in CANONICAL_COLUMNS and column not in extra:
+        raise RuleError(f"{where}: {column!r} is not a canonical column")
+    return column
+
+
+def _compile(pattern, where: str) -> Pattern:
+    try:
+        return re.compile(str(pattern))
+    except re.error as e:
+        raise RuleError(f"{where}: bad pattern {pattern!r}: {e}")
+
+
+def _parse_case(spec: dict, where: str) -> Case:
+    unknown = set(spec) - _CASE_KEYS
+    if unknown:
+        raise RuleError(f"{where}: unknown key(s) {', '.join(sorted(unknown))}")
+    if ('value' in spec) == ('template' in spec):
+        raise RuleError(f"{where}: give exactly one of value and template")
+    template = spec.get('template')
+    if template is not None:
+        for name, filter_name in _PLACEHOLDER.findall(template):
+            _check_column(name, where)
+            if filter_name and filter_name not in FILTERS:
+                raise RuleError(f"{where}: unknown filter {filter_name!r}")
+    when = {_check_column(column, where, CONDITION_COLUMNS): _compile(pattern, where)
+            for column, pattern in (spec.get('when') or {}).items()}
+    value = spec.get('value')
+    return Case(when, None if value is None else str(value), template)
+
+
+def parse_rules(data: dict) -> List[Rule]:
+    """Rules from the parsed rule file, checked before anything is applied"""
+    rules = []
+    for i, spec in enumerate(data.get('rules') or [], 1):
+        name = spec.get('name') or f"rule {i}"
+        unknown = set(spec) - _RULE_KEYS
+        if unknown:
+            raise RuleError(f"{name}: unknown key(s) {', '.join(sorted(unknown))}")
+        column = _check_column(spec.get('column'), name)
+        current = _compile(spec['current'], name) if 'current' in spec else None
+        shorthand = {key: spec[key] for key in _CASE_KEYS if key in spec}
+        cases = [_parse_case(case, f"{name} case {n}") for n, case in enumerate(spec.get('cases') or [], 1)]
+        if shorthand:
+            cases.append(_parse_case(shorthand, name))
+        mapping = spec.get('map')
+        if mapping is not None:
+            if cases or 'default' in spec:
+                raise RuleError(f"{name}: a map rule has no cases or default")
+            mapping = {str(key).lower(): str(value) for key, value in mapping.items()}
+        elif not cases and 'default' not in spec:
+            raise RuleError(f"{name}: nothing to set (give value, template, cases or map)")
+        default = spec.get('default')
+        rules.append(Rule(name, column, current, cases, None if default is None else str(default), mapping))
+    return rules
+
+
+def load_rules(path=DEFAULT_RULES) -> List[Rule]:
+    import json
+    with open(path, encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except ValueError as e:
+            raise RuleError(f"{path}: {e}")
+    return parse_rules(data)
+
+
+def render(template: str, row: Dict[str, str]) -> Optional[str]:
+    """The template filled from a row, or None when a placeholder is empty"""
+    empty = False
+
+    def fill(match):
+        nonlocal empty
+        value = row[match.group(1)]
+        if match.group(2):
+            value = FILTERS[match.group(2)](value)
+        empty = empty or not value
+        return value
+
+    text = _PLACEHOLDER.sub(fill, template)
+    return None if empty else text
+
+
+def apply_row(rules: Sequence[Rule], row: Dict[str, str]) -> Dict[str, str]:
+    """The rules applied to one canonical row (a new dict); apply_rules does the same to a table"""
+    row = dict(row)
+    for rule in rules:
+        value = row[rule.column]
+        if rule.current is not None and not rule.current.fullmatch(value):
+            continue
+        if rule.mapping is not None:
+            row[rule.column] = rule.mapping.get(value.lower(), value)
+            continue
+        for case in rule.cases:
+            if all(pattern.fullmatch(row[column]) for column, pattern in case.when.items()):
+                if case.template is None:
+                    row[rule.column] = case.value
+                else:
+                    rendered = render(case.template, row)
+                    if rendered is not None:
+                        row[rule.column] = rendered
+                break
+        else:
+            if rule.default is not None:
+                row[rule.column] = rule.default
+    return row
+
+
+def _factorize(values):
+    """(distinct values in first-seen order, index of each value among them)"""
+    import numpy as np
+    index = {}
+    inverse = np.fromiter((index.setdefault(value, len(index)) for value in values), np.intp, len(values))
+    return list(index), inverse
+
+
+class _Columns:
+    """The working columns as object arrays, factorized on demand until written"""
+
+    def __init__(self, table: CorpusTable, names):
+        import numpy as np
+        self.arrays = {name: np.array(table[name], dtype=object) for name in names}
+        self._factorized = {}
+
+    def match(self, pattern: Pattern, name: str):
+        """Boolean array of the rows whose value fully matches, one match per distinct value"""
+        import numpy as np
+        if name not in self._factorized:
+            self._factorized[name] = _factorize(self.arrays[name])
+        distinct, inverse = self._factorized[name]
+        hits = np.fromiter((pattern.fullmatch(value) is not None for value in distinct), bool, len(distinct))
+        return hits[inverse]
+
+    def written(self, name: str):
+        self._factorized.pop(name, None)
+
+
+def apply_rules(table: CorpusTable, rules: Sequence[Rule]) -> TransformResult:
+    """Every rule over whole columns of the table; the table itself is not modified"""
+    import time
+    import numpy as np
+
+    start = time.perf_counter()
+    needed = {rule.column for rule in rules}
+    for rule in rules:
+        for case in rule.cases:
+            needed.update(case.when)
+            if case.template:
+                needed.update(name for name, _ in _PLACEHOLDER.findall(case.template))
+    missing = needed - set(table.columns)
+    if missing:
+        raise RuleError(f"The table has no {', '.join(sorted(missing))} column(s)")
+
+    size = len(table)
+    work = _Columns(table, needed)
+    arrays = work.arrays
+    original = {column: values.copy() for column, values in arrays.items()}
+    changed_by = {column: np.full(size, None, dtype=object) for column in {rule.column for rule in rules}}
+    counts = {}
+
+    for rule in rules:
+        target = arrays[rule.column]
+        before = target.copy()
+        pending = work.match(rule.current, rule.column) if rule.current is not None else np.ones(size, bool)
+        if rule.mapping is not None:
+            rows = np.flatnonzero(pending)
+            distinct, inverse = _factorize(target[rows])
+            mapped = np.array([rule.mapping.get(value.lower(), value) for value in distinct], dtype=object)
+            target[rows] = mapped[inverse]
+        else:
+            for case in rule.cases:
+                hit = pending.copy()
+                for column, pattern in case.when.items():
+                    hit &= work.match(pattern, column)
+                pending &= ~hit
+                if case.template is None:
+                    target[hit] = case.value
+                    continue
+                # Rendered once per distinct combination of placeholder values
+                names = sorted({name for name, _ in _PLACEHOLDER.findall(case.template)})
+                rows = np.flatnonzero(hit)
+                rendered = {}
+                for i, key in zip(rows, zip(*(arrays[name][rows] for name in names))):
+                    if key not in rendered:
+                        rendered[key] = render(case.template, dict(zip(names, key)))
+                    if rendered[key] is not None:
+                        target[i] = rendered[key]
+            if rule.default is not None:
+                target[pending] = rule.default
+        diff = target != before
+        changed_by[rule.column][diff] = rule.name
+        counts[rule.name] = int(diff.sum())
+        work.written(rule.column)
+
+    # Changes in table order (file by file, row by row), then column order
+    columns = dict(table.columns)
+    rank = {column: n for n, column in enumerate(CANONICAL_COLUMNS)}
+    found_rows, found_ranks, found_columns = [], [], []
+    for column in changed_by:
+        columns[column] = arrays[column].tolist()
+        rows = np.flatnonzero(arrays[column] != original[column])
+        found_rows.append(rows)
+        found_ranks.append(np.full(len(rows), rank[column]))
+        found_columns.extend([column] * len(rows))
+    changes = []
+    if found_columns:
+        rows, ranks = np.concatenate(found_rows), np.concatenate(found_ranks)
+        sources, numbers = table['Source File'], table['Source Row']
+        for n in np.lexsort((ranks, rows)):
+            i, column = rows[n], found_columns[n]
+            changes.append(Change(sources[i], numbers[i], column, changed_by[column][i],
+                                  original[column][i], arrays[column][i]))
+    return TransformResult(columns, changes, counts, time.perf_counter() - start)
+
+
+def new_duplicates(table: CorpusTable, result: TransformResult) -> Dict[str, Dict[str, List[int]]]:
+    """
+    Values of UNIQUE_COLUMNS that the rules give to more rows than before.
+
+    Returns ``{column: {value: row indexes holding it afterwards}}`` for
+    each value held by two or more rows after the rules and by fewer
+    rows before them.
+    """
+    from collections import Counter, defaultdict
+    found = {}
+    changed = {change.column for change in result.changes}
+    for column in UNIQUE_COLUMNS:
+        if column not in changed:
+            continue
+        before = Counter(value.lower() for value in table[column] if value)
+        holders = defaultdict(list)
+        for i, value in enumerate(result.columns[column]):
+            if value:
+                holders[value.lower()].append(i)
+        duplicates = {result.columns[column][rows[0]]: rows for key, rows in holders.items()
+                      if len(rows) > 1 and len(rows) > before[key]}
+        if duplicates:
+            found[column] = duplicates
+    return found
+
+
+def rewrite_file(path, changes: Sequence[Change]) -> int:
+    """
+    Write the changed cells back into one source CSV, keeping its header,
+    column order and line endings; returns the number of cells written.
+    Columns the file does not have are skipped.
+    """
+    import os
+    path = Path(path)
+    with open(path, 'rb') as f:
+        first = f.readline()
+    bom = first.startswith(b'\xef\xbb\xbf')
+    newline = '\r\n' if first.endswith(b'\r\n') else '\n'
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.reader(f))
+    if not rows:
+        return 0
+    positions = {}
+    for i, name in enumerate(rows[0]):
+        positions.setdefault(canonical_column(name), i)
+
+    written = 0
+    for change in changes:
+        i = positions.get(change.column)
+        if i is None or change.row >= len(rows):
+            continue
+        row = rows[change.row]
+        if i >= len(row):
+            row.extend([''] * (i + 1 - len(row)))
+        row[i] = change.new
+        written += 1
+    if written:
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', newline='', encoding='utf-8-sig' if bom else 'utf-8') as f:
+            csv.writer(f, lineterminator=newline).writerows(rows)
+        os.replace(tmp, path)
+    return written
+
+
+def changes_by_source(changes: Sequence[Change]) -> Iterator[tuple]:
+    """(source file name, its changes) in source order"""
+    from itertools import groupby
+    for source, group in groupby(changes, key=lambda change: change.source):
+        yield source, list(group)
+
+
+def main():
+    import argparse
+    from .corpus import corpus_csv_paths
+    from .evaluation import range_csv_paths
+    from .merge import REPO_ROOT
+
+    parser = argparse.ArgumentParser(description='Apply the corpus rule file to alumni CSVs')
+    parser.add_argument('inputs', nargs='*', help='CSV files (default: the range CSVs)')
+    parser.add_argument('--rules', default=str(DEFAULT_RULES),
+                        help=f'Rule file (default: {DEFAULT_RULES.name})')
+    parser.add_argument('--all', action='store_true', help='Every alumni CSV in the repository root')
+    parser.add_argument('--diff', help='Write every change to this CSV')
+    parser.add_argument('--in-place', action='store_true', help='Write the changes back into the source files')
+    parser.add_argument('-o', '--output', help='Write the transformed table (with provenance columns) to this CSV')
+    parser.add_argument('--show', type=int, default=3, help='Changes shown per rule (default: 3)')
+    args = parser.parse_args()
+
+    try:
+        rules = load_rules(args.rules)
+    except (OSError, RuleError) as e:
+        print(f"❌ {e}")
+        raise SystemExit(2)
+    paths = args.inputs or (corpus_csv_paths(REPO_ROOT) if args.all else range_csv_paths(REPO_ROOT))
+    table = load_corpus(paths)
+    result = apply_rules(table, rules)
+
+    print(f"📊 {len(table)} rows from {len(paths)} file(s), {len(rules)} rule(s): "
+          f"{len(result.changes)} cell(s) changed in {result.seconds * 1000:.0f} ms "
+          f"({result.rows_per_s:,.0f} rows/s)")
+    for rule in rules:
+        shown = [change for change in result.changes if change.rule == rule.name][:args.show]
+        print(f"   {rule.name:<14} {result.counts[rule.name]:>6}")
+        for change in shown:
+            print(f"      {change.source}:{change.row} {change.column}: {change.old!r} -> {change.new!r}")
+
+    duplicates = new_duplicates(table, result)
+    for column, values in duplicates.items():
+        print(f"⚠️ {len(values)} {column} value(s) the rules would give to more than one row:")
+        for value, rows in list(values.items())[:args.show]:
+            holders = ', '.join(f"{result.columns['Source File'][i]}:{result.columns['Source Row'][i]}"
+                                for i in rows[:4])
+            print(f"      {value}: {holders}{' ...' if len(rows) > 4 else ''}")
+
+    if args.diff:
+        with open(args.diff, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(DIFF_COLUMNS)
+            writer.writerows(result.changes)
+        print(f"💾 Changes written to {args.diff}")
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            names = list(result.columns)
+            writer.writerow(names)
+            writer.writerows(zip(*(result.columns[name] for name in names)))
+        print(f"💾 Transformed table written to {args.output}")
+    if args.in_place and duplicates:
+        print("❌ Not writing: fix the rules so they do not create duplicate values")
+        raise SystemExit(1)
+    if args.in_place:
+        by_name = {Path(path).name: path for path in paths}
+        for source, changes in changes_by_source(result.changes):
+            written = rewrite_file(by_name[source], changes)
+            skipped = f" ({len(changes) - written} not in its layout)" if written < len(changes) else ''
+            print(f"✅ {source}: {written} cell(s) rewritten{skipped}")
+    else:
+        print("🔍 Dry run: no file changed. Run again with --in-place to write the changes.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+"""
+Export only the rows that changed since the last alumni-migration upload.
+
+The admin upload (``app/api/admin/alumni-migration/upload``) processes
+every row of the sheet it is given, so re-uploading a corrected range
+file re-touches every row in it. This tool keeps a snapshot of what was
+last uploaded: one content hash per row, keyed by registration number
+(``BGHSA-2025-00001``, or the old register number where a row has no new
+one). Given the CSVs to upload, it writes:
+
+  -o            the inserted and changed rows, in the range-CSV layout
+                (plus Professional Title)
+  --tombstones  rows the snapshot has from the same files that are gone now
+
+Rows whose hash matches the snapshot are left out. Only the columns the
+upload reads are hashed (see UPLOAD_FIELDS), trimmed as the route trims
+them, so a change to the Notes column alone does not cost an upload.
+
+The snapshot is only updated with ``--commit``: run without it to get the
+delta, upload the delta, then run again with ``--commit`` to record it.
+The first ``--commit`` on a database that already holds the register
+records the baseline.
+
+A tombstone is only reported for a file given on the command line, so
+uploading one corrected range file never retires the rows of the others.
+
+Usage (from the scripts directory):
+
+  python -m alumni_extraction.upload_delta FILE [FILE ...] [-o delta.csv]
+      [--tombstones removed.csv] [--commit] [--snapshot PATH]
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .corpus import CANONICAL_COLUMNS, read_rows
+from .csv_writer import StreamingCsvWriter
+from .evaluation import row_entry_key
+from .merge import normalize_value
+from .registration import parse_registration_number
+
+DEFAULT_UPLOAD_SNAPSHOT = Path(__file__).resolve().parent.parent / '.upload-snapshot.sqlite3'
+
+# Columns the upload route maps onto a profile (validateAndNormalizeRecord),
+# plus the registration, title and deceased columns of the range CSVs.
+UPLOAD_FIELDS = (
+    'Registration Number', 'Old Registration Number', 'Email', 'Phone', 'Title Prefix',
+    'First Name', 'Middle Name', 'Last Name', 'Last Class', 'Year of Leaving',
+    'Start Class', 'Start Year', 'Batch Year', 'Profession', 'Company', 'Location', 'Bio',
+    'LinkedIn URL', 'Website URL', 'Role', 'Professional Title', 'Is Deceased', 'Deceased Year',
+)
+
+INSERTED, CHANGED, UNCHANGED, UNTRACKED, REPEATED = 'inserted', 'changed', 'unchanged', 'untracked', 'repeated'
+STATUSES = (INSERTED, CHANGED, UNCHANGED, UNTRACKED, REPEATED)
+
+TOMBSTONE_COLUMNS = ['Registration Number', 'Old Registration Number', 'Email', 'Source']
+
+
+class SnapshotRow(NamedTuple):
+    """What was last uploaded under one key"""
+    digest: str
+    source: str
+    email: str
+    old_number: str
+
+
+class DeltaRow(NamedTuple):
+    """One input row and how it compares with the snapshot"""
+    status: str
+    key: Optional[str]
+    digest: str
+    source: str
+    row: int
+    fields: Dict[str, str]
+
+
+def snapshot_key(row: Dict[str, str]) -> Optional[str]:
+    """'BGHSA-2025-00001', else '#72 ka' from the old register number, else None"""
+    number = (row.get('Registration Number') or '').strip()
+    if parse_registration_number(number):
+        return number
+    entry = row_entry_key(row)
+    return f"#{entry}" if entry is not None else None
+
+
+def row_digest(row: Dict[str, str]) -> str:
+    """Hash of the uploaded columns; missing and empty columns hash the same"""
+    import hashlib
+    values = []
+    for field in UPLOAD_FIELDS:
+        value = row.get(field) or ''
+        values.append(normalize_value(field, value) if field == 'Is Deceased' else value.strip())
+    return hashlib.blake2b('\x1f'.join(values).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class UploadSnapshot:
+    """
+    Content hashes of the rows last uploaded, persisted in SQLite.
+
+    ``load`` reads the whole snapshot (a few thousand small rows) so the
+    comparison is one dict lookup per row; ``record`` applies an upload
+    in one transaction.
+    """
+
+    def __init__(self, path=DEFAULT_UPLOAD_SNAPSHOT, timeout: float = 30.0):
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS uploaded_row (
+                key TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                source TEXT NOT NULL,
+                email TEXT NOT NULL,
+                old_number TEXT NOT NULL,
+                uploaded_at TEXT NOT NULL
+            )
+        """)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def load(self) -> Dict[str, SnapshotRow]:
+        return {key: SnapshotRow(*rest) for key, *rest in
+                self._conn.execute('SELECT key, digest, source, email, old_number FROM uploaded_row')}
+
+    def record(self, rows: Iterable[DeltaRow], removed: Iterable[str]):
+        """Store the hashes of uploaded rows and drop the removed keys"""
+        from datetime import datetime, timezone
+        now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        conn = self._conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(
+                'INSERT OR REPLACE INTO uploaded_row (key, digest, source, email, old_number, uploaded_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                ((row.key, row.digest, row.source, (row.fields.get('Email') or '').strip(),
+                  (row.fields.get('Old Registration Number') or '').strip(), now) for row in rows))
+            conn.executemany('DELETE FROM uploaded_row WHERE key = ?', ((key,) for key in removed))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM uploaded_row').fetchone()[0]
+
+
+def compare(snapshot: Dict[str, SnapshotRow],
+            rows: Iterable[Tuple[str, int, Dict[str, str]]]) -> Iterator[DeltaRow]:
+    """Classify a stream of (source, row number, row) against the snapshot"""
+    seen = set()
+    for source, number, row in rows:
+        key = snapshot_key(row)
+        digest = row_digest(row)
+        if key is None:
+            status = UNTRACKED
+        elif key in seen:
+            status = REPEATED
+        else:
+            seen.add(key)
+            last = snapshot.get(key)
+            status = INSERTED if last is None else UNCHANGED if last.digest == digest else CHANGED
+        yield DeltaRow(status, key, digest, source, number, row)
+
+
+def tombstones(snapshot: Dict[str, SnapshotRow], seen: Iterable[str], sources: Iterable[str]) -> List[str]:
+    """Snapshot keys from the given source files that the input no longer has"""
+    seen, sources = set(seen), set(sources)
+    return sorted(key for key, last in snapshot.items() if last.source in sources and key not in seen)
+
+
+def open_snapshot(path: Optional[str] = None) -> UploadSnapshot:
+    return UploadSnapshot(path or os.environ.get('BGHS_UPLOAD_SNAPSHOT') or DEFAULT_UPLOAD_SNAPSHOT)
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Write only the rows that changed since the last alumni upload')
+    parser.add_argument('inputs', nargs='+', help='CSV files to upload (any layout alumni_extraction.corpus reads)')
+    parser.add_argument('-o', '--output', help='Write inserted and changed rows (canonical corpus layout) to this CSV')
+    parser.add_argument('--tombstones', help='Write rows that disappeared from the given files to this CSV')
+    parser.add_argument('--commit', action='store_true',
+                        help='Record the inputs in the snapshot (run after the delta was uploaded)')
+    parser.add_argument('--snapshot',
+                        help=f'Snapshot file (default: $BGHS_UPLOAD_SNAPSHOT or {DEFAULT_UPLOAD_SNAPSHOT.name})')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with open_snapshot(args.snapshot) as store:
+        snapshot = store.load()
+        print(f"📚 Snapshot: {len(snapshot)} uploaded rows")
+
+        counts = dict.fromkeys(STATUSES, 0)
+        upload: List[DeltaRow] = []
+        seen = []
+        stream = ((Path(path).name, number, row) for path in args.inputs for number, row in read_rows(path))
+        delta = StreamingCsvWriter(args.output, CANONICAL_COLUMNS) if args.output else None
+        try:
+            for result in compare(snapshot, stream):
+                counts[result.status] += 1
+                if result.key is not None:
+                    seen.append(result.key)
+                if result.status == REPEATED:
+                    print(f"⚠️ {result.key} repeated ({result.source} row {result.row}); only the first row is used")
+                if result.status not in (INSERTED, CHANGED, UNTRACKED):
+                    continue
+                if result.status != UNTRACKED:
+                    upload.append(result)
+                if delta:
+                    row = result.fields
+                    delta.write_dict(row, row.get('Year of Leaving', ''),
+                                     normalize_value('Is Deceased', row.get('Is Deceased')) == 'true',
+                                     row.get('Title Prefix', ''))
+        finally:
+            if delta:
+                delta.close()
+
+        removed = tombstones(snapshot, seen, (Path(path).name for path in args.inputs))
+        if args.tombstones:
+            with StreamingCsvWriter(args.tombstones, TOMBSTONE_COLUMNS) as writer:
+                for key in removed:
+                    last = snapshot[key]
+                    writer.write([key if not key.startswith('#') else '', last.old_number, last.email, last.source])
+        if args.commit:
+            store.record(upload, removed)
+
+    elapsed = time.perf_counter() - start
+    print(f"\n📊 {sum(counts.values())} rows in {elapsed * 1000:.0f} ms: " +
+          ', '.join(f"{counts[status]} {status}" for status in STATUSES) + f", {len(removed)} removed")
+    if counts[UNTRACKED]:
+        print(f"⚠️ {counts[UNTRACKED]} row(s) have no registration number; they are always exported")
+    if delta:
+        print(f"💾 Delta ({counts[INSERTED] + counts[CHANGED] + counts[UNTRACKED]} rows) written to {args.output}")
+    if args.tombstones:
+        print(f"💾 Tombstones ({len(removed)} rows) written to {args.tombstones}")
+    if args.commit:
+        print(f"✅ Snapshot updated: {len(upload)} rows recorded, {len(removed)} removed")
+    else:
+        print("🔍 Dry run: snapshot unchanged. Run again with --commit once the delta is uploaded.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+A local stand-in for the alumni-migration upload endpoint.
+
+Answers ``POST /api/admin/alumni-migration/upload`` like the Next.js
+route: it reads the ``file`` field of a multipart form as CSV, checks the
+required fields of each row, refuses an email it has already seen with
+"User already exists", and returns the same JSON (processed, failed,
+errors, details). Nothing is stored beyond the set of emails.
+
+The route makes several Supabase calls per row, one row after another;
+``--row-ms`` sleeps that long per row to stand in for them. With
+``--fail-rate`` a share of requests is answered with 429 (with a
+Retry-After of 0) or 503 before any row is processed, to exercise the
+client's retries. Connections are kept alive (HTTP/1.1).
+
+Usage (from the scripts directory):
+
+  python -m alumni_extraction.upload_stub [--port 3999] [--row-ms 20] [--fail-rate 0.1]
+  python -m alumni_extraction.uploader delta.csv --url http://localhost:3999
+"""
+
+import csv
+import io
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from .uploader import EXISTING_ERROR, ROUTE_PATH
+
+DEFAULT_PORT = 3999
+DEFAULT_ROW_MS = 20.0
+REQUIRED_FIELDS = (('Email', 'Email'), ('First Name', 'First name'), ('Last Name', 'Last name'),
+                   ('Last Class', 'Last class'), ('Year of Leaving', 'Year of leaving'))
+
+
+class StubState:
+    """Emails seen so far and request counters, shared by the handler threads"""
+
+    def __init__(self, row_s: float = DEFAULT_ROW_MS / 1000, fail_rate: float = 0.0, seed: Optional[int] = None):
+        self.row_s = row_s
+        self.fail_rate = fail_rate
+        self.emails = set()
+        self.requests = 0
+        self.rejected = 0
+        self.rows = 0
+        self.connections = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def should_fail(self) -> Optional[int]:
+        with self._lock:
+            self.requests += 1
+            if self._rng.random() >= self.fail_rate:
+                return None
+            self.rejected += 1
+            return self._rng.choice((429, 503))
+
+    def add_email(self, email: str) -> bool:
+        with self._lock:
+            self.rows += 1
+            if email in self.emails:
+                return False
+            self.emails.add(email)
+            return True
+
+
+def multipart_file(body: bytes, content_type: str, field: str = 'file') -> Optional[bytes]:
+    """Content of one field of a multipart/form-data body"""
+    boundary = next((part.split('=', 1)[1].strip('"') for part in content_type.split(';')
+                     if part.strip().startswith('boundary=')), None)
+    if not boundary:
+        return None
+    for part in body.split(b'--' + boundary.encode('latin-1')):
+        head, sep, content = part.partition(b'\r\n\r\n')
+        if sep and f'name="{field}"'.encode('latin-1') in head:
+            return content[:-2] if content.endswith(b'\r\n') else content
+    return None
+
+
+def process_rows(state: StubState, csv_text: str) -> Dict:
+    """The route's per-row work: required fields, then the email check"""
+    results = {'success': True, 'processed': 0, 'failed': 0, 'errors': [], 'details': []}
+    for row in csv.DictReader(io.StringIO(csv_text)):
+        time.sleep(state.row_s)
+        email = (row.get('Email') or '').strip()
+        missing = next((label for field, label in REQUIRED_FIELDS if not (row.get(field) or '').strip()), None)
+        if missing:
+            error = f"{missing} is required"
+        elif not state.add_email(email):
+            error = EXISTING_ERROR
+        else:
+            results['processed'] += 1
+            results['details'].append({'email': email, 'status': 'success'})
+            continue
+        results['failed'] += 1
+        results['errors'].append(f"Error processing {email or 'unknown'}: {error}")
+        results['details'].append({'email': email or 'unknown', 'status': 'failed', 'error': error})
+    return results
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    state: StubState = None
+
+    def setup(self):
+        super().setup()
+        with self.state._lock:
+            self.state.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.path != ROUTE_PATH:
+            self._send_json(404, {'error': 'Not found'})
+            return
+        failure = self.state.should_fail()
+        if failure == 429:
+            self._send_json(429, {'error': 'Too many requests'}, {'Retry-After': '0'})
+            return
+        if failure:
+            self._send_json(failure, {'error': 'Service unavailable'})
+            return
+        content = multipart_file(body, self.headers.get('Content-Type', ''))
+        if content is None:
+            self._send_json(400, {'error': 'No file provided'})
+            return
+        results = process_rows(self.state, content.decode('utf-8'))
+        if not results['details']:
+            self._send_json(400, {'error': 'No data found in the file'})
+            return
+        self._send_json(200, results)
+
+
+def serve(port: int = DEFAULT_PORT, state: Optional[StubState] = None, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """Start the stub in a background thread; call ``shutdown()`` on the result to stop it"""
+    handler = type('BoundStubHandler', (StubHandler,), {'state': state or StubState()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Stand-in for the alumni-migration upload endpoint')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument('--row-ms', type=float, default=DEFAULT_ROW_MS,
+                        help=f'Simulated database time per row (default: {DEFAULT_ROW_MS:g})')
+    parser.add_argument('--fail-rate', type=float, default=0.0,
+                        help='Share of requests answered with 429/503 (default: 0)')
+    parser.add_argument('--seed', type=int, help='Seed for the failures')
+    args = parser.parse_args()
+
+    state = StubState(args.row_ms / 1000, args.fail_rate, args.seed)
+    server = serve(args.port, state)
+    print(f"🧪 Upload stub on http://127.0.0.1:{args.port}{ROUTE_PATH} "
+          f"({args.row_ms:g} ms/row, {args.fail_rate:.0%} failures); Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    print(f"\n📊 {state.requests} requests ({state.rejected} failed on purpose), {state.rows} rows, "
+          f"{len(state.emails)} accounts, {state.connections} connections")
+
+
+if __name__ == '__main__':
+    main()
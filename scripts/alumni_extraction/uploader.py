@@ -0,0 +1,438 @@
+"""
+Upload alumni CSVs to the alumni-migration endpoint in concurrent chunks.
+
+The admin page posts one whole file to
+``/api/admin/alumni-migration/upload``, which then works through it 50
+rows at a time (``BATCH_SIZE`` in the route), one Supabase round trip
+after another. This client splits the input into chunks of that size and
+posts them concurrently:
+
+  - ``--concurrency`` worker threads, each taking a keep-alive connection
+    from a shared pool, so at most that many requests are in flight and
+    connections are reused across chunks;
+  - a chunk answered with 429 or 5xx, or lost to a connection error, is
+    retried with exponential backoff and full jitter (a Retry-After header
+    is honoured); other 4xx answers are not retried;
+  - every chunk the server answered is recorded in a checkpoint file,
+    keyed by a hash of the endpoint and the chunk's content, so an
+    interrupted run resumes where it stopped (``--restart`` ignores it).
+
+A chunk never spans two input files, since their headers may differ.
+Per-row failures reported by the route (missing fields, "User already
+exists") are counted and can be written out with ``--errors``; a row
+that already exists is counted separately, since that is what a retried
+chunk that had been partly applied returns.
+
+``python -m alumni_extraction.upload_stub`` serves a stand-in for the
+endpoint; ``scripts/benchmarks/bench_upload.py`` compares this client with
+the one-file-per-request path of the admin page.
+
+Usage (from the scripts directory):
+
+  python -m alumni_extraction.uploader delta.csv [more.csv ...]
+      [--url http://localhost:3000] [--concurrency 4] [--chunk-rows 50]
+      [--retries 5] [--checkpoint PATH] [--restart] [--errors errors.csv]
+      [--header 'Cookie: ...']
+"""
+
+import csv
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_URL = 'http://localhost:3000'
+ROUTE_PATH = '/api/admin/alumni-migration/upload'
+CHUNK_ROWS = 50                 # BATCH_SIZE in the upload route
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RETRIES = 5
+BACKOFF_BASE_S = 0.5
+BACKOFF_MAX_S = 30.0
+REQUEST_TIMEOUT_S = 120.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+EXISTING_ERROR = 'User already exists'
+DEFAULT_CHECKPOINT = Path(__file__).resolve().parent.parent / '.upload-checkpoint.json'
+
+ERROR_COLUMNS = ['Source', 'First Row', 'Email', 'Error']
+
+
+class Chunk(NamedTuple):
+    """Rows of one input file, sent as one request"""
+    index: int
+    source: str
+    first_row: int              # 1-based data row of the first row in the chunk
+    rows: int
+    body: bytes                 # CSV with the file's header
+    digest: str
+
+
+class ChunkResult(NamedTuple):
+    """What the endpoint answered for one chunk"""
+    chunk: Chunk
+    status: int                 # HTTP status of the last attempt, 0 if none connected
+    attempts: int
+    processed: int
+    failed: int
+    existing: int
+    errors: List[Tuple[str, str]]   # (email, error) of failed rows
+    seconds: float
+    resumed: bool = False
+    error: str = ''             # why the chunk was given up, if it was
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+class UploadSummary(NamedTuple):
+    chunks: int
+    rows: int
+    sent_rows: int              # rows of the chunks posted in this run (not resumed)
+    processed: int
+    failed: int
+    existing: int
+    resumed: int
+    retries: int
+    given_up: List[ChunkResult]
+    seconds: float
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.sent_rows / self.seconds if self.seconds else 0.0
+
+
+def read_chunks(paths: Sequence, chunk_rows: int = CHUNK_ROWS, salt: str = '') -> Iterator[Chunk]:
+    """Split CSV files into chunks of ``chunk_rows`` data rows (0: one chunk per file)"""
+    import hashlib
+    import io
+    index = 0
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                continue
+            rows: List[List[str]] = []
+            first_row = 1
+            for number, row in enumerate(reader, 1):
+                if not any(value.strip() for value in row):
+                    continue
+                if not rows:
+                    first_row = number
+                rows.append(row)
+                if chunk_rows and len(rows) == chunk_rows:
+                    yield _chunk(index, Path(path).name, first_row, header, rows, salt, hashlib, io)
+                    index += 1
+                    rows = []
+            if rows:
+                yield _chunk(index, Path(path).name, first_row, header, rows, salt, hashlib, io)
+                index += 1
+
+
+def _chunk(index, source, first_row, header, rows, salt, hashlib, io) -> Chunk:
+    buffer = io.StringIO()
+    # The route splits on '\n' and trims, so plain newlines are the safe choice
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(header)
+    writer.writerows(rows)
+    body = buffer.getvalue().encode('utf-8')
+    digest = hashlib.blake2b(salt.encode('utf-8') + b'\0' + body, digest_size=16).hexdigest()
+    return Chunk(index, source, first_row, len(rows), body, digest)
+
+
+def multipart_body(filename: str, content: bytes, field: str = 'file') -> Tuple[bytes, str]:
+    """A multipart/form-data body with one file field, and its Content-Type"""
+    import uuid
+    boundary = f"----bghs{uuid.uuid4().hex}"
+    head = (f'--{boundary}\r\nContent-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f'Content-Type: text/csv\r\n\r\n').encode('utf-8')
+    return head + content + f'\r\n--{boundary}--\r\n'.encode('utf-8'), f'multipart/form-data; boundary={boundary}'
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP connections to one host, shared by the worker threads.
+
+    A connection is taken for one request and handed back afterwards; one
+    that failed is closed instead, and a new one is opened when the pool
+    is empty. With N workers there are never more than N connections.
+    """
+
+    def __init__(self, url: str, timeout: float = REQUEST_TIMEOUT_S):
+        import queue
+        from urllib.parse import urlsplit
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        self.https = parts.scheme == 'https'
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip('/')
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self.opened = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        import http.client
+        with self._lock:
+            self.opened += 1
+        cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    @contextmanager
+    def connection(self):
+        import queue
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        except BaseException:
+            conn.close()
+            raise
+        self._idle.put(conn)
+
+    def close(self):
+        import queue
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class Checkpoint:
+    """
+    Digests of the chunks the endpoint has answered, kept in a JSON file.
+
+    The file is rewritten (write to a temporary file, then rename) after
+    every chunk, so a killed run loses at most the chunks in flight.
+    """
+
+    def __init__(self, path, restart: bool = False):
+        import json
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.chunks: Dict[str, Dict] = {}
+        if not restart:
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self.chunks = json.load(f).get('chunks', {})
+            except (OSError, ValueError):
+                self.chunks = {}
+
+    def get(self, digest: str) -> Optional[Dict]:
+        return self.chunks.get(digest)
+
+    def record(self, result: ChunkResult):
+        import json
+        with self._lock:
+            self.chunks[result.chunk.digest] = {
+                'source': result.chunk.source, 'first_row': result.chunk.first_row, 'rows': result.chunk.rows,
+                'processed': result.processed, 'failed': result.failed, 'existing': result.existing,
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'chunks': self.chunks}, f, indent=1)
+            os.replace(tmp_path, self.path)
+
+
+def backoff_delay(attempt: int, rng, retry_after: Optional[str] = None,
+                  base: float = BACKOFF_BASE_S, cap: float = BACKOFF_MAX_S) -> float:
+    """Full-jitter exponential backoff; never shorter than a numeric Retry-After"""
+    delay = rng.uniform(0, min(cap, base * 2 ** attempt))
+    try:
+        return max(delay, float(retry_after)) if retry_after else delay
+    except ValueError:
+        return delay     # an HTTP date; the jittered delay will do
+
+
+def _route_result(data: bytes) -> Tuple[int, int, int, List[Tuple[str, str]]]:
+    """(processed, failed, existing, errors) from the route's JSON answer"""
+    import json
+    try:
+        answer = json.loads(data)
+    except ValueError:
+        return 0, 0, 0, []
+    errors = [(detail.get('email', ''), detail.get('error', '')) for detail in answer.get('details', [])
+              if detail.get('status') == 'failed']
+    existing = sum(1 for _, error in errors if error == EXISTING_ERROR)
+    return answer.get('processed', 0), answer.get('failed', 0) - existing, existing, errors
+
+
+def post_chunk(pool: ConnectionPool, chunk: Chunk, retries: int = DEFAULT_RETRIES,
+               headers: Optional[Dict[str, str]] = None, rng=None,
+               sleep: Callable[[float], None] = None) -> ChunkResult:
+    """POST one chunk, retrying 429/5xx and connection errors with backoff"""
+    import http.client
+    import random
+    import time
+    rng = rng or random.Random()
+    sleep = sleep or time.sleep
+    body, content_type = multipart_body(f"{Path(chunk.source).stem}-{chunk.first_row}.csv", chunk.body)
+    request_headers = {'Content-Type': content_type, 'Content-Length': str(len(body)), 'Connection': 'keep-alive'}
+    request_headers.update(headers or {})
+
+    start = time.perf_counter()
+    status, reason = 0, ''
+    for attempt in range(retries + 1):
+        if attempt:
+            sleep(backoff_delay(attempt - 1, rng, retry_after))
+        retry_after = None
+        try:
+            with pool.connection() as conn:
+                conn.request('POST', pool.base_path + ROUTE_PATH, body, request_headers)
+                response = conn.getresponse()
+                data = response.read()
+                if response.will_close:
+                    conn.close()     # reopened by http.client on the next request
+        except (OSError, http.client.HTTPException) as e:
+            status, reason = 0, f"{type(e).__name__}: {e}"
+            continue
+        status = response.status
+        if status < 300:
+            processed, failed, existing, errors = _route_result(data)
+            return ChunkResult(chunk, status, attempt + 1, processed, failed, existing, errors,
+                               time.perf_counter() - start)
+        reason = f"HTTP {status}: {data[:200].decode('utf-8', 'replace')}"
+        if status not in RETRY_STATUSES:
+            break
+        retry_after = response.getheader('Retry-After')
+    return ChunkResult(chunk, status, attempt + 1, 0, 0, 0, [], time.perf_counter() - start, error=reason)
+
+
+def upload(chunks: Iterable[Chunk], url: str = DEFAULT_URL, concurrency: int = DEFAULT_CONCURRENCY,
+           retries: int = DEFAULT_RETRIES, checkpoint: Optional[Checkpoint] = None,
+           headers: Optional[Dict[str, str]] = None,
+           on_result: Optional[Callable[[ChunkResult], None]] = None) -> UploadSummary:
+    """Post chunks with at most ``concurrency`` requests in flight; skips checkpointed chunks"""
+    import random
+    import time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    start = time.perf_counter()
+    pool = ConnectionPool(url)
+    results: List[ChunkResult] = []
+    pending = []
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for chunk in chunks:
+                done = checkpoint.get(chunk.digest) if checkpoint else None
+                if done is not None:
+                    result = ChunkResult(chunk, 200, 0, done['processed'], done['failed'], done['existing'],
+                                         [], 0.0, resumed=True)
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+                    continue
+                # One generator per chunk: random.Random is not safe to share across threads
+                rng = random.Random(chunk.digest)
+                pending.append(executor.submit(post_chunk, pool, chunk, retries, headers, rng))
+            for future in as_completed(pending):
+                result = future.result()
+                if checkpoint and result.ok:
+                    checkpoint.record(result)
+                results.append(result)
+                if on_result:
+                    on_result(result)
+    finally:
+        pool.close()
+
+    return UploadSummary(
+        chunks=len(results),
+        rows=sum(r.chunk.rows for r in results),
+        sent_rows=sum(r.chunk.rows for r in results if not r.resumed),
+        processed=sum(r.processed for r in results),
+        failed=sum(r.failed for r in results),
+        existing=sum(r.existing for r in results),
+        resumed=sum(1 for r in results if r.resumed),
+        retries=sum(max(r.attempts - 1, 0) for r in results),
+        given_up=sorted((r for r in results if not r.ok), key=lambda r: r.chunk.index),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def parse_headers(values: Sequence[str]) -> Dict[str, str]:
+    headers = {}
+    for value in values:
+        name, sep, content = value.partition(':')
+        if not sep or not name.strip():
+            raise ValueError(f"Header must look like 'Name: value': {value!r}")
+        headers[name.strip()] = content.strip()
+    return headers
+
+
+def main():
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description='Upload alumni CSVs to the migration endpoint in concurrent chunks')
+    parser.add_argument('inputs', nargs='+', help='CSV files to upload (e.g. a delta from upload_delta)')
+    parser.add_argument('--url', default=os.environ.get('BGHS_UPLOAD_URL', DEFAULT_URL),
+                        help=f'Site base URL (default: $BGHS_UPLOAD_URL or {DEFAULT_URL})')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Requests in flight (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS,
+                        help=f'Rows per request, 0 for one request per file (default: {CHUNK_ROWS}, the route batch size)')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help=f'Retries per chunk on 429/5xx or connection errors (default: {DEFAULT_RETRIES})')
+    parser.add_argument('--checkpoint',
+                        help=f'Checkpoint file (default: $BGHS_UPLOAD_CHECKPOINT or {DEFAULT_CHECKPOINT.name})')
+    parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and upload every chunk')
+    parser.add_argument('--errors', help='Write rows the endpoint rejected to this CSV')
+    parser.add_argument('--header', action='append', default=[], metavar='"NAME: VALUE"',
+                        help='Extra request header, e.g. a session cookie (repeatable)')
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+
+    try:
+        headers = parse_headers(args.header)
+    except ValueError as e:
+        parser.error(str(e))
+    checkpoint = Checkpoint(args.checkpoint or os.environ.get('BGHS_UPLOAD_CHECKPOINT') or DEFAULT_CHECKPOINT,
+                            restart=args.restart)
+    chunks = list(read_chunks(args.inputs, args.chunk_rows, salt=args.url.rstrip('/')))
+    print(f"📤 {sum(c.rows for c in chunks)} rows in {len(chunks)} chunk(s) to {args.url.rstrip('/')}{ROUTE_PATH}, "
+          f"{args.concurrency} at a time")
+
+    errors = []
+
+    def report(result: ChunkResult):
+        where = f"{result.chunk.source} rows {result.chunk.first_row}-{result.chunk.first_row + result.chunk.rows - 1}"
+        if result.resumed:
+            return
+        if not result.ok:
+            print(f"❌ {where}: gave up after {result.attempts} attempt(s): {result.error}")
+            return
+        retried = f", {result.attempts - 1} retries" if result.attempts > 1 else ''
+        print(f"   {where}: {result.processed} added, {result.failed} failed, {result.existing} existing "
+              f"({result.seconds:.1f}s{retried})")
+        errors.extend((result.chunk.source, result.chunk.first_row, email, error) for email, error in result.errors)
+
+    summary = upload(chunks, args.url, args.concurrency, args.retries, checkpoint, headers, report)
+
+    print(f"\n📊 {summary.rows} rows in {summary.seconds:.1f}s ({summary.rows_per_s:.1f} rows/s): "
+          f"{summary.processed} added, {summary.failed} failed, {summary.existing} already existed")
+    if summary.resumed:
+        print(f"⏭️ {summary.resumed} chunk(s) skipped, already uploaded according to {checkpoint.path}")
+    if summary.retries:
+        print(f"🔁 {summary.retries} retried request(s)")
+    if args.errors:
+        with open(args.errors, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(ERROR_COLUMNS)
+            writer.writerows(errors)
+        print(f"💾 {len(errors)} rejected row(s) written to {args.errors}")
+    if summary.given_up:
+        print(f"⚠️ {len(summary.given_up)} chunk(s) were not uploaded; run again to retry them")
+        sys.exit(1)
+    print("✅ Upload complete")
+
+
+if __name__ == '__main__':
+    main()
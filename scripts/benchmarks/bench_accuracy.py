@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Ground-truth accuracy and throughput of the generic extractor.
+
+Runs the extraction pipeline (OCR, parsing, entry sequence repair with
+gap fill) on every page image whose entry range has hand-verified truth,
+and scores the records field by field against it (see
+alumni_extraction.evaluation). Wall and CPU time are measured per page;
+CPU time includes the Tesseract child processes.
+
+Truth covers the range CSVs in the repository root, the ai-manual
+extraction literals and 1-56.csv. Only 57-86 has a page image in the
+repository; --synthetic adds a rendered, replayed page for every range CSV
+whose page was not scored, which measures the parser and sequence repair
+with perfect OCR. Replay recordings marked synthetic are reported as such.
+
+Save results with -o and compare a later run (a cheaper preset, a
+different --psm, ...) against them with --compare, so every speed change
+shows its accuracy cost.
+
+Usage:
+  python scripts/benchmarks/bench_accuracy.py [images or dirs ...] [--replay DIR] [--synthetic]
+      [--psm 6] [--no-bengali] [--no-gap-fill] [--label NAME] [-o results.json] [--compare baseline.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alumni_extraction.backends import BACKEND_ENV, ReplayBackend, add_backend_arguments, backend_from_args
+from alumni_extraction.capabilities import missing_requirements
+from alumni_extraction.evaluation import (
+    SCORED_FIELDS,
+    FieldScore,
+    load_ground_truth,
+    score_records,
+    truth_for_range,
+)
+from alumni_extraction.extract import repair_with_gap_fill
+from alumni_extraction.ocr import extract_text_from_image
+from alumni_extraction.parsing import parse_alumni_from_text
+from alumni_extraction.sequence import parse_entry_range
+from register_pages import REPO_ROOT, build_synthetic_pages
+
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.tif', '.tiff')
+
+
+def cpu_seconds() -> float:
+    """CPU time of this process and its finished children (Tesseract runs as a child)"""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def find_images(paths, truth):
+    """Page images whose file name gives an entry range covered by the truth"""
+    candidates = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            candidates.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES))
+        else:
+            candidates.append(path)
+    images = []
+    for path in candidates:
+        entry_range = parse_entry_range(str(path))
+        if entry_range and truth_for_range(truth, entry_range):
+            images.append((str(path), entry_range))
+    return images
+
+
+def extract_page(image_path, entry_range, backend, args):
+    text = extract_text_from_image(image_path, use_bengali=not args.no_bengali, psm=args.psm, backend=backend)
+    records = parse_alumni_from_text(text)
+    report = None
+    if records:
+        records, report = repair_with_gap_fill(records, image_path, entry_range,
+                                               use_bengali=not args.no_bengali, backend=backend,
+                                               gap_fill=not args.no_gap_fill)
+    return records, report
+
+
+def run_page(image_path, entry_range, kind, backend, truth, args):
+    if isinstance(backend, ReplayBackend):
+        try:
+            image = backend.load_image(image_path)
+        except ValueError:
+            print(f"   {Path(image_path).name:<22} skipped (no OCR recording)")
+            return None
+        if image.recording.get('synthetic'):
+            # Rendered from the truth: it measures the parser, not OCR
+            kind = 'synthetic'
+
+    wall, cpu = time.perf_counter(), cpu_seconds()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        records, report = extract_page(image_path, entry_range, backend, args)
+    wall, cpu = time.perf_counter() - wall, cpu_seconds() - cpu
+    if args.verbose:
+        print(output.getvalue(), end='')
+
+    scores = score_records(records, truth_for_range(truth, entry_range))
+    return {
+        'image': image_path,
+        'kind': kind,
+        'range': list(entry_range),
+        'records': len(records),
+        'missing': report.missing if report else [],
+        'wall_s': round(wall, 4),
+        'cpu_s': round(cpu, 4),
+        'scores': {field: score for field, score in scores.items()},
+    }
+
+
+def summarize(pages):
+    totals = {field: FieldScore() for field in SCORED_FIELDS}
+    for page in pages:
+        for field, score in page['scores'].items():
+            totals[field] += score
+    wall = sum(p['wall_s'] for p in pages)
+    return {
+        'pages': len(pages),
+        'records': sum(p['records'] for p in pages),
+        'wall_s': round(wall, 4),
+        'cpu_s': round(sum(p['cpu_s'] for p in pages), 4),
+        'pages_per_s': round(len(pages) / wall, 2) if wall else 0.0,
+        'scores': {field: score.to_dict() for field, score in totals.items()},
+    }
+
+
+def print_page(page):
+    entries = page['scores']['entry_number']
+    print(f"   {Path(page['image']).name:<22} {page['kind']:<9} {page['records']:>4} rec  "
+          f"entry P {entries.precision:.2f} R {entries.recall:.2f}  "
+          f"wall {page['wall_s']:.2f}s cpu {page['cpu_s']:.2f}s")
+
+
+def print_totals(totals, baseline=None):
+    print(f"\n   {'field':<13} {'precision':>9} {'recall':>7} {'f1':>6}")
+    for field in SCORED_FIELDS:
+        score = totals['scores'][field]
+        line = f"   {field:<13} {score['precision']:>9.3f} {score['recall']:>7.3f} {score['f1']:>6.3f}"
+        if baseline:
+            base = baseline['totals']['scores'][field]
+            line += (f"   ΔP {score['precision'] - base['precision']:+.3f}"
+                     f" ΔR {score['recall'] - base['recall']:+.3f}")
+        print(line)
+    line = (f"\n   {totals['pages']} page(s), {totals['records']} records, "
+            f"wall {totals['wall_s']:.2f}s, cpu {totals['cpu_s']:.2f}s")
+    if baseline:
+        base = baseline['totals']
+        if base['wall_s']:
+            line += f" (wall x{totals['wall_s'] / base['wall_s']:.2f}"
+            line += f", cpu x{totals['cpu_s'] / base['cpu_s']:.2f})" if base['cpu_s'] else ')'
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score the extractor against the hand-verified pages')
+    parser.add_argument('images', nargs='*', help='Images or directories (default: scripts/ and the repository root)')
+    parser.add_argument('--synthetic', action='store_true',
+                        help='Also score a rendered, replayed page for every range CSV without an image')
+    parser.add_argument('--psm', type=int, default=6, help='Tesseract page segmentation mode (default: 6)')
+    parser.add_argument('--no-bengali', action='store_true', help='Skip Bengali OCR, use English only')
+    parser.add_argument('--no-gap-fill', action='store_true', help='Do not re-run OCR for missing entries')
+    parser.add_argument('--label', default='', help='Name for this configuration in the results')
+    parser.add_argument('-o', '--output', help='Write results as JSON')
+    parser.add_argument('--compare', metavar='JSON', help='Show differences from an earlier results file')
+    parser.add_argument('--verbose', action='store_true', help='Show the extractor output for each page')
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+
+    truth = load_ground_truth(REPO_ROOT)
+    images = find_images(args.images or [REPO_ROOT / 'scripts', REPO_ROOT], truth)
+    if not args.replay and os.environ.get(BACKEND_ENV) != 'replay':
+        missing = missing_requirements()
+        if missing:
+            print(f"❌ Tesseract OCR cannot run here: missing {', '.join(missing)}")
+            print("   Run with --replay scripts/benchmarks/fixtures/ocr --synthetic to score replayed pages")
+            sys.exit(1)
+    backend = backend_from_args(args)
+    print(f"📚 {len(truth)} truth entries, {len(images)} page image(s), OCR backend: {backend.name}")
+
+    pages = []
+
+    def score(path, entry_range, kind, page_backend):
+        page = run_page(path, entry_range, kind, page_backend, truth, args)
+        if page:
+            print_page(page)
+            pages.append(page)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for path, entry_range in images:
+            score(path, entry_range, 'image', backend)
+        if args.synthetic:
+            # Ranges whose scanned page was skipped (no recording) get a rendered page too
+            covered = {tuple(page['range']) for page in pages if page['kind'] == 'image'}
+            synthetic_dir = Path(workdir, 'pages')
+            synthetic_images = build_synthetic_pages(synthetic_dir)
+            synthetic_backend = ReplayBackend(str(synthetic_dir))
+            for path in synthetic_images:
+                entry_range = parse_entry_range(path)
+                if entry_range not in covered:
+                    score(path, entry_range, 'synthetic', synthetic_backend)
+
+    if not pages:
+        print("❌ No pages scored")
+        sys.exit(1)
+
+    totals = summarize(pages)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n🔁 Compared with {args.compare} ({baseline.get('label') or 'unlabelled'})")
+        if {Path(p['image']).name for p in baseline['pages']} != {Path(p['image']).name for p in pages}:
+            print("⚠️ The two runs scored different pages; totals are not directly comparable")
+    print_totals(totals, baseline)
+
+    if args.output:
+        for page in pages:
+            page['scores'] = {field: score.to_dict() for field, score in page['scores'].items()}
+        results = {
+            'label': args.label,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'config': {'backend': backend.name, 'psm': args.psm, 'bengali': not args.no_bengali,
+                       'gap_fill': not args.no_gap_fill, 'synthetic': args.synthetic},
+            'python': platform.python_version(),
+            'pages': pages,
+            'totals': totals,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
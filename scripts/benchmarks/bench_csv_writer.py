@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming CSV writer vs the old pandas DataFrame path.
+
+Writes the same synthetic records both ways and reports wall time and
+peak traced memory. The streaming writer's peak should stay flat as
+--count grows; the DataFrame path grows with the batch.
+
+Usage:
+  python scripts/benchmarks/bench_csv_writer.py [--count 100000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alumni_extraction.csv_writer import TEMPLATE_COLUMNS, template_row, write_template_csv
+from alumni_extraction.records import AlumniRecord
+from bench_record_memory import synthetic_fields
+
+
+def synthetic_records(count: int):
+    """Generate records lazily, as a parser would"""
+    for fields in synthetic_fields_iter(count):
+        yield AlumniRecord(**fields)
+
+
+def synthetic_fields_iter(count: int, chunk: int = 10_000):
+    done = 0
+    while done < count:
+        size = min(chunk, count - done)
+        for fields in synthetic_fields(size, seed=done):
+            yield fields
+        done += size
+
+
+def streaming_path(count: int, output_path: str):
+    write_template_csv(synthetic_records(count), output_path)
+
+
+def dataframe_path(count: int, output_path: str):
+    import pandas as pd
+    rows = [dict(zip(TEMPLATE_COLUMNS, template_row(r))) for r in synthetic_records(count)]
+    df = pd.DataFrame(rows, columns=TEMPLATE_COLUMNS)
+    df.to_csv(output_path, index=False, encoding='utf-8')
+    # The old summary built filtered copies just to count rows
+    len(df[df['Year of Leaving'] != ''])
+    len(df[df['Year of Leaving'] == ''])
+
+
+def run(name, fn, count, output_path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(count, output_path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"   {name:<10} {elapsed:7.2f}s  {count / elapsed:10,.0f} rows/s  peak {peak / 2**20:7.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the streaming CSV writer with the DataFrame path')
+    parser.add_argument('--count', type=int, default=100_000, help='Number of synthetic records')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, 'out.csv')
+        print(f"📊 Writing {args.count:,} records")
+        run('streaming', streaming_path, args.count, output_path)
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            print("   dataframe  skipped (pandas not installed)")
+            return
+        run('dataframe', dataframe_path, args.count, output_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: email allocation from several processes sharing one index.
+
+Each of --workers processes asks for --count addresses (split evenly) in
+chunks of --chunk, drawing names from a small pool of register names so
+nearly every request collides (plus single-token names that fall back to
+alumni.member). Checks that no address was handed out twice, and prints
+the median chunk time over the first and the last quarter of each
+worker's chunks (lock waits included): allocation should not slow down
+as the suffixes grow.
+
+Usage:
+  python scripts/benchmarks/bench_emails.py [--count 40000] [--workers 4] [--chunk 500]
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alumni_extraction.emails import EmailIndex, EmailRequest
+
+NAMES = [
+    ('Barin', 'Chattopadhyay'), ('Ashok', 'Roy'), ('Ashim', 'Roy'), ('Pranab', 'Roy'),
+    ('Nirmal', 'Chattopadhyay'), ('Bimal', 'Chakraborty'), ('Subrata', 'Ghosh'),
+    ('Gopal', 'Ghosh'), ('Samarendra', 'Roy'), ('Tapan', 'De Sarkar'), ('Delwar', ''),
+]
+
+
+def run_worker(index_path: str, worker: int, count: int, chunk: int):
+    """Allocate ``count`` addresses; returns (addresses, seconds per chunk)"""
+    rng = random.Random(worker)
+    addresses, timings = [], []
+    with EmailIndex(index_path) as index:
+        for first in range(0, count, chunk):
+            requests = []
+            for i in range(first, min(first + chunk, count)):
+                given, family = rng.choice(NAMES)
+                year = rng.choice(('', '1954', '1963'))
+                requests.append(EmailRequest(f"w{worker}:{i}", '', given, family, year, f"worker{worker}"))
+            start = time.perf_counter()
+            addresses.extend(allocation.email for allocation in index.allocate_many(requests))
+            timings.append(time.perf_counter() - start)
+    return addresses, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared email index throughput')
+    parser.add_argument('--count', type=int, default=40_000, help='Addresses in total (default: 40000)')
+    parser.add_argument('--workers', type=int, default=4, help='Worker processes (default: 4)')
+    parser.add_argument('--chunk', type=int, default=500, help='Requests per allocate_many (default: 500)')
+    args = parser.parse_args()
+
+    per_worker = args.count // args.workers
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = str(Path(tmp) / 'emails.sqlite3')
+        EmailIndex(index_path).close()
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(run_worker, [index_path] * args.workers, range(args.workers),
+                                        [per_worker] * args.workers, [args.chunk] * args.workers))
+        elapsed = time.perf_counter() - start
+        stored = sqlite3.connect(index_path).execute('SELECT COUNT(*) FROM issued_email').fetchone()[0]
+
+    addresses = [address.lower() for worker_addresses, _ in results for address in worker_addresses]
+    duplicates = len(addresses) - len(set(addresses))
+    quarter = max(1, len(results[0][1]) // 4)
+    first = statistics.median(t for _, timings in results for t in timings[:quarter])
+    last = statistics.median(t for _, timings in results for t in timings[-quarter:])
+
+    print(f"📊 {len(addresses)} addresses from {args.workers} worker(s) in {elapsed:.2f} s "
+          f"({len(addresses) / elapsed:,.0f} rows/s), {stored} in the index")
+    print(f"   {'first chunks':<14} {first * 1000:>8.1f} ms (median)")
+    print(f"   {'last chunks':<14} {last * 1000:>8.1f} ms (median)")
+    print(f"   {'duplicates':<14} {duplicates:>8}")
+    sys.exit(1 if duplicates or stored != len(addresses) else 0)
+
+
+if __name__ == '__main__':
+    main()
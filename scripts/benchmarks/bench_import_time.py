@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for the extractor CLIs.
+
+Runs each CLI with ``--help`` under ``python -X importtime`` and reports
+the total import time, the slowest top-level imports and the cold-start
+wall time. Fails (exit 1) if a CLI goes over the budget or pulls in one of
+the heavy OCR/data modules before it has any work to do. The admin upload
+route spawns a process per upload, so this start-up cost is paid per
+request.
+
+Usage:
+  python scripts/benchmarks/bench_import_time.py [--budget-ms 60] [--runs 5]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+CLIS = [
+    'extract-bengali-alumni-generic.py',
+    'batch-extract-alumni.py',
+    'bengali-image-extractor.py',
+    'bengali-image-extractor-real.py',
+    'bengali-image-extractor-working.py',
+    'bengali-image-extractor-english-fallback.py',
+    'resplit-alumni-names.py',
+]
+
+# Modules that must not be imported just to parse arguments
+HEAVY_MODULES = ('cv2', 'pytesseract', 'pandas', 'numpy', 'PIL')
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def parse_importtime(stderr: str):
+    """Return [(module, cumulative_us, depth)] from -X importtime output"""
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            depth = (len(match.group(3)) - 1) // 2
+            entries.append((match.group(4), int(match.group(2)), depth))
+    return entries
+
+
+def measure_cli(script: str, runs: int):
+    """Best-of-N import time and wall time for `script --help`"""
+    best_imports = None
+    best_wall = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', str(SCRIPTS_DIR / script), '--help'],
+            capture_output=True, text=True, cwd=SCRIPTS_DIR,
+        )
+        wall = time.perf_counter() - start
+        entries = parse_importtime(proc.stderr)
+        if best_wall is None or wall < best_wall:
+            best_wall = wall
+            best_imports = entries
+    return best_imports, best_wall, proc.returncode
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check extractor CLI import time against a budget')
+    parser.add_argument('--budget-ms', type=float, default=60.0,
+                        help='Maximum total import time per CLI in milliseconds (default: 60)')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per CLI; the fastest is reported')
+    parser.add_argument('--top', type=int, default=3, help='Slowest top-level imports to show')
+    args = parser.parse_args()
+
+    failures = []
+    print(f"⏱️ Import budget: {args.budget_ms:.0f} ms per CLI (--help, best of {args.runs})")
+    for script in CLIS:
+        entries, wall, returncode = measure_cli(script, args.runs)
+        top_level = [(name, us) for name, us, depth in entries if depth == 0]
+        total_ms = sum(us for _, us in top_level) / 1000
+        heavy = sorted({name.split('.')[0] for name, _, _ in entries} & set(HEAVY_MODULES))
+
+        status = '✅'
+        if returncode != 0:
+            status = '❌'
+            failures.append(f"{script}: --help exited with {returncode}")
+        if total_ms > args.budget_ms:
+            status = '❌'
+            failures.append(f"{script}: imports took {total_ms:.1f} ms")
+        if heavy:
+            status = '❌'
+            failures.append(f"{script}: imports {', '.join(heavy)} before doing any work")
+
+        print(f"{status} {script:<45} imports {total_ms:6.1f} ms   wall {wall * 1000:6.1f} ms")
+        for name, us in sorted(top_level, key=lambda item: -item[1])[:args.top]:
+            print(f"      {us / 1000:6.1f} ms  {name}")
+
+    if failures:
+        print("\n❌ Over budget:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("\n✅ All CLIs within budget")
+
+
+if __name__ == "__main__":
+    main()
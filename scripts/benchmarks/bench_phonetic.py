@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: phonetic name keys, one name at a time vs a whole column.
+
+Builds a column of --count names drawn from the surnames and first names
+in the range CSVs (plus the Bengali-script surnames of the bengali_alumni_*
+files), then times ``encode`` in a loop and ``encode_batch`` on the whole
+column. ``--distinct`` gives every name a unique suffix, the worst case
+for the batch encoder, which otherwise encodes each distinct name once.
+Both must give the same keys; the check runs on a sample.
+
+Usage:
+  python scripts/benchmarks/bench_phonetic.py [--count 1000000] [--distinct] [--loop-count 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alumni_extraction.corpus import load_corpus
+from alumni_extraction.evaluation import range_csv_paths
+from alumni_extraction.phonetic import encode, encode_batch, key_to_code
+from register_pages import REPO_ROOT
+
+
+def corpus_names():
+    paths = range_csv_paths(REPO_ROOT) + sorted(REPO_ROOT.glob('bengali_alumni_*.csv'))
+    table = load_corpus(paths, columns=['First Name', 'Last Name'])
+    return sorted({name for name in table['First Name'] + table['Last Name'] if name})
+
+
+def build_column(count: int, distinct: bool, seed: int = 0):
+    rng = random.Random(seed)
+    names = corpus_names()
+    column = [rng.choice(names) for _ in range(count)]
+    if distinct:
+        column = [f"{name}{i}" for i, name in enumerate(column)]
+    return column
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Phonetic key throughput')
+    parser.add_argument('--count', type=int, default=1_000_000, help='Names in the column (default: 1000000)')
+    parser.add_argument('--distinct', action='store_true', help='Make every name distinct')
+    parser.add_argument('--loop-count', type=int, default=100_000,
+                        help='Names encoded one at a time (default: 100000)')
+    args = parser.parse_args()
+
+    column = build_column(args.count, args.distinct)
+    print(f"📊 {len(column)} names, {len(set(column))} distinct")
+
+    sample = column[:args.loop_count]
+    start = time.perf_counter()
+    loop_codes = [encode(name) for name in sample]
+    loop_s = time.perf_counter() - start
+
+    encode_batch(column[:10])  # numpy import and table setup
+    start = time.perf_counter()
+    keys = encode_batch(column)
+    batch_s = time.perf_counter() - start
+
+    mismatches = sum(key_to_code(key) != code for key, code in zip(keys[:len(sample)].tolist(), loop_codes))
+    print(f"   {'encode loop':<14} {len(sample) / loop_s / 1e6:>7.2f} M names/s")
+    print(f"   {'encode_batch':<14} {len(column) / batch_s / 1e6:>7.2f} M names/s ({batch_s * 1000:.0f} ms)")
+    print(f"   {'mismatches':<14} {mismatches:>7}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark: the extraction pipeline stage by stage, offline.
+
+OCR output is replayed from recordings (alumni_extraction.backends), so no
+Tesseract install is needed and every run sees the same input. Pages come
+from benchmarks/fixtures/ocr plus one synthetic page per range CSV in the
+repository root (see register_pages.py). The committed fixture is itself
+a synthetic page; captures made with --record can be added next to it.
+
+Stages, each timed per page:
+  preprocess     grayscale/threshold/denoise of the real page images (needs cv2)
+  ocr_dispatch   backend image lookup plus text and word-box retrieval
+  parse          OCR text -> AlumniRecords (line splitting, entries, years)
+  transliterate  Bengali -> Latin transliteration of each OCR line
+  name_split     first/middle/last name splitting
+  csv_write      streaming template CSV
+
+Reports pages/s, records/s and p50/p95 page latency for each stage.
+
+Usage:
+  python scripts/benchmarks/bench_pipeline.py [--repeat 5] [--pages 0] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alumni_extraction.backends import ReplayBackend, TesseractBackend
+from alumni_extraction.csv_writer import write_template_csv
+from alumni_extraction.image_extractor import transliterate_bengali_to_english
+from alumni_extraction.parsing import parse_alumni_from_text
+from register_pages import FIXTURES_DIR, build_synthetic_pages
+
+STAGES = ['preprocess', 'ocr_dispatch', 'parse', 'transliterate', 'name_split', 'csv_write']
+
+
+def percentile(samples, q: float) -> float:
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(samples)
+    rank = max(1, int(round(q / 100 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class StageTimer:
+    """Per-page latency samples and item counts for one stage"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.samples = []
+        self.pages = 0
+        self.records = 0
+
+    def time(self, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        self.samples.append(time.perf_counter() - start)
+        self.pages += 1
+        return result
+
+    def summary(self) -> dict:
+        if not self.samples:
+            return {'stage': self.name, 'skipped': True}
+        total = sum(self.samples)
+        return {
+            'stage': self.name,
+            'pages': self.pages,
+            'records': self.records,
+            'total_s': total,
+            'pages_per_s': self.pages / total if total else 0.0,
+            'records_per_s': self.records / total if total else 0.0,
+            'p50_ms': percentile(self.samples, 50) * 1000,
+            'p95_ms': percentile(self.samples, 95) * 1000,
+        }
+
+
+def load_page_images(workdir: str, pages: int):
+    """Replay backends and image paths: the recorded fixtures plus synthetic pages"""
+    scripts_dir = Path(__file__).resolve().parent.parent
+    fixtures = ReplayBackend(str(FIXTURES_DIR))
+    workload = [(fixtures, str(scripts_dir / r['image'])) for r in fixtures.recordings]
+    synthetic_dir = os.path.join(workdir, 'pages')
+    images = build_synthetic_pages(Path(synthetic_dir), limit=pages)
+    if images:
+        synthetic = ReplayBackend(synthetic_dir)
+        workload.extend((synthetic, path) for path in images)
+    return workload[:pages or None]
+
+
+def page_images():
+    """The scanned register pages in scripts/ (preprocessing needs real pixels)"""
+    scripts_dir = Path(__file__).resolve().parent.parent
+    return [str(p) for p in sorted(scripts_dir.glob('*-*.*')) if p.suffix.lower() in ('.png', '.jpg', '.jpeg')]
+
+
+def run_preprocess(timer: StageTimer, image_paths, repeat: int):
+    try:
+        backend = TesseractBackend()
+    except ImportError:
+        return False
+    images = [backend.load_image(p) for p in image_paths if os.path.exists(p)]
+    for _ in range(repeat):
+        for image in images:
+            timer.time(backend.preprocess, image)
+    return True
+
+
+def read_page(backend, image_path):
+    image = backend.load_image(image_path)
+    return backend.image_to_string(image), backend.image_to_words(image)
+
+
+def transliterate_lines(text: str):
+    return [transliterate_bengali_to_english(line) for line in text.splitlines()]
+
+
+def split_names(records):
+    for record in records:
+        record.split_name()
+
+
+def run(repeat: int, pages: int) -> list:
+    timers = {name: StageTimer(name) for name in STAGES}
+    with tempfile.TemporaryDirectory() as workdir:
+        workload = load_page_images(workdir, pages)
+        run_preprocess(timers['preprocess'], page_images(), repeat)
+
+        output_path = os.path.join(workdir, 'out.csv')
+        for _ in range(repeat):
+            for backend, image_path in workload:
+                text, _ = timers['ocr_dispatch'].time(read_page, backend, image_path)
+                records = timers['parse'].time(parse_alumni_from_text, text)
+                timers['transliterate'].time(transliterate_lines, text)
+                timers['name_split'].time(split_names, records)
+                timers['csv_write'].time(write_template_csv, records, output_path)
+                for name in ('ocr_dispatch', 'parse', 'transliterate', 'name_split', 'csv_write'):
+                    timers[name].records += len(records)
+    return [timers[name].summary() for name in STAGES]
+
+
+def print_table(results):
+    print(f"   {'stage':<14} {'pages/s':>10} {'records/s':>12} {'p50 ms':>9} {'p95 ms':>9}")
+    for row in results:
+        if row.get('skipped'):
+            print(f"   {row['stage']:<14} {'skipped':>10}")
+            continue
+        print(f"   {row['stage']:<14} {row['pages_per_s']:>10,.0f} {row['records_per_s']:>12,.0f} "
+              f"{row['p50_ms']:>9.3f} {row['p95_ms']:>9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-stage throughput and latency of the extraction pipeline')
+    parser.add_argument('--repeat', type=int, default=5, help='Passes over the page set')
+    parser.add_argument('--pages', type=int, default=0, help='Limit the number of pages (default: all)')
+    parser.add_argument('--json', metavar='PATH', help='Also write the results as JSON')
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.pages)
+    pages = next((r['pages'] for r in results if not r.get('skipped') and r['stage'] != 'preprocess'), 0)
+    print(f"📊 {pages // args.repeat} page(s) x {args.repeat} pass(es), OCR replayed from recordings")
+    print_table(results)
+    if any(r.get('skipped') for r in results):
+        print("   (preprocess needs opencv-python: pip install opencv-python)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'repeat': args.repeat, 'stages': results}, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: per-row dicts vs AlumniRecord vs RecordBatch.
+
+Builds a synthetic batch of register entries (100k by default) three ways
+and reports the bytes allocated per record, measured with tracemalloc:
+
+  dicts    - the old layout: a parse dict plus a CSV row dict per entry
+  records  - one AlumniRecord (__slots__) per entry
+  batch    - a column-wise RecordBatch
+
+Usage:
+  python scripts/benchmarks/bench_record_memory.py [--count 100000]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alumni_extraction.records import AlumniRecord, RecordBatch
+
+FIRST_NAMES = ['Arunmoy', 'Amiya', 'Subrata', 'Barin', 'Tapan', 'Ashish', 'Debi', 'Kiran']
+MIDDLE_NAMES = ['', 'Kumar', 'Prasad', 'Shankar', 'Ranjan']
+LAST_NAMES = ['Bandyopadhyay', 'Sarkar', 'Ghosh Dastidar', 'Chattopadhyay', 'Roy', 'Sengupta']
+
+
+def synthetic_fields(count: int, seed: int = 7):
+    """Field values per entry, created up front so every layout shares them"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        first, middle, last = rng.choice(FIRST_NAMES), rng.choice(MIDDLE_NAMES), rng.choice(LAST_NAMES)
+        year = str(rng.randint(1930, 2000))
+        rows.append({
+            'entry_number': str(i + 1),
+            'name': ' '.join(p for p in (first, middle, last) if p),
+            'year': year,
+            'title': 'Dr.' if i % 11 == 0 else '',
+            'deceased': i % 3 == 0,
+            'raw_text': f"{i + 1}. {first} {middle} {last} ({year})",
+            'first_name': first,
+            'middle_name': middle,
+            'last_name': last,
+            'email': f"{first.lower()}.{last.lower().replace(' ', '')}.{year}@bghs-alumni.com",
+            'notes': f"Entry #: {i + 1}",
+        })
+    return rows
+
+
+def build_dicts(fields):
+    parsed, csv_rows = [], []
+    for f in fields:
+        parsed.append({
+            'raw_text': f['raw_text'], 'entry_number': f['entry_number'], 'name': f['name'],
+            'year': f['year'], 'title': f['title'], 'deceased': f['deceased'],
+        })
+        csv_rows.append({
+            'Email': f['email'], 'Phone': '', 'First Name': f['first_name'],
+            'Last Name': f['last_name'], 'Middle Name': f['middle_name'],
+            'Last Class': '12', 'Year of Leaving': f['year'], 'Start Class': '',
+            'Start Year': '', 'Batch Year': f['year'], 'Profession': '', 'Company': '',
+            'Location': '', 'Bio': '', 'LinkedIn URL': '', 'Website URL': '',
+            'Role': 'alumni_member', 'Notes': f['notes'],
+        })
+    return parsed, csv_rows
+
+
+def build_records(fields):
+    return [AlumniRecord(**f) for f in fields]
+
+
+def build_batch(fields):
+    batch = RecordBatch()
+    for f in fields:
+        batch.append(AlumniRecord(**f))
+    return batch
+
+
+def measure(builder, fields) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = builder(fields)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare record layouts by memory per record')
+    parser.add_argument('--count', type=int, default=100_000, help='Number of synthetic records')
+    args = parser.parse_args()
+
+    fields = synthetic_fields(args.count)
+    results = [
+        ('dicts', measure(build_dicts, fields)),
+        ('records', measure(build_records, fields)),
+        ('batch', measure(build_batch, fields)),
+    ]
+
+    baseline = results[0][1]
+    print(f"📊 {args.count:,} synthetic records (field strings shared, container overhead only)")
+    for name, size in results:
+        ratio = 'baseline' if name == 'dicts' else f"{baseline / size:.1f}x smaller"
+        print(f"   {name:<8} {size / 2**20:8.1f} MiB  {size / args.count:7.0f} B/record  {ratio}")
+
+
+if __name__ == "__main__":
+    main()
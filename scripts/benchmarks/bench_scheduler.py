@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: interactive upload latency while a batch run holds the CPU slots.
+
+Simulates the two job classes of alumni_extraction.admission with
+busy-looping worker processes instead of Tesseract: ``--batch-workers``
+processes work through ``--batch-pages`` pages each, taking a batch slot
+per page, while single uploads arrive every ``--interval`` seconds as
+interactive jobs. Prints the wait for a slot and the latency (wait plus
+work) of each class. ``--fifo`` runs the batch pages as interactive jobs
+too, which is what every job got before the two classes existed; compare
+the two to see what the priority buys the uploads.
+
+Usage:
+  python scripts/benchmarks/bench_scheduler.py [--slots 2] [--batch-workers 2] [--batch-pages 15]
+      [--page-s 0.3] [--uploads 8] [--upload-s 0.3] [--interval 0.5] [--fifo] [--json out.json]
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alumni_extraction.admission import AdmissionController
+from bench_pipeline import percentile
+
+
+def burn(seconds: float):
+    """Keep one core busy, like a single-threaded OCR pass"""
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+def controller(state_dir: str, slots: int) -> AdmissionController:
+    # Nothing is rejected, so every job's latency is recorded
+    return AdmissionController(state_dir, slots=slots, threads=1, queue_limit=64, max_wait=math.inf)
+
+
+def timed_job(admission: AdmissionController, priority: str, seconds: float, results, job_class: str):
+    start = time.monotonic()
+    slot = admission.acquire(priority=priority)
+    burn(seconds)
+    slot.release()
+    results.put((job_class, slot.waited_s, time.monotonic() - start))
+
+
+def batch_worker(state_dir: str, slots: int, pages: int, page_s: float, priority: str, results):
+    admission = controller(state_dir, slots)
+    for _ in range(pages):
+        timed_job(admission, priority, page_s, results, 'batch')
+
+
+def upload(state_dir: str, slots: int, upload_s: float, results):
+    timed_job(controller(state_dir, slots), 'interactive', upload_s, results, 'interactive')
+
+
+def summarize(samples) -> dict:
+    classes = {}
+    for job_class in ('interactive', 'batch'):
+        waits = [wait for name, wait, _ in samples if name == job_class] or [0.0]
+        latencies = [latency for name, _, latency in samples if name == job_class] or [0.0]
+        classes[job_class] = {
+            'jobs': sum(1 for name, _, _ in samples if name == job_class),
+            'wait_s': {'p50': percentile(waits, 50), 'p95': percentile(waits, 95)},
+            'latency_s': {'p50': percentile(latencies, 50), 'p95': percentile(latencies, 95)},
+        }
+    return classes
+
+
+def run(args) -> dict:
+    results = multiprocessing.Queue()
+    with tempfile.TemporaryDirectory() as state_dir:
+        batch_priority = 'interactive' if args.fifo else 'batch'
+        batch = [multiprocessing.Process(target=batch_worker,
+                                         args=(state_dir, args.slots, args.batch_pages, args.page_s,
+                                               batch_priority, results))
+                 for _ in range(args.batch_workers)]
+        for process in batch:
+            process.start()
+        # Let the batch run fill the slots before the first upload arrives
+        time.sleep(args.page_s)
+
+        uploads = []
+        for _ in range(args.uploads):
+            process = multiprocessing.Process(target=upload, args=(state_dir, args.slots, args.upload_s, results))
+            process.start()
+            uploads.append(process)
+            time.sleep(args.interval)
+        samples = [results.get() for _ in range(args.uploads + args.batch_workers * args.batch_pages)]
+        for process in uploads + batch:
+            process.join()
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Interactive latency under a concurrent batch run')
+    parser.add_argument('--slots', type=int, default=2, help='CPU slots (default: 2)')
+    parser.add_argument('--batch-workers', type=int, default=2, help='Concurrent batch processes (default: 2)')
+    parser.add_argument('--batch-pages', type=int, default=15, help='Pages per batch process (default: 15)')
+    parser.add_argument('--page-s', type=float, default=0.3, help='CPU seconds per batch page (default: 0.3)')
+    parser.add_argument('--uploads', type=int, default=8, help='Interactive uploads (default: 8)')
+    parser.add_argument('--upload-s', type=float, default=0.3, help='CPU seconds per upload (default: 0.3)')
+    parser.add_argument('--interval', type=float, default=0.5, help='Seconds between uploads (default: 0.5)')
+    parser.add_argument('--fifo', action='store_true', help='Run batch pages as interactive jobs (no priority)')
+    parser.add_argument('--json', metavar='PATH', help='Also write the results as JSON')
+    args = parser.parse_args()
+
+    classes = run(args)
+    mode = 'fifo (no priority)' if args.fifo else 'interactive before batch'
+    print(f"📊 {args.slots} slot(s), {args.batch_workers} x {args.batch_pages} batch pages, "
+          f"{args.uploads} uploads, {mode}")
+    print(f"   {'class':<12} {'jobs':>5} {'wait p50':>9} {'wait p95':>9} {'lat p50':>9} {'lat p95':>9}")
+    for name, stats in classes.items():
+        wait, latency = stats['wait_s'], stats['latency_s']
+        print(f"   {name:<12} {stats['jobs']:>5} {wait['p50']:>8.2f}s {wait['p95']:>8.2f}s "
+              f"{latency['p50']:>8.2f}s {latency['p95']:>8.2f}s")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'config': vars(args), 'classes': classes}, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
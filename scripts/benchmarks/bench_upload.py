@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: uploading the range CSVs one file per request vs in concurrent chunks.
+
+Starts the alumni-migration stand-in (alumni_extraction.upload_stub) with
+``--row-ms`` of simulated database time per row, then uploads the range
+CSVs twice, each time to a fresh stub:
+
+  serial      one request per file, one after another (the admin page)
+  concurrent  chunks of ``--chunk-rows`` rows, ``--concurrency`` at a time,
+              with ``--fail-rate`` of the requests answered 429/503
+
+and prints rows per second, requests, retries and connections opened.
+Both runs must add every row exactly once.
+
+Usage:
+  python scripts/benchmarks/bench_upload.py [--row-ms 5] [--concurrency 8]
+      [--chunk-rows 50] [--fail-rate 0.05] [--files N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alumni_extraction.evaluation import range_csv_paths
+from alumni_extraction.upload_stub import StubState, serve
+from alumni_extraction.uploader import CHUNK_ROWS, read_chunks, upload
+from register_pages import REPO_ROOT
+
+
+def run(paths, row_s: float, chunk_rows: int, concurrency: int, fail_rate: float) -> dict:
+    state = StubState(row_s, fail_rate, seed=0)
+    server = serve(0, state)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        summary = upload(read_chunks(paths, chunk_rows), url, concurrency, retries=8)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return {'summary': summary, 'requests': state.requests, 'connections': state.connections,
+            'accounts': len(state.emails)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serial vs concurrent chunked upload throughput')
+    parser.add_argument('--row-ms', type=float, default=5.0, help='Simulated database time per row (default: 5)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Requests in flight (default: 8)')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help=f'Rows per chunk (default: {CHUNK_ROWS})')
+    parser.add_argument('--fail-rate', type=float, default=0.05,
+                        help='Share of concurrent requests answered 429/503 (default: 0.05)')
+    parser.add_argument('--files', type=int, help='Only the first N range CSVs')
+    args = parser.parse_args()
+
+    paths = range_csv_paths(REPO_ROOT)[:args.files]
+    runs = {
+        'serial': run(paths, args.row_ms / 1000, 0, 1, 0.0),
+        'concurrent': run(paths, args.row_ms / 1000, args.chunk_rows, args.concurrency, args.fail_rate),
+    }
+    rows = runs['serial']['summary'].rows
+    print(f"📊 {rows} rows from {len(paths)} file(s), {args.row_ms:g} ms/row")
+    print(f"   {'mode':<11} {'rows/s':>8} {'seconds':>8} {'requests':>9} {'retries':>8} {'conns':>6} {'added':>6}")
+    ok = True
+    for name, result in runs.items():
+        summary = result['summary']
+        print(f"   {name:<11} {summary.rows_per_s:>8.1f} {summary.seconds:>8.2f} {result['requests']:>9} "
+              f"{summary.retries:>8} {result['connections']:>6} {summary.processed:>6}")
+        ok = ok and not summary.given_up and summary.processed == result['accounts']
+    speedup = runs['serial']['summary'].seconds / runs['concurrent']['summary'].seconds
+    print(f"   speedup     {speedup:>8.1f}x")
+    sys.exit(0 if ok and runs['serial']['accounts'] == runs['concurrent']['accounts'] else 1)
+
+
+if __name__ == '__main__':
+    main()
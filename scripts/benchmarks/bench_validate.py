@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: the column validator vs normalizing one row at a time.
+
+Builds --count rows from the range CSVs (cycled, with fresh emails and
+registration numbers so the duplicate rules stay quiet) and damages
+--fault-rate of them: blank emails, years out of range, classes of 13,
+malformed registration numbers. Times ``validate.load_table`` plus
+``validate.validate`` against calling ``migration_rules.normalize_record``
+on every row, and checks both reject the same rows.
+
+Usage:
+  python scripts/benchmarks/bench_validate.py [--count 100000] [--fault-rate 0.02]
+"""
+
+import argparse
+import csv
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alumni_extraction.corpus import CANONICAL_COLUMNS, read_rows
+from alumni_extraction.evaluation import range_csv_paths
+from alumni_extraction.migration_rules import InvalidRecord, normalize_record
+from alumni_extraction.validate import load_table, validate
+from register_pages import REPO_ROOT
+
+FAULTS = (
+    ('Email', ''),
+    ('Year of Leaving', '1812'),
+    ('Year of Leaving', '20x5'),
+    ('Last Class', '13'),
+    ('Registration Number', 'BGHSA-25-001'),
+    ('First Name', ''),
+)
+
+
+def corpus_rows():
+    return [row for path in range_csv_paths(REPO_ROOT) for _, row in read_rows(path) if row['Year of Leaving']]
+
+
+def write_rows(path: Path, count: int, fault_rate: float, seed: int = 0):
+    rng = random.Random(seed)
+    base = corpus_rows()
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, CANONICAL_COLUMNS)
+        writer.writeheader()
+        for i in range(count):
+            row = dict(base[i % len(base)])
+            row['Email'] = f"alumni{i}@example.org"
+            row['Registration Number'] = f"BGHSA-2025-{i % 100000:05d}" if i < 100000 else ''
+            row['Batch Year'] = row['Year of Leaving']
+            if rng.random() < fault_rate:
+                field, value = rng.choice(FAULTS)
+                row[field] = value
+            writer.writerow(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Column validator throughput')
+    parser.add_argument('--count', type=int, default=100_000, help='Rows (default: 100000)')
+    parser.add_argument('--fault-rate', type=float, default=0.02, help='Share of damaged rows (default: 0.02)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'rows.csv'
+        write_rows(path, args.count, args.fault_rate)
+        validate(load_table([path]))     # numpy import
+
+        start = time.perf_counter()
+        table = load_table([path])
+        loaded = time.perf_counter()
+        violations = validate(table)
+        checked = time.perf_counter()
+        rejected = set(violations.rejected_rows().tolist())
+
+        scalar_rejected = set()
+        with open(path, newline='', encoding='utf-8') as f:
+            scalar_start = time.perf_counter()
+            for i, row in enumerate(csv.DictReader(f)):
+                try:
+                    normalize_record(row)
+                except InvalidRecord:
+                    scalar_rejected.add(i)
+            scalar_s = time.perf_counter() - scalar_start
+
+    print(f"📊 {len(table)} rows, {len(rejected)} rejected")
+    print(f"   {'load_table':<18} {(loaded - start) * 1000:>8.0f} ms")
+    print(f"   {'validate':<18} {(checked - loaded) * 1000:>8.0f} ms")
+    print(f"   {'normalize_record':<18} {scalar_s * 1000:>8.0f} ms (csv reading included)")
+    print(f"   {'disagreements':<18} {len(rejected ^ scalar_rejected):>8}")
+    sys.exit(1 if rejected != scalar_rejected else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Synthetic register pages built from the range CSVs (57-86.csv, ...).
+
+Each CSV is laid out the way the printed register is: entries below the
+page's midpoint in the left column, the rest in the right column, entry
+numbers and years in Bengali digits, ``ডাঃ`` for doctors and ``(প্রয়াত)``
+for deceased members. The text and word boxes are saved as replay
+recordings (see alumni_extraction.backends) so the benchmarks have a
+realistic, deterministic OCR workload without Tesseract, and
+bench_accuracy.py can score the parser on every range with known truth.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures' / 'ocr'
+
+BENGALI_DIGITS = str.maketrans('0123456789', '০১২৩৪৫৬৭৮৯')
+LEFT_X, RIGHT_X, FIRST_LINE_Y, LINE_HEIGHT, CHAR_WIDTH = 40, 820, 112, 46, 14
+
+
+def range_csvs(corpus_dir: Path = REPO_ROOT) -> List[Path]:
+    """Range CSVs in the corpus directory, in entry order"""
+    paths = [p for p in Path(corpus_dir).glob('*-*.csv') if p.stem.replace('-', '').isdigit()]
+    return sorted(paths, key=lambda p: int(p.stem.split('-')[0]))
+
+
+def load_rows(path: Path) -> List[Dict[str, str]]:
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def entry_text(row: Dict[str, str]) -> str:
+    """One register entry as printed, e.g. '৫৮. Amiya Kumar Sarkar (১৯৫১) (প্রয়াত)'"""
+    old = row.get('Old Registration Number', '').strip()
+    base, _, suffix = old.partition(' ')
+    parts = [f"{base.translate(BENGALI_DIGITS)}{' ' + suffix if suffix else ''}."]
+    if row.get('Title Prefix') == 'Dr.':
+        parts.append('ডাঃ')
+    parts.extend(n for n in (row.get('First Name'), row.get('Middle Name'), row.get('Last Name')) if n)
+    if row.get('Year of Leaving'):
+        parts.append(f"({row['Year of Leaving'].translate(BENGALI_DIGITS)})")
+    if row.get('Is Deceased', '').upper() == 'TRUE':
+        parts.append('(প্রয়াত)')
+    return unicodedata.normalize('NFC', ' '.join(parts))
+
+
+def render_page(rows: List[Dict[str, str]], entry_range: Tuple[int, int]) -> Tuple[str, List[list]]:
+    """Page text read across both columns, and word boxes [text, left, top, width, height, conf]"""
+    first, last = entry_range
+    midpoint = first + (last - first + 1) // 2
+    left, right = [], []
+    for row in rows:
+        number = row.get('Old Registration Number', '').split(' ')[0]
+        column = left if number.isdigit() and int(number) < midpoint else right
+        column.append(entry_text(row))
+
+    lines, words = [], []
+    for i in range(max(len(left), len(right))):
+        top = FIRST_LINE_Y + i * LINE_HEIGHT
+        segments = []
+        for x, column in ((LEFT_X, left), (RIGHT_X, right)):
+            if i >= len(column):
+                continue
+            segments.append(column[i])
+            for word in column[i].split(' '):
+                width = CHAR_WIDTH * len(word)
+                words.append([word, x, top, width, 30, 91.0])
+                x += width + 12
+        lines.append('    '.join(segments))
+    return '\n'.join(lines) + '\n', words
+
+
+def write_recording(output_dir: Path, image_name: str, image_bytes: bytes, text: str,
+                    words: List[list], source: str) -> Path:
+    """Save a replay recording, marked synthetic, for an image whose bytes are ``image_bytes``"""
+    recording = {
+        'image': image_name,
+        'sha256': hashlib.sha256(image_bytes).hexdigest(),
+        'source': source,
+        'synthetic': True,
+        'outputs': {'ben': {'6': {'text': text, 'words': words}}},
+    }
+    path = Path(output_dir) / f"{Path(image_name).stem}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(recording, f, ensure_ascii=False, indent=1)
+    return path
+
+
+def build_synthetic_pages(output_dir: Path, corpus_dir: Path = REPO_ROOT, limit: int = 0) -> List[str]:
+    """
+    Write a placeholder image file and a replay recording per range CSV.
+
+    The placeholder holds the page text, so each page has its own content
+    hash. Returns the image paths in entry order.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    images = []
+    for csv_path in range_csvs(corpus_dir)[:limit or None]:
+        first, last = (int(n) for n in csv_path.stem.split('-'))
+        text, words = render_page(load_rows(csv_path), (first, last))
+        image_path = Path(output_dir) / f"{csv_path.stem}.png"
+        image_bytes = text.encode('utf-8')
+        image_path.write_bytes(image_bytes)
+        write_recording(output_dir, image_path.name, image_bytes, text, words,
+                        source=f"rendered from {csv_path.name}")
+        images.append(str(image_path))
+    return images
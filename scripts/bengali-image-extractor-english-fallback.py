@@ -4,10 +4,6 @@ Bengali Image Text Extractor - English OCR Fallback
 Extracts text from images using English OCR when Bengali is not available
 """
 
-import cv2
-import pytesseract
-import pandas as pd
-import numpy as np
 import re
 import sys
 import os
@@ -16,6 +12,9 @@ import argparse
 
 def extract_text_from_image(image_path: str) -> str:
     """Extract text from image using OCR"""
+    import cv2
+    import pytesseract
+    
     try:
         # Load image
         image = cv2.imread(image_path)
@@ -112,6 +111,8 @@ def get_company_field(title_prefix: str, is_deceased: bool) -> str:
 
 def generate_csv(alumni_records: List[Dict[str, str]], output_path: str):
     """Generate CSV file from alumni records"""
+    import pandas as pd
+    
     if not alumni_records:
         print("⚠️ No alumni records found. Creating sample template...")
         # Create sample data
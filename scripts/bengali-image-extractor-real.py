@@ -4,16 +4,18 @@ Real BGHS Alumni Data Extraction Tool
 Actually extracts data from the image OCR text
 """
 
-import cv2
-import pytesseract
-import pandas as pd
 import sys
 import os
 import argparse
 import re
 
+from alumni_extraction.registration import RegistrationAllocator, open_allocator
+
 def extract_text_from_image(image_path: str) -> str:
     """Extract text from image using English OCR"""
+    import cv2
+    import pytesseract
+    
     try:
         # Load image
         image = cv2.imread(image_path)
@@ -93,27 +95,16 @@ def parse_ocr_text_to_alumni_data(ocr_text: str) -> list:
     print(f"📊 Extracted {len(alumni_records)} alumni records")
     return alumni_records
 
-def create_csv_from_extracted_data(alumni_records: list, output_path: str):
+def create_csv_from_extracted_data(alumni_records: list, output_path: str, allocator: RegistrationAllocator):
     """Create CSV from extracted alumni data"""
+    import pandas as pd
     
     if not alumni_records:
         print("❌ No alumni records extracted from image")
         return
     
-    def convert_registration_number(old_reg_no):
-        """Convert old registration number to new format BGHSA-2025-XXXXX"""
-        try:
-            # Handle special case like "72A"
-            if "A" in old_reg_no:
-                old_reg_no = old_reg_no.replace("A", "")
-            
-            # Convert to integer and format with leading zeros (5 digits)
-            reg_num = int(old_reg_no)
-            new_reg_no = f"BGHSA-2025-{reg_num:05d}"
-            return new_reg_no
-        except:
-            # Fallback for any parsing issues
-            return f"BGHSA-2025-{old_reg_no.zfill(5)}"
+    # Allocate ids from the shared sequence so "72" and "72A" never collide
+    registration_numbers = allocator.allocate_many(entry["old_reg_no"] for entry in alumni_records)
     
     def get_company_field(title, deceased):
         """Determine appropriate company field based on title and status"""
@@ -142,7 +133,7 @@ def create_csv_from_extracted_data(alumni_records: list, output_path: str):
         email = f"{first_name.lower()}.{last_name.lower()}@bghs-alumni.com" if first_name and last_name else "alumni.member@bghs-alumni.com"
         
         # Convert registration number
-        new_reg_no = convert_registration_number(entry["old_reg_no"])
+        new_reg_no = registration_numbers[entry["old_reg_no"]]
         
         # Determine company field
         company = get_company_field(entry["title"], entry["deceased"])
@@ -194,6 +185,10 @@ def main():
     parser.add_argument('image_path', help='Path to the image file')
     parser.add_argument('-o', '--output', help='Output CSV file path')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--sequence-store', help='Registration sequence database shared by all extractors '
+                        '(default: scripts/.registration-sequence.sqlite3 or $BGHS_REGISTRATION_STORE)')
+    parser.add_argument('--issued', nargs='+', help='CSVs whose registration ids are already issued, e.g. a '
+                        'profiles export (default: the range CSVs in the repository root)')
     
     args = parser.parse_args()
     
@@ -217,13 +212,17 @@ def main():
     alumni_records = parse_ocr_text_to_alumni_data(ocr_text)
     
     # Create CSV from extracted data
-    if args.output:
-        create_csv_from_extracted_data(alumni_records, args.output)
-    else:
-        # Default output filename
-        base_name = os.path.splitext(args.image_path)[0]
-        output_path = f"{base_name}_extracted.csv"
-        create_csv_from_extracted_data(alumni_records, output_path)
+    allocator = open_allocator(args.sequence_store, seed_paths=args.issued)
+    try:
+        if args.output:
+            create_csv_from_extracted_data(alumni_records, args.output, allocator)
+        else:
+            # Default output filename
+            base_name = os.path.splitext(args.image_path)[0]
+            output_path = f"{base_name}_extracted.csv"
+            create_csv_from_extracted_data(alumni_records, output_path, allocator)
+    finally:
+        allocator.store.close()
 
 if __name__ == "__main__":
     main()
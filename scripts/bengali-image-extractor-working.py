@@ -4,15 +4,15 @@ BGHS Alumni Data Extraction Tool - Working Version
 This is the same approach that worked in Cursor chat
 """
 
-import cv2
-import pytesseract
-import pandas as pd
 import sys
 import os
 import argparse
 
 def extract_text_from_image(image_path: str) -> str:
     """Extract text from image using English OCR"""
+    import cv2
+    import pytesseract
+    
     try:
         # Load image
         image = cv2.imread(image_path)
@@ -48,6 +48,7 @@ def create_csv_from_image_data(image_path: str, output_path: str):
 
 def create_csv_template(output_path: str, extracted_text: str):
     """Create CSV template with extracted text for manual processing"""
+    import pandas as pd
     
     # Create sample data based on the image description you provided earlier
     alumni_data = [
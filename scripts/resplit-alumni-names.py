@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Re-split First/Middle/Last Name in alumni CSV files.
+
+Rejoins each row's name and splits it again so that compound surnames
+("Ghosh Dastidar", "Barman Roy", "De Sarkar") end up in Last Name instead
+of being split across Middle Name and Last Name. The surname trie is
+seeded with the built-in list and with every multi-word Last Name in the
+curated range CSVs, and a multi-word Last Name is never shortened.
+
+Usage:
+  python resplit-alumni-names.py 1-56.csv 57-86.csv --dry-run
+  python resplit-alumni-names.py *.csv --in-place
+  python resplit-alumni-names.py extracted.csv -o fixed.csv
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from glob import glob
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from alumni_extraction.evaluation import range_csv_paths
+from alumni_extraction.merge import REPO_ROOT
+from alumni_extraction.names import (COMPOUND_SURNAMES, SurnameTrie, curated_surnames, load_surnames,
+                                     split_name_tokens)
+
+NAME_COLUMNS = ('First Name', 'Middle Name', 'Last Name')
+
+
+def resplit_rows(rows, surnames: SurnameTrie):
+    """Yield (row, changed) with the name columns re-split"""
+    for row in rows:
+        tokens = ' '.join(row.get(col) or '' for col in NAME_COLUMNS).split()
+        first, middle, last = split_name_tokens(tokens, surnames)
+        recorded = (row.get('Last Name') or '').split()
+        cut = len(tokens) - len(recorded)
+        if len(recorded) > len(last.split()) and cut >= 1 and tokens[cut:] == recorded:
+            # The row already spells a longer surname: keep it whole
+            first, middle, last = tokens[0], ' '.join(tokens[1:cut]), ' '.join(recorded)
+        changed = (first, middle, last) != tuple((row.get(col) or '').strip() for col in NAME_COLUMNS)
+        if changed:
+            row = dict(row)
+            row['First Name'], row['Middle Name'], row['Last Name'] = first, middle, last
+        yield row, changed
+
+
+def resplit_file(input_path: str, output_path: str, surnames: SurnameTrie, dry_run: bool = False) -> tuple:
+    """Re-split one CSV file; returns (rows, changed rows)"""
+    with open(input_path, newline='', encoding='utf-8') as src:
+        reader = csv.DictReader(src)
+        fieldnames = reader.fieldnames or []
+        if not all(col in fieldnames for col in NAME_COLUMNS):
+            print(f"⚠️ Skipping {input_path}: no First/Middle/Last Name columns")
+            return 0, 0
+
+        total = changed = 0
+        out = None
+        writer = None
+        if not dry_run:
+            tmp_path = f"{output_path}.tmp"
+            out = open(tmp_path, 'w', newline='', encoding='utf-8')
+            writer = csv.DictWriter(out, fieldnames=fieldnames)
+            writer.writeheader()
+        try:
+            for row, row_changed in resplit_rows(reader, surnames):
+                total += 1
+                if row_changed:
+                    changed += 1
+                    if dry_run:
+                        print(f"   {input_path}: {row['First Name']} | {row['Middle Name']} | {row['Last Name']}")
+                if writer:
+                    writer.writerow(row)
+        finally:
+            if out:
+                out.close()
+
+    if not dry_run:
+        os.replace(tmp_path, output_path)
+    return total, changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-split alumni names so compound surnames stay together')
+    parser.add_argument('csv_files', nargs='+', help='CSV files to process (supports wildcards)')
+    parser.add_argument('-o', '--output', help='Output CSV file (single input only)')
+    parser.add_argument('--in-place', action='store_true', help='Rewrite the input files')
+    parser.add_argument('--dry-run', action='store_true', help='Only show the rows that would change')
+    parser.add_argument('--surnames', help='Extra compound surnames, one per line')
+    parser.add_argument('--curated', nargs='*', help='CSVs whose multi-word Last Names are taken as compound '
+                        'surnames (default: the range CSVs in the repository root)')
+    args = parser.parse_args()
+
+    files = []
+    for pattern in args.csv_files:
+        files.extend(sorted(glob(pattern)) if any(c in pattern for c in '*?') else [pattern])
+
+    if args.output and len(files) != 1:
+        print("❌ Error: --output can only be used with a single input file")
+        sys.exit(1)
+    if not (args.output or args.in_place or args.dry_run):
+        print("❌ Error: choose --output, --in-place or --dry-run")
+        sys.exit(1)
+
+    curated = args.curated if args.curated is not None else range_csv_paths(REPO_ROOT)
+    surnames = SurnameTrie([*COMPOUND_SURNAMES, *curated_surnames(curated)])
+    if args.surnames:
+        for surname in load_surnames(args.surnames):
+            surnames.add(surname)
+
+    start = time.perf_counter()
+    total_rows = total_changed = 0
+    for path in files:
+        if not os.path.exists(path):
+            print(f"⚠️ Warning: File not found: {path}")
+            continue
+        output_path = args.output or path
+        rows, changed = resplit_file(path, output_path, surnames, dry_run=args.dry_run)
+        total_rows += rows
+        total_changed += changed
+    elapsed = time.perf_counter() - start
+
+    rate = total_rows / elapsed if elapsed > 0 else 0
+    print(f"\n✅ {total_changed} of {total_rows} rows re-split across {len(files)} file(s)")
+    print(f"⏱️ {elapsed:.2f}s ({rate:,.0f} rows/s)")
+    if args.dry_run:
+        print("💡 Dry run: no files were written")
+
+
+if __name__ == "__main__":
+    main()